@@ -0,0 +1,112 @@
+"""
+Benchmark: HTML extraction backends in content_fetcher.
+
+Usage:
+    python -m src.benchmarks.bench_content_extraction [--corpus DIR] [--repeat 5]
+    python -m src.benchmarks.bench_content_extraction --corpus DIR --fetch URL [URL ...]
+
+The corpus is a directory of saved pages. Files named wechat_*.html are run
+through the WeChat extractor, everything else through the generic one.
+--fetch downloads the given URLs into the corpus first. Without a corpus,
+synthetic WeChat-sized pages are generated.
+
+For every backend the script reports pages/s and how many pages produce
+exactly the same (title, text) as the legacy html.parser extractor.
+"""
+import argparse
+import hashlib
+import time
+from pathlib import Path
+
+from src.ingestion import content_fetcher
+from src.ingestion.http_client import http_get
+
+
+def synthetic_corpus(n: int = 20) -> dict[str, str]:
+    filler = "".join(
+        f'<div class="rich_media_meta"><a href="/s/{i}">相关阅读 {i}</a></div>' for i in range(300)
+    )
+    paragraphs = "".join(
+        f"<p>第{i}段：光伏组件价格持续波动，硅料、硅片环节库存上升，储能需求保持增长。</p>" for i in range(200)
+    )
+    pages = {}
+    for i in range(n):
+        pages[f"wechat_{i}.html"] = (
+            "<html><head><title>微信公众平台</title><style>p{color:red}</style>"
+            "<script>var x = 1;</script></head><body>"
+            f"{filler}<h1 id=\"activity-name\">储能周报 {i}</h1>"
+            f"<div id=\"js_content\">{paragraphs}<script>track()</script></div>"
+            f"{filler}</body></html>"
+        )
+        pages[f"web_{i}.html"] = (
+            f"<html><head><title>Solar news {i}</title></head><body><nav>{filler}</nav>"
+            f"<article><header>Header</header>{paragraphs}</article><footer>{filler}</footer></body></html>"
+        )
+    return pages
+
+
+def load_corpus(corpus: Path) -> dict[str, str]:
+    return {
+        path.name: path.read_text(encoding="utf-8", errors="replace")
+        for path in sorted(corpus.glob("*.html"))
+    }
+
+
+def fetch_into_corpus(corpus: Path, urls: list[str]) -> None:
+    corpus.mkdir(parents=True, exist_ok=True)
+    for url in urls:
+        resp = http_get(url)
+        resp.encoding = resp.apparent_encoding or "utf-8"
+        prefix = "wechat" if "mp.weixin.qq.com" in url else "web"
+        name = f"{prefix}_{hashlib.sha1(url.encode()).hexdigest()[:10]}.html"
+        (corpus / name).write_text(resp.text, encoding="utf-8")
+        print(f"saved {url} -> {name}")
+
+
+def extract(name: str, html: str, backend: str, readability: bool = False) -> tuple[str, str]:
+    if name.startswith("wechat_"):
+        return content_fetcher._extract_wechat_content(html, backend=backend)
+    return content_fetcher._extract_generic_content(html, backend=backend, readability=readability)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", type=Path, default=None)
+    parser.add_argument("--fetch", nargs="+", default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.fetch:
+        if not args.corpus:
+            parser.error("--fetch requires --corpus")
+        fetch_into_corpus(args.corpus, args.fetch)
+
+    pages = load_corpus(args.corpus) if args.corpus else {}
+    if not pages:
+        print("No corpus given (or empty), using synthetic pages.")
+        pages = synthetic_corpus()
+
+    total_mb = sum(len(h.encode("utf-8")) for h in pages.values()) / 1e6
+    print(f"{len(pages)} pages, {total_mb:.1f} MB, repeat={args.repeat}")
+
+    baseline = {name: extract(name, html, "legacy") for name, html in pages.items()}
+
+    backends = [b for b in content_fetcher.BACKENDS if b == "legacy" or content_fetcher.HAS_LXML]
+    runs = [(b, False) for b in backends] + [("lxml" if content_fetcher.HAS_LXML else "legacy", True)]
+
+    print(f"{'backend':<24} {'pages/s':>9} {'speedup':>8} {'identical':>10}")
+    legacy_rate = None
+    for backend, readability in runs:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            outputs = {name: extract(name, html, backend, readability) for name, html in pages.items()}
+        rate = len(pages) * args.repeat / (time.perf_counter() - start)
+        legacy_rate = legacy_rate or rate
+
+        identical = sum(outputs[name] == baseline[name] for name in pages)
+        label = backend + (" +readability" if readability else "")
+        print(f"{label:<24} {rate:>9.1f} {rate / legacy_rate:>7.1f}x {identical:>5}/{len(pages)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark: keyword loops vs. the compiled KeywordMatcher for
+region_classifier.classify_region and insights_core.detect_industry.
+
+Usage:
+    python -m src.benchmarks.bench_keyword_matcher [--headlines 10000] [--repeat 3]
+
+The headlines are synthetic English / Chinese mixes with a link each; some
+contain region or industry keywords, most do not. Reported per function:
+the per-keyword loops (the previous first-match functions, and keyword
+counting for the scores), the compiled matcher called once per headline,
+and the batch API over the whole list (best of --repeat runs). All three
+must give the same results.
+"""
+import argparse
+import os
+import random
+import re
+import time
+
+# The AI client is only built on first use, any key will do
+os.environ.setdefault("DEEPSEEK_API_KEY", "sk-benchmark")
+
+from src.ingestion import region_classifier
+from src.modules import insights_core
+
+WORDS = ("solar", "module", "prices", "storage", "grid", "project", "Lagos", "China", "Europe", "tariff",
+         "inverter", "battery", "BESS", "policy", "demand", "utility", "capacity", "export", "microgrid",
+         "光伏", "组件", "储能", "电价", "海外", "市场", "项目", "政策", "需求", "价格", "尼日利亚")
+FILLER = ("market", "update", "weekly", "report", "record", "quarter", "deal", "signs", "plans", "new",
+          "行业", "公司", "发布", "报告", "季度")
+LINKS = ("https://www.reuters.com/a", "https://nairametrics.com/b", "https://36kr.com/c",
+         "https://www.pv-magazine.com/d", "https://punchng.com/e", "https://example.org/f")
+
+
+# ------------------------------------------------------------
+# Previous implementations (per-keyword loops), as the baseline
+# ------------------------------------------------------------
+def legacy_classify_region(title: str, summary: str, link: str) -> str:
+    text = f"{title} {summary}".lower()
+    for domain in region_classifier.CHINA_DOMAINS:
+        if domain in link.lower():
+            return "china"
+    for domain in region_classifier.NIGERIA_DOMAINS:
+        if domain in link.lower():
+            return "nigeria"
+    for kw in region_classifier.CHINA_KEYWORDS:
+        if kw.lower() in text:
+            return "china"
+    for kw in region_classifier.NIGERIA_KEYWORDS:
+        if kw.lower() in text:
+            return "nigeria"
+    if re.search(r"[\u4e00-\u9fff]", text):
+        return "china"
+    return "global"
+
+
+def legacy_detect_industry(text: str) -> str:
+    t = text.lower()
+    if any(k in t for k in ["硅料", "硅片", "组件", "光伏", "n型", "p型", "电池片"]):
+        return "pv"
+    if any(k in t for k in ["储能", "bess", "电池", "并网", "系统集成"]):
+        return "bess"
+    if any(k in t for k in ["逆变器", "inverter", "mppt", "效率"]):
+        return "inverter"
+    if any(k in t for k in ["电价", "tariff", "nerc", "ferc", "电力市场"]):
+        return "power"
+    if any(k in t for k in ["europe", "us", "germany", "uk", "海外", "出口"]):
+        return "overseas"
+    return "general"
+
+
+def legacy_region_scores(title: str, summary: str, link: str) -> dict[str, int]:
+    text, link = f"{title} {summary}".lower(), link.lower()
+    tables = {
+        "china": (region_classifier.CHINA_DOMAINS, region_classifier.CHINA_KEYWORDS),
+        "nigeria": (region_classifier.NIGERIA_DOMAINS, region_classifier.NIGERIA_KEYWORDS),
+    }
+    return {
+        region: sum(link.count(d) for d in domains) * region_classifier.DOMAIN_WEIGHT
+        + sum(text.count(kw.lower()) for kw in keywords)
+        for region, (domains, keywords) in tables.items()
+    }
+
+
+def legacy_industry_scores(text: str) -> dict[str, int]:
+    t = text.lower()
+    return {industry: sum(t.count(k) for k in keywords)
+            for industry, keywords in insights_core.INDUSTRY_KEYWORDS.items()}
+
+
+def make_articles(n: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    articles = []
+    for _ in range(n):
+        words = [rng.choice(FILLER) for _ in range(rng.randint(6, 14))]
+        for _ in range(rng.randint(0, 2)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(WORDS))
+        articles.append({
+            "title": " ".join(words),
+            "summary": "",
+            "link": rng.choice(LINKS),
+        })
+    return articles
+
+
+def best_of(repeat: int, fn) -> tuple[float, object]:
+    elapsed, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return elapsed * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--headlines", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    articles = make_articles(args.headlines)
+    titles = [a["title"] for a in articles]
+    cases = {
+        "classify_region": (
+            lambda: [legacy_classify_region(a["title"], a["summary"], a["link"]) for a in articles],
+            lambda: [region_classifier.classify_region(a["title"], a["summary"], a["link"]) for a in articles],
+            lambda: region_classifier.classify_regions(articles),
+        ),
+        "detect_industry": (
+            lambda: [legacy_detect_industry(t) for t in titles],
+            lambda: [insights_core.detect_industry(t) for t in titles],
+            lambda: insights_core.detect_industries(titles),
+        ),
+        "region_scores": (
+            lambda: [legacy_region_scores(a["title"], a["summary"], a["link"]) for a in articles],
+            lambda: [region_classifier.region_scores(a["title"], a["summary"], a["link"]) for a in articles],
+            lambda: region_classifier.region_scores_many(articles),
+        ),
+        "industry_scores": (
+            lambda: [legacy_industry_scores(t) for t in titles],
+            lambda: [insights_core.industry_scores(t) for t in titles],
+            lambda: insights_core.industry_scores_many(titles),
+        ),
+    }
+
+    print(f"{args.headlines} headlines, best of {args.repeat}")
+    print(f"{'function':>16} {'loops ms':>9} {'compiled ms':>12} {'batch ms':>9} {'speedup':>8}")
+    for name, (legacy, compiled, batch) in cases.items():
+        legacy_ms, expected = best_of(args.repeat, legacy)
+        compiled_ms, per_call = best_of(args.repeat, compiled)
+        batch_ms, batched = best_of(args.repeat, batch)
+        assert per_call == expected and batched == expected, f"{name}: results differ from the loops"
+        print(f"{name:>16} {legacy_ms:>9.1f} {compiled_ms:>12.1f} {batch_ms:>9.1f} {legacy_ms / batch_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
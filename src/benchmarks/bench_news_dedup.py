@@ -0,0 +1,99 @@
+"""
+Benchmark: exact-title de-duplication vs. near-duplicate clustering
+(news_dedup.cluster_news) on a synthetic day of fetched news.
+
+Usage:
+    python -m src.benchmarks.bench_news_dedup [--stories 300] [--copies 5] [--edits 2] [--repeat 3]
+
+Every story is reported --copies times (randomly 1..copies): with a
+different " - Publisher" suffix, up to --edits words of the summary
+replaced and sometimes a reworded headline. Reported per method: items left
+(each one an LLM summary request), how many of them are extra copies of a
+story, how many distinct stories were wrongly merged, and the best time
+of --repeat runs.
+"""
+import argparse
+import random
+import time
+
+from src.ingestion.news_dedup import cluster_news
+
+WORDS = tuple((
+    "solar module prices polysilicon wafer cell inverter battery storage lithium grid tariff export import "
+    "capacity installation demand supply factory output utility project microgrid nigeria china europe "
+    "india policy subsidy auction quarter record drop rise margin shipment contract tender minister "
+    "investment fund manufacturer developer offgrid mini rural power plant transmission kwh gigawatt"
+).split())
+# Filler vocabulary, so that unrelated stories share about as many words as real ones do
+FILLER = tuple(f"{a}{b}{c}" for a in "bdfgklmnprstv" for b in "aeiou" for c in ("n", "r", "s", "l", "ck", "nd"))
+PUBLISHERS = ("Reuters", "Bloomberg", "PV Magazine", "Energy News", "BusinessDay", "Punch", "Xinhua",
+              "SCMP", "PV Tech", "Renewables Now")
+
+
+def make_day(stories: int, copies: int, edits: int, seed: int = 0) -> tuple[list[dict], list[int]]:
+    """Fetched items and the story each one belongs to."""
+    rng = random.Random(seed)
+    items, labels = [], []
+    for story in range(stories):
+        headline = [w.capitalize() if i == 0 else w for i, w in enumerate(rng.sample(WORDS, rng.randint(6, 11)))]
+        summary = [rng.choice(WORDS + FILLER) for _ in range(rng.randint(40, 90))]
+        for copy in range(rng.randint(1, copies)):
+            title = list(headline)
+            if copy and rng.random() < 0.3:
+                title[rng.randrange(1, len(title))] = rng.choice(WORDS)
+            text = list(summary)
+            for _ in range(rng.randint(0, edits) if copy else 0):
+                text[rng.randrange(len(text))] = rng.choice(WORDS + FILLER)
+            publisher = rng.choice(PUBLISHERS)
+            items.append({
+                "title": f"{' '.join(title)} - {publisher}",
+                "link": f"https://news.example.com/{story}/{copy}",
+                "summary": f"<a href=\"#\">{' '.join(text)}</a>&nbsp;<font>{publisher}</font>",
+                "pub_date": "2026-01-01",
+            })
+            labels.append(story)
+    order = list(range(len(items)))
+    rng.shuffle(order)
+    return [items[i] for i in order], [labels[i] for i in order]
+
+
+def score(kept: list[dict], label_of: dict[str, int]) -> tuple[int, int]:
+    """(extra copies left, stories merged into another story's cluster)"""
+    seen, merged = set(), 0
+    for item in kept:
+        members = {label_of[item["link"]]} | {label_of[x["link"]] for x in item.get("also_reported_by", [])}
+        merged += len(members) - 1
+        seen.add(label_of[item["link"]])
+    return len(kept) - len(seen), merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stories", type=int, default=300)
+    parser.add_argument("--copies", type=int, default=5)
+    parser.add_argument("--edits", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    items, labels = make_day(args.stories, args.copies, args.edits)
+    label_of = {item["link"]: label for item, label in zip(items, labels)}
+    print(f"{len(items)} fetched items, {args.stories} stories")
+    print(f"{'method':>14} {'items':>6} {'copies left':>12} {'wrong merges':>13} {'ms':>8}")
+
+    methods = (
+        ("exact title", lambda: list({item["title"]: item for item in items}.values())),
+        ("title only", lambda: cluster_news(items, near_duplicates=False)),
+        ("title+minhash", lambda: cluster_news(items)),
+    )
+    for name, fn in methods:
+        elapsed = float("inf")
+        for _ in range(args.repeat):  # best of: leaves out the first numpy import
+            start = time.perf_counter()
+            kept = fn()
+            elapsed = min(elapsed, (time.perf_counter() - start) * 1000)
+        copies_left, merged = score(kept, label_of)
+        print(f"{name:>14} {len(kept):>6} {copies_left:>12} {merged:>13} {elapsed:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark: price history as a rewritten CSV vs. the (item, date) keyed store.
+
+Usage:
+    python -m src.benchmarks.bench_price_history [--years 10] [--items 500] [--repeat 5]
+
+A synthetic history of years x items daily prices is written as the legacy
+CSV, imported into a PriceHistoryStore, and then both are timed on:
+  - one daily update (items new rows)
+  - "item X, last 90 days"
+  - "all items, last 365 days" (what the chart needs)
+"""
+import argparse
+import csv
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+from src.ingestion.price_history_store import PriceHistoryStore
+
+
+def write_history_csv(path: Path, years: int, items: int) -> tuple[list[str], date]:
+    names = [f"item_{i:03d}" for i in range(items)]
+    end = date.today() - timedelta(days=1)
+    start = end - timedelta(days=365 * years)
+    rng = random.Random(0)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["item", "date", "price"])
+        day = start
+        while day <= end:
+            iso = day.isoformat()
+            writer.writerows((name, iso, f"{rng.uniform(1, 1000):.2f}") for name in names)
+            day += timedelta(days=1)
+    return names, end
+
+
+def legacy_save(df_new: pd.DataFrame, history_file: Path) -> None:
+    # The previous save_price_history: read, concat, parse, sort, dedup, rewrite
+    df_old = pd.read_csv(history_file)
+    df_all = pd.concat([df_old, df_new], ignore_index=True)
+    df_all["date"] = pd.to_datetime(df_all["date"], errors="coerce")
+    df_all = df_all.dropna(subset=["date"])
+    df_all = df_all.sort_values(by="date")
+    df_all = df_all.drop_duplicates(subset=["item", "date"], keep="last")
+    df_all.to_csv(history_file, index=False)
+
+
+def legacy_series(history_file: Path, item: str, start: date):
+    df = pd.read_csv(history_file)
+    df["date"] = pd.to_datetime(df["date"])
+    sub = df[(df["item"] == item) & (df["date"] >= pd.Timestamp(start))]
+    return sub["date"].to_numpy(), sub["price"].to_numpy()
+
+
+def legacy_range(history_file: Path, start: date):
+    df = pd.read_csv(history_file)
+    df["date"] = pd.to_datetime(df["date"])
+    df = df[df["date"] >= pd.Timestamp(start)]
+    return {item: (sub["date"].to_numpy(), sub["price"].to_numpy()) for item, sub in df.groupby("item")}
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "price_history.csv"
+
+        start = time.perf_counter()
+        names, last_day = write_history_csv(csv_path, args.years, args.items)
+        size_mb = csv_path.stat().st_size / 1e6
+        print(f"history: {args.years} years x {args.items} items, {size_mb:.1f} MB CSV "
+              f"(generated in {time.perf_counter() - start:.1f}s)")
+
+        start = time.perf_counter()
+        store = PriceHistoryStore(Path(tmp) / "price_history.sqlite3", legacy_csv=csv_path)
+        print(f"migration: {store.count()} rows in {time.perf_counter() - start:.1f}s")
+
+        item = names[len(names) // 2]
+        since_90 = last_day - timedelta(days=89)
+        since_365 = last_day - timedelta(days=364)
+
+        # Every repeat writes a new day so both sides actually grow
+        days = iter(range(1, 1000))
+
+        def new_rows():
+            day = (last_day + timedelta(days=next(days))).isoformat()
+            return [{"item": n, "date": day, "price": "123.45"} for n in names]
+
+        legacy_csv = Path(tmp) / "legacy.csv"
+        legacy_csv.write_bytes(csv_path.read_bytes())
+
+        results = [
+            ("daily update", timed(lambda: legacy_save(pd.DataFrame(new_rows()), legacy_csv), args.repeat),
+             timed(lambda: store.upsert(new_rows()), args.repeat)),
+            ("1 item, 90 days", timed(lambda: legacy_series(legacy_csv, item, since_90), args.repeat),
+             timed(lambda: store.get_series(item, since_90), args.repeat)),
+            ("all items, 365 days", timed(lambda: legacy_range(legacy_csv, since_365), args.repeat),
+             timed(lambda: store.get_range(since_365), args.repeat)),
+        ]
+
+        dates, values = store.get_series(item, since_90, last_day)
+        print(f"get_series -> {dates.dtype}[{len(dates)}], {values.dtype}[{len(values)}]")
+
+        print(f"{'operation':<22} {'CSV':>10} {'store':>10} {'speedup':>9}")
+        for label, legacy_t, store_t in results:
+            print(f"{label:<22} {legacy_t * 1000:>8.1f}ms {store_t * 1000:>8.1f}ms {legacy_t / store_t:>8.1f}x")
+
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
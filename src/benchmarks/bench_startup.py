@@ -0,0 +1,111 @@
+"""
+Benchmark: cold-start import time of each entry point.
+
+Usage:
+    python -m src.benchmarks.bench_startup [--repeat 3] [--top 8] [--modules MOD ...]
+    python -m src.benchmarks.bench_startup --history startup_history.jsonl
+
+Every entry point is imported in a fresh interpreter with `python -X importtime`.
+Reported per entry point: wall time of the process, the import time of the
+module itself (best of --repeat) and the packages that cost the most
+(self time summed per top-level package).
+--history appends one JSON line per run, so startup can be tracked over time.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[2]
+
+ENTRY_POINTS = [
+    "src.system.main",
+    "src.ingestion.wechat_link_reader",
+    "src.ingestion.url_queue_cleanup",
+    "src.ingestion.external_news_pipeline",
+    "src.ingestion.fetcher",
+    "src.modules.insights_core",
+]
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """
+    -X importtime lines: "import time: <self us> | <cumulative us> | <indented name>"
+    :return: [(module, self_us, cumulative_us)]
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        parts = line.split(":", 1)[1].split("|", 2)
+        try:
+            rows.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+        except (IndexError, ValueError):
+            continue
+    return rows
+
+
+def measure(module: str) -> dict:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root, capture_output=True, text=True
+    )
+    wall = time.perf_counter() - start
+
+    rows = parse_importtime(proc.stderr)
+    by_package = defaultdict(int)
+    for name, self_us, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+
+    module_us = next((cum for name, _, cum in rows if name == module), None)
+    error = None
+    if proc.returncode != 0:
+        error = (proc.stderr.strip().splitlines() or ["unknown error"])[-1]
+
+    return {
+        "module": module,
+        "wall_s": round(wall, 3),
+        "import_s": round(module_us / 1e6, 3) if module_us is not None else None,
+        "packages": dict(by_package),
+        "error": error,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", nargs="+", default=ENTRY_POINTS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--history", type=Path, default=None)
+    args = parser.parse_args()
+
+    results = []
+    for module in args.modules:
+        runs = [measure(module) for _ in range(args.repeat)]
+        best = min(runs, key=lambda r: r["wall_s"])
+        results.append(best)
+
+        imported = f"{best['import_s']:.3f}s" if best["import_s"] is not None else "n/a"
+        print(f"{module:<40} wall {best['wall_s']:.3f}s   import {imported}")
+        if best["error"]:
+            print(f"    FAILED: {best['error']}")
+        top = sorted(best["packages"].items(), key=lambda kv: kv[1], reverse=True)[:args.top]
+        print("    " + ", ".join(f"{pkg} {us / 1000:.0f}ms" for pkg, us in top))
+
+    if args.history:
+        with open(args.history, "a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "python": sys.version.split()[0],
+                "results": [{k: r[k] for k in ("module", "wall_s", "import_s", "error")} for r in results],
+            }) + "\n")
+        print(f"Appended to {args.history}")
+
+
+if __name__ == "__main__":
+    main()
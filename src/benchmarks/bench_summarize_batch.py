@@ -0,0 +1,138 @@
+"""
+Benchmark: one article per request vs. batched summarization against a
+local fake OpenAI-compatible server.
+
+Usage:
+    python -m src.benchmarks.bench_summarize_batch [--articles 60] [--latency 0.3]
+        [--per-article 0.05] [--corrupt 0.05] [--concurrency 4]
+
+The fake server answers single-article prompts with one summary and batch
+prompts with a JSON array keyed by the requested ids. Each request takes
+latency + per-article seconds (output generation), a --corrupt fraction of
+batch elements comes back without required fields (exercising the
+single-article fallback), and answers longer than max_tokens are cut off.
+Reported per mode: requests sent, estimated prompt tokens and wall time.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+# The fake server ignores the API key, any value will do
+os.environ.setdefault("DEEPSEEK_API_KEY", "sk-benchmark")
+
+from src.benchmarks.bench_summarize_concurrency import FAKE_SUMMARY, FakeServer
+from src.modules import insights_core
+
+BATCH_MARKER = 'ARTICLES (JSON array; every article has an "id"):'
+
+
+def make_handler(latency: float, per_article: float, corrupt: float, counters: dict):
+    rng = random.Random(0)
+    lock = threading.Lock()
+
+    class FakeBatchHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            prompt = request["messages"][0]["content"]
+            with lock:
+                counters["requests"] += 1
+                counters["prompt_tokens"] += insights_core.estimate_tokens(prompt)
+
+            finish_reason = "stop"
+            if BATCH_MARKER in prompt:
+                articles = json.JSONDecoder().raw_decode(prompt, prompt.index("[", prompt.index(BATCH_MARKER)))[0]
+                elements = []
+                for article in articles:
+                    element = {**FAKE_SUMMARY, "id": article["id"], "link": article["link"]}
+                    with lock:
+                        if rng.random() < corrupt:
+                            del element["region"]
+                    elements.append(element)
+                content = json.dumps(elements, ensure_ascii=False)
+                n = len(articles)
+                # ~BATCH_OUTPUT_TOKENS_PER_ARTICLE tokens per element
+                limit = request.get("max_tokens")
+                if limit and n * insights_core.BATCH_OUTPUT_TOKENS_PER_ARTICLE > limit:
+                    keep = max(1, limit // insights_core.BATCH_OUTPUT_TOKENS_PER_ARTICLE)
+                    content = content[:len(json.dumps(elements[:keep])) + 20]
+                    finish_reason = "length"
+            else:
+                content, n = json.dumps(FAKE_SUMMARY), 1
+
+            time.sleep(latency + per_article * n)
+            body = json.dumps({
+                "id": "chatcmpl-bench",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": "deepseek-chat",
+                "choices": [{
+                    "index": 0,
+                    "finish_reason": finish_reason,
+                    "message": {"role": "assistant", "content": content}
+                }],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+            }).encode("utf-8")
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return FakeBatchHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--per-article", type=float, default=0.05)
+    parser.add_argument("--corrupt", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    counters = {"requests": 0, "prompt_tokens": 0}
+    server = FakeServer(("127.0.0.1", 0), make_handler(args.latency, args.per_article, args.corrupt, counters))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    insights_core.DEEPSEEK_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}"
+    # Measure the API round-trips, not the persistent LLM cache (and keep fake answers out of it)
+    insights_core.get_llm_cache = lambda: None
+
+    rng = random.Random(1)
+    articles = [
+        {
+            "summary": f"Article {i}: " + " ".join(rng.choice(["solar", "module", "prices", "storage", "grid"])
+                                                   for _ in range(rng.randint(40, 160))),
+            "source": "Bench", "link": f"https://example.com/{i}", "pub_date": "2026-01-01"
+        }
+        for i in range(args.articles)
+    ]
+
+    print(f"{args.articles} articles, {args.latency:.2f}s + {args.per_article:.2f}s/article per request, "
+          f"{args.corrupt:.0%} corrupt batch elements, concurrency {args.concurrency}")
+    print(f"{'mode':>8} {'requests':>9} {'prompt tokens':>14} {'wall (s)':>9}")
+    for batch in (False, True):
+        counters.update(requests=0, prompt_tokens=0)
+        start = time.perf_counter()
+        results = asyncio.run(insights_core.asummarize_articles(
+            articles, max_concurrency=args.concurrency, timeout=30, batch=batch
+        ))
+        elapsed = time.perf_counter() - start
+        assert len(results) == len(articles) and all(results)
+        print(f"{'batch' if batch else 'single':>8} {counters['requests']:>9} "
+              f"{counters['prompt_tokens']:>14} {elapsed:>9.2f}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
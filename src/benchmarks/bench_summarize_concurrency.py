@@ -0,0 +1,114 @@
+"""
+Benchmark: concurrent article summarization against a local fake
+OpenAI-compatible server.
+
+Usage:
+    python -m src.benchmarks.bench_summarize_concurrency [--articles 60] [--latency 0.3]
+
+The fake server sleeps `latency` seconds per request to imitate a DeepSeek
+round-trip, then returns a valid summarize_article JSON payload.
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# The fake server ignores the API key, any value will do
+os.environ.setdefault("DEEPSEEK_API_KEY", "sk-benchmark")
+
+from openai import OpenAI
+
+from src.modules import insights_core
+
+
+FAKE_SUMMARY = {
+    "title": "Benchmark article",
+    "source": "Benchmark",
+    "link": "https://example.com",
+    "pub_date": "2026-01-01",
+    "region": "global",
+    "cn_summary": "测试",
+    "en_summary": "Test",
+    "cn_insights": [],
+    "en_insights": [],
+    "supply_chain": "",
+    "nigeria_impact": "",
+    "recommendation": ""
+}
+
+
+def make_handler(latency: float):
+    class FakeChatHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            self.rfile.read(length)
+            time.sleep(latency)
+
+            body = json.dumps({
+                "id": "chatcmpl-bench",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": "deepseek-chat",
+                "choices": [{
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": json.dumps(FAKE_SUMMARY)}
+                }],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+            }).encode("utf-8")
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return FakeChatHandler
+
+
+class FakeServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+
+    server = FakeServer(("127.0.0.1", 0), make_handler(args.latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    insights_core.client = OpenAI(api_key="sk-benchmark", base_url=base_url, timeout=30)
+    # Measure the API round-trips, not the persistent LLM cache (and keep fake answers out of it)
+    insights_core.get_llm_cache = lambda: None
+
+    articles = [
+        {"summary": f"Article {i} body", "source": "Bench", "link": f"https://example.com/{i}", "pub_date": "2026-01-01"}
+        for i in range(args.articles)
+    ]
+
+    print(f"{args.articles} articles, {args.latency:.2f}s simulated latency per request")
+    print(f"{'workers':>8} {'wall (s)':>10} {'speedup':>9}")
+    baseline = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        results = insights_core.summarize_articles(articles, max_workers=workers, timeout=10)
+        elapsed = time.perf_counter() - start
+        assert len(results) == len(articles)
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>10.2f} {baseline / elapsed:>8.1f}x")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
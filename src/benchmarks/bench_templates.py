@@ -0,0 +1,116 @@
+"""
+Benchmark: PDF / email template rendering, per-call Environment vs. the shared one.
+
+Usage:
+    python -m src.benchmarks.bench_templates [--articles 100] [--repeat 20]
+
+A synthetic day of --articles article cards (split over the three news
+sections) is rendered into pdf_template.html and email_template.html:
+  - per-call:  a new Environment for every render (the previous behaviour:
+               parse + compile + render each time)
+  - cold:      a fresh Environment with an empty bytecode cache (first run ever)
+  - bytecode:  a fresh Environment reading the bytecode cache written by "cold"
+               (first render of a later run)
+  - warm:      the shared, precompiled environment (every render after the first)
+"""
+import argparse
+import tempfile
+import time
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+from src.renderers.dashborad.article_renderer import render_article
+from src.renderers.pdf.pdf_builder import PDF_HEADINGS
+from src.renderers.template_env import build_template_env, config, precompile
+
+TEMPLATES = ("pdf_template.html", "email_template.html")
+
+
+def synthetic_context(articles: int) -> dict:
+    regions = ("china", "nigeria", "global")
+    cards = {region: [] for region in regions}
+    for i in range(articles):
+        region = regions[i % 3]
+        cards[region].append(render_article({
+            "title": f"Module prices move again as capacity shifts #{i}",
+            "source": "Example Wire",
+            "link": f"https://example.com/news/{i}",
+            "pub_date": "2026-01-01",
+            "region": region,
+            "cn_summary": "组件价格继续调整，产能结构变化。" * 4,
+            "en_summary": "Module prices adjusted again as capacity moved between regions. " * 4,
+            "cn_insights": ["供应链价格承压", "库存水平回落"],
+            "en_insights": ["Supply chain prices under pressure", "Inventories falling"],
+            "supply_chain": "Polysilicon and wafer prices stable.",
+            "nigeria_impact": "Import costs for distributors ease slightly.",
+            "recommendation": "Lock in Q3 orders.",
+        }))
+    news = {f"news_{region}": "".join(c) for region, c in cards.items()}
+    return {
+        **news,
+        "news_html": "".join(news.values()),
+        "price_html": "<table>" + "<tr><td>item</td><td>0.10 USD/W</td></tr>" * 40 + "</table>",
+        "price_insight": "<p>Prices steady.</p>" * 5,
+        "daily_insight": "<p>Daily insight.</p>" * 5,
+        "chart_path": "charts/price_chart.png",
+        "logo_path": "logo.png",
+        "date": "2026-01-01",
+        "headings": PDF_HEADINGS,
+        "titles": {h["id"]: h["text"] for h in PDF_HEADINGS},
+    }
+
+
+def per_call_render(name: str, context: dict) -> str:
+    env = Environment(
+        loader=FileSystemLoader(config["paths"]["templates_dir"]),
+        autoescape=select_autoescape(["html", "xml"])
+    )
+    return env.get_template(name).render(**context)
+
+
+def best_ms(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    context = synthetic_context(args.articles)
+    print(f"{args.articles} articles, {len(context['news_html']) / 1024:.0f} KiB of cards, best of {args.repeat}\n")
+    print(f"{'template':<22}{'per-call':>12}{'cold':>12}{'bytecode':>12}{'warm':>12}")
+
+    warm_env = build_template_env(bytecode_cache=False, auto_reload=False)
+    precompile(warm_env, TEMPLATES)
+
+    for name in TEMPLATES:
+        per_call = best_ms(lambda: per_call_render(name, context), args.repeat)
+
+        cold_times, bytecode_times = [], []
+        for _ in range(args.repeat):
+            with tempfile.TemporaryDirectory() as tmp:
+                cache = FileSystemBytecodeCache(tmp)
+                start = time.perf_counter()
+                build_template_env(bytecode_cache=cache).get_template(name).render(**context)
+                cold_times.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                build_template_env(bytecode_cache=cache).get_template(name).render(**context)
+                bytecode_times.append(time.perf_counter() - start)
+
+        template = warm_env.get_template(name)
+        warm = best_ms(lambda: template.render(**context), args.repeat)
+
+        print(f"{name:<22}{per_call:>10.2f}ms{min(cold_times) * 1000:>10.2f}ms"
+              f"{min(bytecode_times) * 1000:>10.2f}ms{warm:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
-import json
 from pathlib import Path
 from datetime import datetime
 
+from src.system.cache_manager import UrlCacheStore
 from src.system.config_loader import load_config
 from src.system.logger import setup_logger
 
@@ -10,55 +10,92 @@ logger = setup_logger("main")
 config = load_config()
 project_root = Path(__file__).resolve().parents[2]
 SUMMARY_CACHE_PATH = project_root / config["cache"]["summary_cache_path"]
+SUMMARY_CACHE_DB_PATH = SUMMARY_CACHE_PATH.with_suffix(".sqlite3")
+
+_store: UrlCacheStore | None = None
+
+
+def _get_store() -> UrlCacheStore:
+    """
+    Open the indexed summary cache on first use.
+    The legacy summary_cache.jsonl is imported once during the first open.
+    """
+    global _store
+    if _store is None:
+        _store = UrlCacheStore(
+            SUMMARY_CACHE_DB_PATH,
+            table="summary_cache",
+            legacy_jsonl=SUMMARY_CACHE_PATH,
+            logger=logger
+        )
+    return _store
 
 
 def load_summary_from_cache(url: str):
     """
     Load cached summary for a given URL.
-    Returns None if not found or cache file missing.
+    Returns None if not found or cache unavailable.
     """
-    if not SUMMARY_CACHE_PATH.exists():
-        logger.info("Cache file does not exist.")
-        return None
-
     try:
-        with SUMMARY_CACHE_PATH.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    item = json.loads(line)
-                    if item.get("url") == url:
-                        logger.info(f"Cache hit for URL: {url}")
-                        return item.get("summary")
-                except json.JSONDecodeError:
-                    logger.warning("Skipping invalid JSON line in cache.")
-                    continue
+        entry = _get_store().get(url)
     except Exception as e:
-        logger.error(f"Failed to read cache file: {e}")
+        logger.error(f"Failed to read cache: {e}")
+        return None
+
+    if entry is None:
+        logger.info(f"No cache entry found for URL: {url}")
         return None
 
-    logger.info(f"No cache entry found for URL: {url}")
-    return None
+    logger.info(f"Cache hit for URL: {url}")
+    return entry.get("summary")
 
 
 def save_summary_to_cache(url: str, summary: str, source: str = None):
     """
-    Save summary to cache file.
-    Each entry is stored as JSONL with timestamp.
+    Save summary to cache.
+    Each entry is stored with timestamp, keyed by URL.
     """
     try:
-        SUMMARY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
         entry = {
-            "url": url,
             "summary": summary,
             "timestamp": datetime.now().isoformat()
         }
         if source:
             entry["source"] = source
 
-        with SUMMARY_CACHE_PATH.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
-
+        _get_store().put(url, entry)
         logger.info(f"Summary cached for URL: {url}")
 
     except Exception as e:
-        logger.error(f"Failed to save summary to cache: {e}")
\ No newline at end of file
+        logger.error(f"Failed to save summary to cache: {e}")
+
+
+def get_many(urls: list[str]) -> dict[str, str]:
+    """
+    Batch lookup. Returns {url: summary} for the URLs found in cache.
+    """
+    try:
+        entries = _get_store().get_many(urls)
+    except Exception as e:
+        logger.error(f"Failed to read cache: {e}")
+        return {}
+
+    logger.info(f"Summary cache: {len(entries)}/{len(urls)} hits")
+    return {url: entry.get("summary") for url, entry in entries.items()}
+
+
+def put_many(summaries: dict[str, str]) -> None:
+    """
+    Batch save of {url: summary}.
+    """
+    if not summaries:
+        return
+    try:
+        now = datetime.now().isoformat()
+        _get_store().put_many({
+            url: {"summary": summary, "timestamp": now}
+            for url, summary in summaries.items()
+        })
+        logger.info(f"Cached {len(summaries)} summaries.")
+    except Exception as e:
+        logger.error(f"Failed to save summaries to cache: {e}")
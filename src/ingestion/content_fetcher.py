@@ -1,13 +1,18 @@
 import re
+import importlib.util
 from dataclasses import dataclass
+from functools import lru_cache
+from html import unescape
 from typing import Optional
 
 import requests
-from bs4 import BeautifulSoup
 from src.system.logger import setup_logger
+from src.system.config_loader import load_config
+from src.ingestion.http_client import http_get
 
 REQUEST_TIMEOUT = 15
 logger = setup_logger("main")
+config = load_config()
 
 
 @dataclass
@@ -20,15 +25,8 @@ class FetchedContent:
 
 
 def _fetch_html(url: str) -> Optional[str]:
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/123.0 Safari/537.36"
-        )
-    }
     try:
-        resp = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        resp = http_get(url, timeout=REQUEST_TIMEOUT)
         resp.raise_for_status()
         resp.encoding = resp.apparent_encoding or "utf-8"
         logger.info(f"Fetched HTML successfully: {url}")
@@ -38,9 +36,76 @@ def _fetch_html(url: str) -> Optional[str]:
         return None
 
 
-def _extract_wechat_content(html: str) -> tuple[str, str]:
+# ============================================================
+# Extraction backends
+#   legacy        : html.parser, full document (original behavior)
+#   lxml          : lxml, full document
+#   lxml+strainer : lxml, parse only the content subtree via SoupStrainer
+# ============================================================
+def _has_lxml() -> bool:
+    # find_spec checks availability without paying for the import
+    return importlib.util.find_spec("lxml") is not None
+
+
+HAS_LXML = _has_lxml()
+BACKENDS = ("legacy", "lxml", "lxml+strainer")
+
+extractor_cfg = config.get("content_extractor", {})
+EXTRACTOR_BACKEND = extractor_cfg.get("backend", "lxml+strainer" if HAS_LXML else "legacy")
+USE_READABILITY = extractor_cfg.get("readability", False)
+
+if EXTRACTOR_BACKEND.startswith("lxml") and not HAS_LXML:
+    logger.warning("lxml is not installed, falling back to the legacy html.parser extractor.")
+    EXTRACTOR_BACKEND = "legacy"
+
+TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+
+@lru_cache(maxsize=None)
+def _strainer(kind: str):
+    """SoupStrainer for the content subtree of a "wechat" or "generic" page (built on first use)."""
+    from bs4 import SoupStrainer
+    if kind == "wechat":
+        return SoupStrainer(id=["activity-name", "js_content"])
+    return SoupStrainer(["title", "article", "main"])
+
+
+def _soup(html: str, parser: str, parse_only=None):
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, parser, parse_only=parse_only)
+
+
+def _parser_for(backend: str) -> str:
+    return "html.parser" if backend == "legacy" else "lxml"
+
+
+def _clean_text(content_el, drop_tags: list[str]) -> str:
+    for tag in content_el.find_all(drop_tags):
+        tag.decompose()
+
+    text = content_el.get_text(separator="\n", strip=True)
+    return re.sub(r"\n{2,}", "\n\n", text)
+
+
+def _raw_title(html: str) -> str:
+    m = TITLE_RE.search(html)
+    return unescape(re.sub(r"<[^>]+>", "", m.group(1))).strip() if m else ""
+
+
+def _extract_wechat_content(html: str, backend: str | None = None) -> tuple[str, str]:
     """Extract title and text from WeChat article."""
-    soup = BeautifulSoup(html, "html.parser")
+    backend = backend or EXTRACTOR_BACKEND
+
+    if backend == "lxml+strainer":
+        soup = _soup(html, "lxml", parse_only=_strainer("wechat"))
+        content_el = soup.find(id="js_content")
+        if content_el:
+            title_el = soup.find(id="activity-name")
+            title = title_el.get_text(strip=True) if title_el else _raw_title(html)
+            return title, _clean_text(content_el, ["script", "style"])
+        # No js_content (deleted article, captcha page...) → full parse
+
+    soup = _soup(html, _parser_for(backend))
 
     title_el = soup.find(id="activity-name") or soup.find("title")
     title = title_el.get_text(strip=True) if title_el else ""
@@ -49,18 +114,50 @@ def _extract_wechat_content(html: str) -> tuple[str, str]:
     if not content_el:
         return title, ""
 
-    for tag in content_el.find_all(["script", "style"]):
-        tag.decompose()
+    return title, _clean_text(content_el, ["script", "style"])
 
-    text = content_el.get_text(separator="\n", strip=True)
-    text = re.sub(r"\n{2,}", "\n\n", text)
 
-    return title, text
+def _readability_candidate(soup):
+    """
+    Readability-style scorer: pick the block with the most paragraph text,
+    rewarding commas and penalizing link-heavy blocks (menus, footers).
+    """
+    best, best_score = None, 0.0
+    for el in soup.find_all(["div", "section", "article", "main", "td"]):
+        paragraphs = el.find_all("p", recursive=False)
+        if not paragraphs:
+            continue
+        text = " ".join(p.get_text(" ", strip=True) for p in paragraphs)
+        if len(text) < 25:
+            continue
+
+        link_len = sum(len(a.get_text(strip=True)) for a in el.find_all("a"))
+        link_density = link_len / max(1, len(el.get_text(strip=True)))
+
+        score = len(paragraphs) + text.count(",") + text.count("，") + min(len(text) / 100, 3)
+        score *= 1 - link_density
+        if score > best_score:
+            best, best_score = el, score
+    return best
+
+
+def _extract_generic_content(html: str, backend: str | None = None,
+                             readability: bool | None = None) -> tuple[str, str]:
+    """Extract title and text from generic web page."""
+    backend = backend or EXTRACTOR_BACKEND
+    readability = USE_READABILITY if readability is None else readability
+    drop_tags = ["script", "style", "nav", "footer", "header"]
 
+    if backend == "lxml+strainer":
+        soup = _soup(html, "lxml", parse_only=_strainer("generic"))
+        content_el = soup.find("article") or soup.find("main")
+        if content_el:
+            title_el = soup.find("title")
+            title = title_el.get_text(strip=True) if title_el else ""
+            return title, _clean_text(content_el, drop_tags)
+        # No semantic container → full parse for div#content / body
 
-def _extract_generic_content(html: str) -> tuple[str, str]:
-    """Extract title and text from generic web page."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = _soup(html, _parser_for(backend))
 
     title_el = soup.find("title")
     title = title_el.get_text(strip=True) if title_el else ""
@@ -69,18 +166,13 @@ def _extract_generic_content(html: str) -> tuple[str, str]:
         soup.find("article")
         or soup.find("main")
         or soup.find("div", {"id": "content"})
+        or (readability and _readability_candidate(soup))
         or soup.body
     )
     if not content_el:
         return title, ""
 
-    for tag in content_el.find_all(["script", "style", "nav", "footer", "header"]):
-        tag.decompose()
-
-    text = content_el.get_text(separator="\n", strip=True)
-    text = re.sub(r"\n{2,}", "\n\n", text)
-
-    return title, text
+    return title, _clean_text(content_el, drop_tags)
 
 
 def fetch_and_extract(url: str, source: str) -> Optional[FetchedContent]:
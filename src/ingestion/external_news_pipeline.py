@@ -1,21 +1,77 @@
 import datetime
-from typing import List, Dict
+import queue
+import threading
+import time
+from typing import Callable, List, Dict, Optional
 
 from src.system.logger import setup_logger
+from src.system.config_loader import load_config
 from src.modules.insights_core import safe_ai_summary_industry
-from src.ingestion.ai_cache import load_summary_from_cache, save_summary_to_cache
-from src.ingestion.region_cache import load_region_from_cache, save_region_to_cache
-from src.ingestion.url_queue import load_pending_urls, update_url_status
+from src.ingestion import ai_cache, region_cache
+from src.ingestion.url_queue import load_pending_urls, update_url_statuses
 from src.ingestion.content_fetcher import fetch_and_extract
 from src.ingestion.region_classifier import classify_region_ai
 from src.ingestion.url_queue_cleanup import cleanup_url_queue
 
 logger = setup_logger("main")
+config = load_config()
 
+pipeline_cfg = config.get("external_pipeline", {})
+FETCH_WORKERS = pipeline_cfg.get("fetch_workers", 8)
+SUMMARY_WORKERS = pipeline_cfg.get("summary_workers", 4)
+CLASSIFY_WORKERS = pipeline_cfg.get("classify_workers", 4)
+QUEUE_SIZE = pipeline_cfg.get("queue_size", 16)
 
+_DONE = object()
+
+
+# ============================================================
+# Stage runner
+# ============================================================
+def _start_stage(name: str, fn: Callable[[dict], Optional[dict]],
+                 in_q: queue.Queue, out_q: Optional[queue.Queue], workers: int) -> list[threading.Thread]:
+    """
+    Start `workers` threads that take jobs from in_q, apply fn and pass
+    non-None results to out_q. A job of _DONE stops the stage.
+    """
+    def loop():
+        while True:
+            job = in_q.get()
+            if job is _DONE:
+                in_q.put(_DONE)  # let the sibling workers stop too
+                return
+            try:
+                out = fn(job)
+            except Exception as e:
+                logger.error(f"[{name}] Unexpected error for {job.get('url')}: {e}")
+                out = None
+            if out is not None and out_q is not None:
+                out_q.put(out)
+
+    threads = [
+        threading.Thread(target=loop, name=f"{name}-{i}", daemon=True)
+        for i in range(max(1, workers))
+    ]
+    for t in threads:
+        t.start()
+    return threads
+
+
+def _close_stage(in_q: queue.Queue, threads: list[threading.Thread]) -> None:
+    in_q.put(_DONE)
+    for t in threads:
+        t.join()
+
+
+# ============================================================
+# Pipeline
+# ============================================================
 def process_pending_urls_to_raw_news() -> List[Dict]:
     """
     Convert pending URLs in the queue into raw news items.
+    Runs as three overlapping stages connected by bounded queues:
+      fetch + extract  →  summary (cached or AI)  →  region (cached or AI)
+    Queue statuses are committed in one batch at the end.
     Output fields align with fetch_all_news():
       - title
       - summary
@@ -29,40 +85,61 @@ def process_pending_urls_to_raw_news() -> List[Dict]:
         logger.info("No pending URLs, skipping.")
         return []
 
+    start = time.perf_counter()
     today_str = datetime.date.today().isoformat()
-    results: List[Dict] = []
+    urls = [record.get("url") for record in pending]
 
-    for record in pending:
-        url = record.get("url")
-        source = record.get("source", "web")  # default to web
+    cached_summaries = ai_cache.get_many(urls)
+    cached_regions = region_cache.get_many(urls)
+
+    statuses: dict[str, str] = {}
+    results: dict[int, Dict] = {}
+    lock = threading.Lock()
+
+    def mark(url: str, status: str) -> None:
+        with lock:
+            statuses[url] = status
+
+    # Stage 1: fetch content
+    def fetch_stage(job: dict) -> Optional[dict]:
+        url, source = job["url"], job["source"]
         logger.info(f"Processing URL: {url} (source={source})")
 
-        # Fetch content
         fetched = fetch_and_extract(url, source)
         if not fetched or not fetched.text.strip():
             logger.warning(f"Failed to fetch or empty content: {url}")
-            update_url_status(url, "failed")
-            continue
+            mark(url, "failed")
+            return None
 
-        # Summary (cached or AI)
-        summary = load_summary_from_cache(url)
+        job["fetched"] = fetched
+        return job
+
+    # Stage 2: summary (cached or AI)
+    def summary_stage(job: dict) -> Optional[dict]:
+        url = job["url"]
+        summary = cached_summaries.get(url)
         if summary:
             logger.info(f"Loaded summary from cache for {url}")
         else:
             try:
-                summary = safe_ai_summary_industry(fetched.text)
-                save_summary_to_cache(url, summary)
+                summary = safe_ai_summary_industry(job["fetched"].text)
+                ai_cache.save_summary_to_cache(url, summary)
                 logger.info(f"Generated and cached summary for {url}")
             except Exception as e:
                 logger.error(f"Failed to generate summary for {url}: {e}")
-                update_url_status(url, "failed")
-                continue
+                mark(url, "failed")
+                return None
+
+        job["summary"] = summary
+        return job
 
-        # Region classification (cached or AI)
-        cached_region = load_region_from_cache(url)
+    # Stage 3: region classification (cached or AI) → news item
+    def classify_stage(job: dict) -> None:
+        url, fetched, summary = job["url"], job["fetched"], job["summary"]
+
+        cached_region = cached_regions.get(url)
         if cached_region:
             region = cached_region.get("region", "global")
-            reason = cached_region.get("reason", "")
             logger.info(f"Loaded region from cache for {url}: {region}")
         else:
             try:
@@ -74,27 +151,49 @@ def process_pending_urls_to_raw_news() -> List[Dict]:
                 )
                 region = region_json.get("region", "global")
                 reason = region_json.get("reason", "")
-                save_region_to_cache(url, region, reason)
+                region_cache.save_region_to_cache(url, region, reason)
                 logger.info(f"Classified region for {url}: {region}")
             except Exception as e:
                 logger.error(f"Failed to classify region for {url}: {e}")
                 region = "global"
 
-        # Build news item
         news_item = {
             "title": fetched.title or url,
             "summary": summary,
-            "source": "WeChat" if source == "wechat" else "External",
+            "source": "WeChat" if job["source"] == "wechat" else "External",
             "link": url,
             "pub_date": today_str,
             "region": region,
         }
-        results.append(news_item)
+        with lock:
+            results[job["index"]] = news_item
+            statuses[url] = "fetched"
+        return None
+
+    fetch_q: queue.Queue = queue.Queue(maxsize=QUEUE_SIZE)
+    summary_q: queue.Queue = queue.Queue(maxsize=QUEUE_SIZE)
+    classify_q: queue.Queue = queue.Queue(maxsize=QUEUE_SIZE)
+
+    fetch_threads = _start_stage("fetch", fetch_stage, fetch_q, summary_q, FETCH_WORKERS)
+    summary_threads = _start_stage("summary", summary_stage, summary_q, classify_q, SUMMARY_WORKERS)
+    classify_threads = _start_stage("classify", classify_stage, classify_q, None, CLASSIFY_WORKERS)
+
+    for index, record in enumerate(pending):
+        fetch_q.put({
+            "index": index,
+            "url": record.get("url"),
+            "source": record.get("source", "web"),  # default to web
+        })
+
+    _close_stage(fetch_q, fetch_threads)
+    _close_stage(summary_q, summary_threads)
+    _close_stage(classify_q, classify_threads)
 
-        update_url_status(url, "fetched")
+    update_url_statuses(statuses)
 
-    logger.info(f"Generated {len(results)} external news items.")
+    news_items = [results[i] for i in sorted(results)]
+    logger.info(f"Generated {len(news_items)} external news items in {time.perf_counter() - start:.2f}s.")
 
     # Cleanup queue
     cleanup_url_queue()
-    return results
\ No newline at end of file
+    return news_items
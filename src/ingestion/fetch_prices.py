@@ -1,141 +1,236 @@
-import requests
-from bs4 import BeautifulSoup
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
 from datetime import date
 from src.system.logger import setup_logger
 from src.system.config_loader import load_config
+from src.ingestion.http_client import fetch_parsed
+from src.ingestion.save_price_history import load_last_known_prices
 
 logger = setup_logger("main")
 config = load_config()
 
+prices_cfg = config.get("prices", {})
+PRICE_DEADLINE = prices_cfg.get("deadline", 20)
+PRICE_MAX_WORKERS = prices_cfg.get("max_workers", 8)
+PRICE_FALLBACK_MAX_AGE_DAYS = prices_cfg.get("fallback_max_age_days", 7)
+
 
 # ============================================================
 # Generic HTML price fetcher
 # ============================================================
-def fetch_html_price(url: str, selectors: dict) -> list[dict]:
+def _parse_html_prices(url: str, html: str, selectors: dict) -> list[dict]:
     items = []
-    try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
+
+    for row in soup.select(selectors.get("item", "")):
+        try:
+            name = row.select_one(selectors.get("name")).get_text(strip=True)
+            price = row.select_one(selectors.get("price")).get_text(strip=True)
+            change = row.select_one(selectors.get("change")).get_text(strip=True) if selectors.get("change") else ""
+
+            items.append({
+                "item": name,
+                "price": price,
+                "change": change,
+                "source": url
+            })
+        except Exception as e:
+            logger.warning(f"Failed to parse one price entry from {url}: {e}")
+    return items
 
-        for row in soup.select(selectors.get("item", "")):
-            try:
-                name = row.select_one(selectors.get("name")).get_text(strip=True)
-                price = row.select_one(selectors.get("price")).get_text(strip=True)
-                change = row.select_one(selectors.get("change")).get_text(strip=True) if selectors.get("change") else ""
-
-                items.append({
-                    "item": name,
-                    "price": price,
-                    "change": change,
-                    "source": url
-                })
-            except Exception as e:
-                logger.warning(f"Failed to parse one price entry from {url}: {e}")
 
+def fetch_html_price(url: str, selectors: dict) -> list[dict]:
+    try:
+        return fetch_parsed(
+            url,
+            lambda resp: _parse_html_prices(url, resp.text, selectors),
+            parse_key=json.dumps(selectors, sort_keys=True)
+        )
     except Exception as e:
         logger.error(f"Failed to fetch HTML price from {url}: {e}")
-
-    return items
+        return []
 
 
 # ============================================================
 # TradingEconomics fetcher
 # ============================================================
+def _parse_te_price(url: str, html: str, item_name: str) -> list[dict]:
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
+
+    price_cell = soup.select_one(".table .datatable-row .datatable-cell:nth-child(2)")
+    if not price_cell:
+        logger.warning(f"TradingEconomics price not found: {url}")
+        return []
+
+    price = price_cell.get_text(strip=True)
+    return [{
+        "item": item_name.capitalize(),
+        "price": price,
+        "change": "",
+        "source": "TradingEconomics"
+    }]
+
+
 def fetch_te_price(url: str, item_name: str) -> list[dict]:
-    items = []
     try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        price_cell = soup.select_one(".table .datatable-row .datatable-cell:nth-child(2)")
-        if not price_cell:
-            logger.warning(f"TradingEconomics price not found: {url}")
-            return []
-
-        price = price_cell.get_text(strip=True)
-        items.append({
-            "item": item_name.capitalize(),
-            "price": price,
-            "change": "",
-            "source": "TradingEconomics"
-        })
-
+        return fetch_parsed(
+            url,
+            lambda resp: _parse_te_price(url, resp.text, item_name),
+            parse_key=f"te:{item_name}"
+        )
     except Exception as e:
         logger.error(f"Failed to fetch TradingEconomics price from {url}: {e}")
-
-    return items
+        return []
 
 
 # ============================================================
 # Google Finance fetcher
 # ============================================================
+def _parse_google_finance(url: str, html: str, ticker: str) -> list[dict]:
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
+
+    price_el = soup.select_one(".YMlKec")
+    if not price_el:
+        logger.warning(f"Google Finance price not found: {url}")
+        return []
+
+    price = price_el.get_text(strip=True)
+    return [{
+        "item": ticker,
+        "price": price,
+        "change": "",
+        "source": "Google Finance"
+    }]
+
+
 def fetch_google_finance(url: str, ticker: str) -> list[dict]:
-    items = []
     try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        price_el = soup.select_one(".YMlKec")
-        if not price_el:
-            logger.warning(f"Google Finance price not found: {url}")
-            return []
-
-        price = price_el.get_text(strip=True)
-        items.append({
-            "item": ticker,
-            "price": price,
-            "change": "",
-            "source": "Google Finance"
-        })
-
+        return fetch_parsed(
+            url,
+            lambda resp: _parse_google_finance(url, resp.text, ticker),
+            parse_key=f"gf:{ticker}"
+        )
     except Exception as e:
         logger.error(f"Failed to fetch Google Finance price from {url}: {e}")
-
-    return items
+        return []
 
 
 # ============================================================
-# Main function: fetch all prices
+# Price fetch tasks
 # ============================================================
-def fetch_all_prices() -> list[dict]:
-    logger.info("Starting price data fetch...")
-
-    price_list: list[dict] = []
+def build_price_tasks() -> list[tuple[str, callable]]:
+    """
+    Collect every configured price source as (label, fn) where fn() -> list[dict].
+    """
+    tasks = []
 
     # Domestic prices
-    domestic_cfg = config.get("prices", {}).get("domestic", {})
+    domestic_cfg = prices_cfg.get("domestic", {})
     for name, cfg in domestic_cfg.items():
         if not cfg.get("enabled", False):
             continue
-        logger.info(f"Fetching domestic price source: {name}")
-        price_list.extend(fetch_html_price(cfg.get("url", ""), cfg.get("selectors", {})))
+        url, selectors = cfg.get("url", ""), cfg.get("selectors", {})
+        tasks.append((f"domestic:{name}", lambda url=url, selectors=selectors: fetch_html_price(url, selectors)))
 
     # International prices: TradingEconomics
-    te_cfg = config.get("prices", {}).get("international", {}).get("tradingeconomics", {})
+    te_cfg = prices_cfg.get("international", {}).get("tradingeconomics", {})
     if te_cfg.get("enabled", False):
         base = te_cfg.get("base_url", "")
         for item in te_cfg.get("commodities", []):
             url = base.format(item=item)
-            logger.info(f"Fetching TradingEconomics price: {item}")
-            price_list.extend(fetch_te_price(url, item))
+            tasks.append((f"tradingeconomics:{item}", lambda url=url, item=item: fetch_te_price(url, item)))
 
     # International prices: Google Finance
-    gf_cfg = config.get("prices", {}).get("international", {}).get("google_finance", {})
+    gf_cfg = prices_cfg.get("international", {}).get("google_finance", {})
     if gf_cfg.get("enabled", False):
         base = gf_cfg.get("base_url", "")
         for ticker in gf_cfg.get("tickers", []):
             url = base.format(ticker=ticker)
-            logger.info(f"Fetching Google Finance price: {ticker}")
-            price_list.extend(fetch_google_finance(url, ticker))
+            tasks.append((f"google_finance:{ticker}", lambda url=url, ticker=ticker: fetch_google_finance(url, ticker)))
 
+    return tasks
+
+
+def collect_prices(tasks: list[tuple[str, callable]], deadline: float) -> tuple[list[dict], list[str]]:
+    """
+    Run all price tasks concurrently under one overall deadline.
+    :return: (prices that arrived in time, in task order; labels of late sources)
+    """
+    if not tasks:
+        return [], []
+
+    pool = ThreadPoolExecutor(max_workers=min(PRICE_MAX_WORKERS, len(tasks)), thread_name_prefix="prices")
+    start = time.perf_counter()
+    try:
+        futures = [pool.submit(fn) for _, fn in tasks]
+        done, _ = wait(futures, timeout=deadline)
+
+        price_list: list[dict] = []
+        late: list[str] = []
+        for (label, _), future in zip(tasks, futures):
+            if future not in done:
+                future.cancel()
+                late.append(label)
+                continue
+            try:
+                price_list.extend(future.result())
+            except Exception as e:
+                logger.error(f"Failed to fetch price source {label}: {e}")
+
+        logger.info(f"Collected {len(tasks) - len(late)}/{len(tasks)} price sources in {time.perf_counter() - start:.2f}s")
+        if late:
+            logger.warning(f"Price sources missed the {deadline}s deadline (stale): {', '.join(late)}")
+        return price_list, late
+    finally:
+        # Do not block on sources that are still hanging
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def fill_from_history(price_list: list[dict], history_file: str) -> list[dict]:
+    """
+    Add the last known value from the price history for every recently seen
+    item that is missing today. These entries are marked stale.
+    """
+    present = {p["item"] for p in price_list}
+    fallback = []
+    for item, last in load_last_known_prices(history_file, PRICE_FALLBACK_MAX_AGE_DAYS).items():
+        if item in present:
+            continue
+        fallback.append({
+            "item": item,
+            "price": last["price"],
+            "change": "",
+            "source": f"Price history (last known {last['date']})",
+            "stale": True,
+        })
+
+    if fallback:
+        logger.warning(f"Using last known prices for {len(fallback)} missing items: {', '.join(p['item'] for p in fallback)}")
+    return fallback
+
+
+# ============================================================
+# Main function: fetch all prices
+# ============================================================
+def fetch_all_prices(deadline: float | None = None) -> list[dict]:
+    logger.info("Starting price data fetch...")
+
+    price_list, _ = collect_prices(build_price_tasks(), deadline or PRICE_DEADLINE)
     logger.info(f"Fetched {len(price_list)} price entries in total.")
 
+    history_file = config.get("paths", {}).get("history_file_path")
+    if history_file:
+        history_path = Path(__file__).resolve().parents[2] / history_file
+        price_list.extend(fill_from_history(price_list, str(history_path)))
+
     # Add date field
     today = date.today().isoformat()
     for item in price_list:
         item["date"] = today
 
-    return price_list
\ No newline at end of file
+    return price_list
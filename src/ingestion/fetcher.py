@@ -1,16 +1,30 @@
 import datetime
 import re
-import feedparser
-import requests
-from bs4 import BeautifulSoup
-from dateutil import parser
-from urllib.parse import quote_plus, urljoin
+import time
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+import json
+from urllib.parse import quote_plus, urljoin, urlparse
 from src.system.logger import setup_logger
 from src.system.config_loader import load_config
+from src.ingestion.http_client import fetch_parsed
+from src.ingestion.news_dedup import DEDUP_ENABLED, cluster_news
 
 logger = setup_logger("main")
 config = load_config()
 
+fetch_cfg = config.get("fetch", {})
+FETCH_CONCURRENT = fetch_cfg.get("concurrent", True)
+FETCH_MAX_WORKERS = fetch_cfg.get("max_workers", 16)
+FETCH_PER_HOST_LIMIT = fetch_cfg.get("per_host_limit", 4)
+FETCH_SOURCE_DEADLINE = fetch_cfg.get("source_deadline", 30)
+
+# Keys of the parsed results cached by fetch_parsed; changed when the parsed
+# item format changes (v2: raw "pub_text" instead of a resolved pub_date)
+RSS_PARSE_KEY = "rss:v2"
+HTML_PARSE_KEY = "html:v2"
+
 
 # ============================================================
 # Unified date parser
@@ -58,6 +72,7 @@ def parse_date(text: str) -> datetime.date:
             return datetime.date(y, mth, d)
 
         # Common formats: 2025-01-02 / 2025/01/02 / 2025-01-02 10:33
+        from dateutil import parser
         dt = parser.parse(text)
         return dt.date()
 
@@ -77,60 +92,90 @@ def filter_today(news_list: list[dict]) -> list[dict]:
 # ============================================================
 # RSS fetcher
 # ============================================================
-def fetch_rss(url: str) -> list[dict]:
-    items = []
+def _feed_date(text: str | None) -> datetime.date:
+    from dateutil import parser
     try:
-        feed = feedparser.parse(url)
-        for entry in feed.entries:
-            try:
-                pub = parser.parse(entry.published).date()
-            except Exception:
-                pub = datetime.date.today()
+        return parser.parse(text).date()
+    except Exception:
+        return datetime.date.today()
 
-            items.append({
-                "title": entry.title,
-                "link": entry.link,
-                "summary": entry.get("summary", ""),
-                "pub_date": pub
-            })
+
+def _parse_feed(resp) -> list[dict]:
+    import feedparser
+
+    items = []
+    feed = feedparser.parse(resp.content)
+    for entry in feed.entries:
+        items.append({
+            "title": entry.title,
+            "link": entry.link,
+            "summary": entry.get("summary", ""),
+            "pub_text": entry.get("published")
+        })
+    return items
+
+
+def _resolve_dates(items: list[dict], to_date) -> list[dict]:
+    """
+    Turn the raw date text of parsed items into pub_date.
+    Parsed results are cached and reused on 304, possibly on a later day, so
+    anything that depends on the clock (undated entries, "3小时前", "10:33")
+    is resolved here on every run, not in the parser.
+    """
+    for item in items:
+        if "pub_text" in item:
+            item["pub_date"] = to_date(item.pop("pub_text"))
+    return items
+
+
+def fetch_rss(url: str) -> list[dict]:
+    try:
+        return _resolve_dates(fetch_parsed(url, _parse_feed, parse_key=RSS_PARSE_KEY), _feed_date)
     except Exception as e:
         logger.error(f"Failed to fetch RSS: {url} | {e}")
-    return items
+        return []
 
 
 # ============================================================
 # HTML fetcher
 # ============================================================
-def fetch_html(url: str, selectors: dict) -> list[dict]:
+def _parse_html_list(url: str, html: str, selectors: dict) -> list[dict]:
     items = []
-    try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        for div in soup.select(selectors.get("item", "")):
-            try:
-                title = div.select_one(selectors.get("title")).get_text(strip=True)
-                link = div.select_one(selectors.get("link"))["href"]
-                time_text = div.select_one(selectors.get("time")).get_text(strip=True)
-                pub = parse_date(time_text)
-
-                # Fix relative links
-                if link.startswith("/"):
-                    link = urljoin(url, link)
-
-                items.append({
-                    "title": title,
-                    "link": link,
-                    "summary": "",
-                    "pub_date": pub
-                })
-            except Exception as e:
-                logger.warning(f"Failed to parse one HTML entry from {url}: {e}")
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
+
+    for div in soup.select(selectors.get("item", "")):
+        try:
+            title = div.select_one(selectors.get("title")).get_text(strip=True)
+            link = div.select_one(selectors.get("link"))["href"]
+            time_text = div.select_one(selectors.get("time")).get_text(strip=True)
+
+            # Fix relative links
+            if link.startswith("/"):
+                link = urljoin(url, link)
+
+            items.append({
+                "title": title,
+                "link": link,
+                "summary": "",
+                "pub_text": time_text
+            })
+        except Exception as e:
+            logger.warning(f"Failed to parse one HTML entry from {url}: {e}")
+    return items
 
+
+def fetch_html(url: str, selectors: dict) -> list[dict]:
+    try:
+        items = fetch_parsed(
+            url,
+            lambda resp: _parse_html_list(url, resp.text, selectors),
+            parse_key=f"{HTML_PARSE_KEY}:{json.dumps(selectors, sort_keys=True)}"
+        )
+        return _resolve_dates(items, parse_date)
     except Exception as e:
         logger.error(f"Failed to fetch HTML: {url} | {e}")
-    return items
+        return []
 
 
 # ============================================================
@@ -142,56 +187,147 @@ def fetch_google_news(base_url: str, keywords: list[str]) -> list[dict]:
         encoded_kw = quote_plus(kw)
         url = base_url.format(keyword=encoded_kw)
         try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries:
-                try:
-                    pub = parser.parse(entry.published).date()
-                except Exception:
-                    pub = datetime.date.today()
-
-                items.append({
-                    "title": entry.title,
-                    "link": entry.link,
-                    "summary": entry.get("summary", ""),
-                    "pub_date": pub
-                })
+            items.extend(_resolve_dates(fetch_parsed(url, _parse_feed, parse_key=RSS_PARSE_KEY), _feed_date))
         except Exception as e:
             logger.error(f"Failed to fetch Google News for keyword '{kw}': {e}")
     return items
 
 
 # ============================================================
-# Main function: fetch all news
+# Fetch tasks (one per source, or one per keyword for Google News)
 # ============================================================
-def fetch_all_news() -> list[dict]:
-    logger.info("Starting news fetch...")
-
-    items: list[dict] = []
-
+def build_fetch_tasks(source_name: str, src_cfg: dict) -> list[tuple[str, callable]]:
+    """
+    Split a news source into independent fetch tasks.
+    Returns a list of (url, fn) where fn() -> list[dict].
+    """
+    if src_cfg["type"] == "rss":
+        url = src_cfg["url"]
+        return [(url, lambda: fetch_rss(url))]
+    if src_cfg["type"] == "html":
+        url, selectors = src_cfg["url"], src_cfg["selectors"]
+        return [(url, lambda: fetch_html(url, selectors))]
+    if src_cfg["type"] == "google":
+        base_url = src_cfg["base_url"]
+        return [
+            (base_url.format(keyword=quote_plus(kw)), lambda kw=kw: fetch_google_news(base_url, [kw]))
+            for kw in src_cfg["keywords"]
+        ]
+
+    logger.warning(f"Unknown news source type: {source_name}")
+    return []
+
+
+def _enabled_sources() -> list[tuple[str, dict]]:
+    sources = []
     for source_name in config.get("fetch_order", []):
         src_cfg = config.get("news_sources", {}).get(source_name)
         if not src_cfg or not src_cfg.get("enabled", False):
             continue
+        sources.append((source_name, src_cfg))
+    return sources
+
 
+def _fetch_sequential(sources: list[tuple[str, dict]]) -> list[dict]:
+    items: list[dict] = []
+    for source_name, src_cfg in sources:
         logger.info(f"Fetching news source: {source_name}")
+        start = time.perf_counter()
         try:
-            if src_cfg["type"] == "rss":
-                items.extend(fetch_rss(src_cfg["url"]))
-            elif src_cfg["type"] == "html":
-                items.extend(fetch_html(src_cfg["url"], src_cfg["selectors"]))
-            elif src_cfg["type"] == "google":
-                items.extend(fetch_google_news(src_cfg["base_url"], src_cfg["keywords"]))
-            else:
-                logger.warning(f"Unknown news source type: {source_name}")
+            for _, fn in build_fetch_tasks(source_name, src_cfg):
+                items.extend(fn())
         except Exception as e:
             logger.error(f"Failed to fetch {source_name}: {e}")
+        logger.info(f"[Fetch] {source_name}: {time.perf_counter() - start:.2f}s")
+    return items
+
 
-    # Deduplicate by title
-    unique = {item["title"]: item for item in items}
-    all_news = list(unique.values())
+def _fetch_concurrent(sources: list[tuple[str, dict]]) -> list[dict]:
+    """
+    Fan out over all sources and keywords.
+    - at most FETCH_MAX_WORKERS requests in flight
+    - at most FETCH_PER_HOST_LIMIT requests per host
+    - each source is abandoned after its deadline (source "deadline" or FETCH_SOURCE_DEADLINE)
+    Results are concatenated in fetch_order, so de-duplication matches the sequential mode.
+    """
+    host_limits = defaultdict(lambda: threading.BoundedSemaphore(FETCH_PER_HOST_LIMIT))
+    host_lock = threading.Lock()
+
+    def _run(url: str, fn) -> tuple[list[dict], float]:
+        with host_lock:
+            semaphore = host_limits[urlparse(url).netloc]
+        with semaphore:
+            start = time.perf_counter()
+            result = fn()
+            return result, time.perf_counter() - start
+
+    pool = ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS, thread_name_prefix="fetch")
+    submitted: list[tuple[str, float, list]] = []
+    started = time.monotonic()
+    try:
+        for source_name, src_cfg in sources:
+            logger.info(f"Fetching news source: {source_name}")
+            futures = [pool.submit(_run, url, fn) for url, fn in build_fetch_tasks(source_name, src_cfg)]
+            deadline = src_cfg.get("deadline", FETCH_SOURCE_DEADLINE)
+            submitted.append((source_name, deadline, futures))
+
+        items: list[dict] = []
+        latencies: dict[str, float] = {}
+        for source_name, deadline, futures in submitted:
+            remaining = max(0.0, started + deadline - time.monotonic())
+            done, not_done = wait(futures, timeout=remaining)
+
+            if not_done:
+                logger.warning(f"[Fetch] {source_name}: {len(not_done)}/{len(futures)} requests exceeded {deadline}s deadline, skipped")
+
+            source_items = 0
+            slowest = 0.0
+            for future in futures:
+                if future not in done:
+                    future.cancel()
+                    continue
+                try:
+                    result, elapsed = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to fetch {source_name}: {e}")
+                    continue
+                items.extend(result)
+                source_items += len(result)
+                slowest = max(slowest, elapsed)
+
+            latencies[source_name] = slowest if not not_done else float(deadline)
+            logger.info(f"[Fetch] {source_name}: {source_items} items, {len(futures)} requests, slowest {latencies[source_name]:.2f}s")
+
+        if latencies:
+            long_pole = max(latencies, key=latencies.get)
+            logger.info(f"[Fetch] Long pole: {long_pole} ({latencies[long_pole]:.2f}s), total {time.monotonic() - started:.2f}s")
+        return items
+    finally:
+        # Do not block on requests that blew their deadline
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ============================================================
+# Main function: fetch all news
+# ============================================================
+def fetch_all_news(concurrent: bool | None = None) -> list[dict]:
+    logger.info("Starting news fetch...")
+
+    if concurrent is None:
+        concurrent = FETCH_CONCURRENT
+
+    sources = _enabled_sources()
+    items = _fetch_concurrent(sources) if concurrent else _fetch_sequential(sources)
 
     # Keep only today's news
-    final = filter_today(all_news)
+    today = filter_today(items)
+
+    # One item per story: the same story from several outlets / keywords is
+    # summarized once, the other sources go into "also_reported_by"
+    if DEDUP_ENABLED:
+        final = cluster_news(today)
+    else:
+        final = list({item["title"]: item for item in today}.values())
 
-    logger.info(f"Fetched {len(final)} news items for today.")
-    return final
\ No newline at end of file
+    logger.info(f"Fetched {len(final)} news items for today ({len(items)} raw hits).")
+    return final
@@ -0,0 +1,309 @@
+import os
+import json
+import time
+import bisect
+import pickle
+import hashlib
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.system.config_loader import load_config
+from src.system.logger import setup_logger
+
+logger = setup_logger("main")
+config = load_config()
+
+project_root = Path(__file__).resolve().parents[2]
+HTTP_CACHE_DIR = project_root / config.get("cache", {}).get("http_cache_dir", "src/data/http_cache")
+
+http_cfg = config.get("http", {})
+HTTP_TIMEOUT = http_cfg.get("timeout", 10)
+HTTP_RETRIES = http_cfg.get("retries", 3)
+HTTP_BACKOFF_FACTOR = http_cfg.get("backoff_factor", 0.5)
+HTTP_POOL_MAXSIZE = http_cfg.get("pool_maxsize", 10)
+DEFAULT_USER_AGENT = http_cfg.get(
+    "user_agent",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/123.0 Safari/537.36"
+)
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+
+# ============================================================
+# Pooled sessions (one per host) with retry / backoff
+# ============================================================
+_sessions: dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+_latency = defaultdict(lambda: {"buckets": [0] * (len(LATENCY_BUCKETS) + 1), "count": 0, "total": 0.0, "errors": 0})
+_latency_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = DEFAULT_USER_AGENT
+    return session
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    Return the keep-alive session for the URL's host (created on first use).
+    """
+    host = urlparse(url).netloc
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = _sessions[host] = _build_session()
+        return session
+
+
+def _record_latency(host: str, elapsed: float, failed: bool) -> None:
+    with _latency_lock:
+        hist = _latency[host]
+        hist["buckets"][bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+        hist["count"] += 1
+        hist["total"] += elapsed
+        if failed:
+            hist["errors"] += 1
+
+
+def http_get(url: str, headers: dict | None = None, timeout: float | None = None) -> requests.Response:
+    """
+    GET through the shared pooled session for the host.
+    Retries on connection errors and 429/5xx (honoring Retry-After).
+    Latency (including retries) is recorded per host.
+    """
+    host = urlparse(url).netloc
+    start = time.perf_counter()
+    failed = True
+    try:
+        resp = get_session(url).get(url, headers=headers, timeout=timeout or HTTP_TIMEOUT)
+        failed = resp.status_code >= 400
+        return resp
+    finally:
+        _record_latency(host, time.perf_counter() - start, failed)
+
+
+def latency_histograms() -> dict:
+    """
+    Per-host latency histograms: {host: {"buckets": {"<=0.1s": n, ...}, "count", "mean", "errors"}}
+    """
+    labels = [f"<={b}s" for b in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+    with _latency_lock:
+        return {
+            host: {
+                "buckets": dict(zip(labels, hist["buckets"])),
+                "count": hist["count"],
+                "mean": round(hist["total"] / hist["count"], 3) if hist["count"] else 0.0,
+                "errors": hist["errors"],
+            }
+            for host, hist in _latency.items()
+        }
+
+
+def log_http_latency_stats() -> None:
+    for host, hist in sorted(latency_histograms().items()):
+        buckets = " ".join(f"{label}:{n}" for label, n in hist["buckets"].items() if n)
+        logger.info(
+            f"[HTTP] {host}: {hist['count']} requests, mean {hist['mean']:.2f}s, "
+            f"errors {hist['errors']} | {buckets}"
+        )
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    status_code: int
+    content: bytes
+    encoding: Optional[str]
+    from_cache: bool        # True when the server answered 304 Not Modified
+    cacheable: bool = True  # False when the server sent no validators
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+# ============================================================
+# On-disk HTTP cache (validators + body + parsed result)
+# ============================================================
+class HttpCache:
+    """
+    Stores, per URL:
+      <key>.json   ETag / Last-Modified / encoding
+      <key>.body   raw response body
+      <key>.<parse_key>.pkl   parsed result, reused on 304
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _path(self, url: str, suffix: str) -> Path:
+        return self.cache_dir / f"{self._key(url)}{suffix}"
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def load_meta(self, url: str) -> Optional[dict]:
+        meta_path = self._path(url, ".json")
+        body_path = self._path(url, ".body")
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+
+    def load_body(self, url: str) -> bytes:
+        return self._path(url, ".body").read_bytes()
+
+    def _drop_parsed(self, url: str) -> None:
+        for path in self.cache_dir.glob(f"{self._key(url)}.*.pkl"):
+            path.unlink(missing_ok=True)
+
+    def store(self, url: str, resp: requests.Response) -> bool:
+        # Results parsed from the previous body must never be paired with the new validators
+        self._drop_parsed(url)
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            # Nothing to revalidate with, caching the body would never pay off.
+            # Drop the old entry so its outdated validators are not sent again.
+            self._path(url, ".json").unlink(missing_ok=True)
+            self._path(url, ".body").unlink(missing_ok=True)
+            return False
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "encoding": resp.encoding,
+        }
+        self._write_atomic(self._path(url, ".body"), resp.content)
+        self._write_atomic(self._path(url, ".json"), json.dumps(meta).encode("utf-8"))
+        return True
+
+    def load_parsed(self, url: str, parse_key: str) -> Any:
+        path = self._path(url, f".{self._key(parse_key)[:16]}.pkl")
+        if not path.exists():
+            return None
+        try:
+            return pickle.loads(path.read_bytes())
+        except Exception:
+            return None
+
+    def store_parsed(self, url: str, parse_key: str, parsed: Any) -> None:
+        path = self._path(url, f".{self._key(parse_key)[:16]}.pkl")
+        try:
+            self._write_atomic(path, pickle.dumps(parsed))
+        except Exception as e:
+            logger.warning(f"Failed to cache parsed result for {url}: {e}")
+
+
+http_cache = HttpCache(HTTP_CACHE_DIR)
+
+_stats = {"hits": 0, "misses": 0, "bytes_saved": 0, "bytes_downloaded": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(**deltas) -> None:
+    with _stats_lock:
+        for key, value in deltas.items():
+            _stats[key] += value
+
+
+# ============================================================
+# Conditional GET
+# ============================================================
+def conditional_get(url: str, timeout: float | None = None, headers: dict | None = None) -> CachedResponse:
+    """
+    GET with If-None-Match / If-Modified-Since from the on-disk cache.
+    On 304 the cached body is returned (from_cache=True).
+    Raises requests.RequestException on network / HTTP errors.
+    """
+    meta = http_cache.load_meta(url)
+    req_headers = dict(headers or {})
+    if meta:
+        if meta.get("etag"):
+            req_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            req_headers["If-Modified-Since"] = meta["last_modified"]
+
+    resp = http_get(url, headers=req_headers, timeout=timeout)
+
+    if resp.status_code == 304 and meta:
+        body = http_cache.load_body(url)
+        _count(hits=1, bytes_saved=len(body))
+        logger.debug(f"[HTTPCache] 304 Not Modified: {url}")
+        return CachedResponse(url, 304, body, meta.get("encoding"), from_cache=True)
+
+    resp.raise_for_status()
+    cacheable = http_cache.store(url, resp)
+    _count(misses=1, bytes_downloaded=len(resp.content))
+    return CachedResponse(url, resp.status_code, resp.content, resp.encoding,
+                          from_cache=False, cacheable=cacheable)
+
+
+def fetch_parsed(url: str, parse: Callable[[CachedResponse], Any], parse_key: str = "",
+                 timeout: float | None = None, headers: dict | None = None) -> Any:
+    """
+    Conditional GET + parse. When the page is unchanged (304) the previously
+    parsed result is reused instead of parsing the body again, possibly on a
+    later day: parse must not depend on the clock (resolve relative dates
+    after this returns).
+    :param parse_key: Distinguishes different parsers / selectors for the same URL
+    """
+    resp = conditional_get(url, timeout=timeout, headers=headers)
+
+    if resp.from_cache:
+        parsed = http_cache.load_parsed(url, parse_key)
+        if parsed is not None:
+            return parsed
+
+    parsed = parse(resp)
+    if resp.cacheable:
+        http_cache.store_parsed(url, parse_key, parsed)
+    return parsed
+
+
+def http_cache_stats() -> dict:
+    with _stats_lock:
+        return dict(_stats)
+
+
+def log_http_cache_stats() -> None:
+    stats = http_cache_stats()
+    logger.info(
+        f"[HTTPCache] hits={stats['hits']} misses={stats['misses']} "
+        f"bytes_saved={stats['bytes_saved']} bytes_downloaded={stats['bytes_downloaded']}"
+    )
@@ -0,0 +1,246 @@
+"""
+Near-duplicate clustering of fetched news, so that one wire story picked
+up by several outlets (or by several Google News keywords, with different
+" - Publisher" suffixes) is summarized and rendered once.
+
+Two items are the same story when
+- their titles are equal after normalize_title(), or
+- the word sets of title + summary have a Jaccard similarity of at least
+  DEDUP_MIN_SIMILARITY.
+Candidate pairs for the second test come from MinHash signatures split into
+MINHASH_BANDS bands (LSH): only items that agree on a whole band are
+compared, so the cost grows with the number of items, not of pairs.
+
+Each cluster keeps one representative (the item with the longest summary)
+and lists the others under "also_reported_by".
+"""
+import re
+import html
+import hashlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+from src.system.config_loader import load_config
+from src.system.logger import setup_logger
+
+logger = setup_logger("main")
+config = load_config()
+
+dedup_cfg = config.get("dedup", {})
+DEDUP_ENABLED = dedup_cfg.get("enabled", True)
+DEDUP_MIN_SIMILARITY = dedup_cfg.get("min_similarity", 0.6)
+# Very short texts match too easily; those items are merged by title only
+DEDUP_MIN_FEATURES = dedup_cfg.get("min_features", 5)
+
+# 16 bands of 3 rows: pairs at similarity 0.6 become candidates with p = 0.98, at 0.1 with p = 0.016
+MINHASH_BANDS = 16
+MINHASH_ROWS = 3
+
+TAG_RE = re.compile(r"<[^>]+>")
+TOKEN_RE = re.compile(r"[a-z0-9]+|[\u4e00-\u9fff]+")
+# "Headline - Publisher", "Headline | Publisher", "Headline — Publisher"
+PUBLISHER_SUFFIX_RE = re.compile(r"^(?P<headline>.+?)\s+[-|–—]\s+(?P<publisher>[^-|–—]{2,60})$")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has in is it of on or that the to was were will with".split()
+)
+
+
+# ============================================================
+# Normalization and features
+# ============================================================
+def split_publisher(title: str) -> tuple[str, str]:
+    """
+    "Solar module prices fall again - Reuters" -> ("Solar module prices fall again", "Reuters").
+    Only a short trailing segment after a long enough headline counts as a publisher.
+    """
+    title = (title or "").strip()
+    match = PUBLISHER_SUFFIX_RE.match(title)
+    if match:
+        headline, publisher = match.group("headline"), match.group("publisher").strip()
+        if len(headline.split()) >= 4 and len(publisher.split()) <= 5:
+            return headline, publisher
+    return title, ""
+
+
+def normalize_title(title: str) -> str:
+    """Headline without publisher suffix, lower-cased, punctuation and extra spaces removed."""
+    headline, _ = split_publisher(html.unescape(title or ""))
+    return " ".join(TOKEN_RE.findall(headline.lower()))
+
+
+def plain_text(text: str) -> str:
+    return html.unescape(TAG_RE.sub(" ", text or ""))
+
+
+def publisher(item: dict) -> str:
+    """The item's source, else the title suffix, else the link's host."""
+    if item.get("source"):
+        return item["source"]
+    _, name = split_publisher(item.get("title", ""))
+    if name:
+        return name
+    host = re.sub(r"^https?://(www\.)?", "", item.get("link") or "").split("/")[0]
+    return host or "Unknown"
+
+
+def text_features(text: str) -> set[str]:
+    """English words (without stopwords) and Chinese character bigrams."""
+    features = set()
+    for run in TOKEN_RE.findall(text.lower()):
+        if run[0] < "\u4e00":
+            if run not in STOPWORDS:
+                features.add(run)
+        elif len(run) == 1:
+            features.add(run)
+        else:
+            features.update(run[i:i + 2] for i in range(len(run) - 1))
+    return features
+
+
+def item_features(item: dict) -> set[str]:
+    """
+    Words of headline and summary. The publisher's name is left out: Google
+    News summaries repeat it, and it differs between copies of a story.
+    """
+    headline, name = split_publisher(plain_text(item.get("title", "")))
+    features = text_features(headline) | text_features(plain_text(item.get("summary", "")))
+    return features - text_features(name or item.get("source", ""))
+
+
+def jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+def minhash_signatures(feature_sets: list[set[str]]) -> "np.ndarray":
+    """
+    One row of MINHASH_BANDS * MINHASH_ROWS min-hashes per (non-empty) set,
+    computed for all sets at once. The permutations are xor + odd multiplier
+    over a 64-bit hash of each feature, with fixed seeds.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    size = MINHASH_BANDS * MINHASH_ROWS
+    masks = rng.integers(0, 2 ** 63, size=size, dtype=np.uint64)
+    multipliers = rng.integers(0, 2 ** 63, size=size, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+
+    memo: dict[str, int] = {}
+    flat, offsets = [], []
+    for features in feature_sets:
+        offsets.append(len(flat))
+        for feature in features:
+            if feature not in memo:
+                memo[feature] = int.from_bytes(
+                    hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little"
+                )
+            flat.append(memo[feature])
+
+    hashes = np.array(flat, dtype=np.uint64)[:, None]
+    permuted = (hashes ^ masks) * multipliers  # wraps around mod 2**64
+    return np.minimum.reduceat(permuted, offsets, axis=0)
+
+
+# ============================================================
+# Clustering
+# ============================================================
+class _DisjointSet:
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a: int, b: int) -> bool:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        # The earlier item stays the root, so clusters keep the fetch order
+        self.parent[max(ra, rb)] = min(ra, rb)
+        return True
+
+
+def _summary_length(item: dict) -> int:
+    return len(plain_text(item.get("summary", "")).strip())
+
+
+def cluster_news(news_list: list[dict], min_similarity: float | None = None,
+                 near_duplicates: bool = True) -> list[dict]:
+    """
+    Merge near-duplicate stories.
+    :param min_similarity: word-set Jaccard similarity from which two items are
+                           the same story (default DEDUP_MIN_SIMILARITY)
+    :param near_duplicates: False to merge equal normalized titles only
+    :return: one item per story, in the order each story was first seen. The
+             representative is the member with the longest summary; the
+             other members are listed as [{source, title, link}] under
+             "also_reported_by" (merged with any list the members already had).
+    """
+    if min_similarity is None:
+        min_similarity = DEDUP_MIN_SIMILARITY
+    n = len(news_list)
+    if n < 2:
+        return list(news_list)
+
+    clusters = _DisjointSet(n)
+    by_title: dict[str, int] = {}
+    title_merges = similar_merges = 0
+
+    for i, item in enumerate(news_list):
+        title = item.get("title") or ""
+        # Titles in other scripts normalize to nothing; fall back to exact-title matching
+        key = normalize_title(title) or html.unescape(title).strip()
+        if not key:
+            continue
+        if key in by_title:
+            title_merges += clusters.union(by_title[key], i)
+        else:
+            by_title[key] = i
+
+    if near_duplicates:
+        features = {i: item_features(item) for i, item in enumerate(news_list)}
+        indexed = [i for i in range(n) if len(features[i]) >= DEDUP_MIN_FEATURES]
+        if len(indexed) > 1:
+            signatures = minhash_signatures([features[i] for i in indexed])
+            buckets: dict[tuple[int, bytes], list[int]] = {}
+            for row, i in enumerate(indexed):
+                for band in range(MINHASH_BANDS):
+                    key = (band, signatures[row, band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS].tobytes())
+                    for j in buckets.setdefault(key, []):
+                        if clusters.find(i) != clusters.find(j) \
+                                and jaccard(features[i], features[j]) >= min_similarity:
+                            similar_merges += clusters.union(i, j)
+                    buckets[key].append(i)
+
+    members: dict[int, list[int]] = {}
+    for i in range(n):
+        members.setdefault(clusters.find(i), []).append(i)
+
+    stories = []
+    for root in sorted(members):
+        group = members[root]
+        best = max(group, key=lambda i: (_summary_length(news_list[i]), -i))
+        story = dict(news_list[best])
+
+        also, seen = [], {story.get("link")}
+        for i in group:
+            others = list(news_list[i].get("also_reported_by") or [])
+            if i != best:
+                item = news_list[i]
+                others.insert(0, {"source": publisher(item), "title": item.get("title", ""),
+                                  "link": item.get("link", "")})
+            for other in others:
+                if other.get("link") not in seen:
+                    seen.add(other.get("link"))
+                    also.append(other)
+        if also:
+            story["also_reported_by"] = also
+        stories.append(story)
+
+    logger.info(f"[Dedup] {n} items -> {len(stories)} stories "
+                f"({title_merges} merged by title, {similar_merges} by similarity)")
+    return stories
@@ -0,0 +1,194 @@
+import os
+import re
+import csv
+import sqlite3
+import threading
+from datetime import date
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def parse_price(text) -> float | None:
+    """
+    Numeric value of a scraped price string ("$1,234.50", "0.123 USD/W").
+    Returns None when there is no number in it.
+    """
+    if text is None:
+        return None
+    if isinstance(text, (int, float)):
+        return float(text)
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    match = _NUMBER_RE.search(str(text).replace(",", ""))
+    return float(match.group()) if match else None
+
+
+class PriceHistoryStore:
+    """
+    Price history keyed by (item, date) in SQLite.
+    - upsert() only touches the new rows (no read / sort / rewrite of the history)
+    - rows are clustered by (item, date), so "item X, last 90 days" is a single
+      primary key range scan; multi-item queries are one such scan per item
+    - range queries return NumPy arrays (datetime64[D] dates, float64 values)
+    The raw scraped price text is kept next to its numeric value.
+    The legacy CSV history is imported once on first use.
+    """
+
+    def __init__(self, db_path, legacy_csv=None, logger=None):
+        self.db_path = str(db_path)
+        self.logger = logger
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS prices ("
+            "item TEXT NOT NULL, date TEXT NOT NULL, price TEXT, value REAL, "
+            "PRIMARY KEY (item, date)) WITHOUT ROWID"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS items (item TEXT PRIMARY KEY)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS migrations (name TEXT PRIMARY KEY)")
+        self._conn.commit()
+
+        if legacy_csv:
+            self._migrate_csv(legacy_csv)
+
+    # ------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------
+    @staticmethod
+    def _rows(records):
+        for r in records:
+            item, day = r.get("item"), str(r.get("date") or "")[:10]
+            if item and day:
+                price = r.get("price")
+                yield item, day, None if price is None else str(price), parse_price(price)
+
+    def upsert(self, records) -> int:
+        """
+        Insert or replace rows given as dicts with item / date / price.
+        Cost is proportional to the number of rows passed in.
+        :return: number of rows written
+        """
+        rows = list(self._rows(records))
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO prices (item, date, price, value) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (item, date) DO UPDATE SET price = excluded.price, value = excluded.value",
+                rows
+            )
+            self._conn.executemany("INSERT OR IGNORE INTO items (item) VALUES (?)", {(r[0],) for r in rows})
+            self._conn.commit()
+        return len(rows)
+
+    def _migrate_csv(self, csv_path) -> None:
+        """Import the legacy history CSV (runs once; later rows win on the same item + date)"""
+        name = f"csv:{os.path.basename(str(csv_path))}"
+        with self._lock:
+            done = self._conn.execute("SELECT 1 FROM migrations WHERE name = ?", (name,)).fetchone()
+        if done:
+            return
+
+        count = 0
+        if os.path.exists(csv_path) and os.path.getsize(csv_path) > 0:
+            with open(csv_path, "r", encoding="utf-8", newline="") as f:
+                records = list(csv.DictReader(f))
+            # Inserting in key order keeps the B-tree appends sequential;
+            # the sort is stable, so later duplicates still win
+            records.sort(key=lambda r: (r.get("item") or "", str(r.get("date") or "")[:10]))
+            count = self.upsert(records)
+
+        with self._lock:
+            self._conn.execute("INSERT OR IGNORE INTO migrations (name) VALUES (?)", (name,))
+            self._conn.commit()
+
+        if self.logger:
+            self.logger.info(f"[PriceHistory] Migrated {count} rows from {csv_path}")
+
+    # ------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------
+    @staticmethod
+    def _bounds(start, end) -> tuple[str, str]:
+        start = start.isoformat() if isinstance(start, date) else (start or "0000-00-00")
+        end = end.isoformat() if isinstance(end, date) else (end or "9999-99-99")
+        return start, end
+
+    @staticmethod
+    def _arrays(rows) -> tuple["np.ndarray", "np.ndarray"]:
+        import numpy as np
+
+        # None (unparseable price) becomes NaN with a float64 dtype
+        dates = np.array([r[0] for r in rows], dtype="datetime64[D]")
+        values = np.array([r[1] for r in rows], dtype=np.float64)
+        return dates, values
+
+    def items(self) -> list[str]:
+        with self._lock:
+            return [r[0] for r in self._conn.execute("SELECT item FROM items ORDER BY item")]
+
+    def get_series(self, item: str, start=None, end=None) -> tuple["np.ndarray", "np.ndarray"]:
+        """
+        One item's history between start and end (inclusive, ISO strings or dates).
+        :return: (dates as datetime64[D], values as float64 with NaN for unparseable prices)
+        """
+        start, end = self._bounds(start, end)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, value FROM prices WHERE item = ? AND date BETWEEN ? AND ? ORDER BY date",
+                (item, start, end)
+            ).fetchall()
+        return self._arrays(rows)
+
+    def get_range(self, start=None, end=None, items=None) -> dict[str, tuple["np.ndarray", "np.ndarray"]]:
+        """
+        get_series() for several items (all items by default): {item: (dates, values)}
+        """
+        return {
+            item: series
+            for item in (self.items() if items is None else items)
+            if len((series := self.get_series(item, start, end))[0])
+        }
+
+    def latest(self, since=None) -> dict[str, dict]:
+        """
+        Most recent observation per item, optionally only from `since` on.
+        :return: {item: {"item", "date", "price"}} with the raw price text
+        """
+        since, _ = self._bounds(since, None)
+        latest = {}
+        for item in self.items():
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT date, price FROM prices WHERE item = ? AND date >= ? ORDER BY date DESC LIMIT 1",
+                    (item, since)
+                ).fetchone()
+            if row:
+                latest[item] = {"item": item, "date": row[0], "price": row[1] or ""}
+        return latest
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM prices").fetchone()[0]
+
+    def export_csv(self, csv_path) -> int:
+        """Write the whole history as item,date,price CSV (sorted by date). Returns the row count."""
+        with self._lock:
+            rows = self._conn.execute("SELECT item, date, price FROM prices ORDER BY date, item").fetchall()
+        with open(csv_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["item", "date", "price"])
+            writer.writerows(rows)
+        return len(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,7 +1,7 @@
-import json
 from pathlib import Path
 from datetime import datetime
 
+from src.system.cache_manager import UrlCacheStore
 from src.system.config_loader import load_config
 from src.system.logger import setup_logger
 
@@ -10,6 +10,33 @@ config = load_config()
 
 project_root = Path(__file__).resolve().parents[2]
 REGION_CACHE_PATH = project_root / config["cache"]["region_cache_path"]
+REGION_CACHE_DB_PATH = REGION_CACHE_PATH.with_suffix(".sqlite3")
+
+_store: UrlCacheStore | None = None
+
+
+def _get_store() -> UrlCacheStore:
+    """
+    Open the indexed region cache on first use.
+    The legacy region_cache.jsonl is imported once during the first open.
+    """
+    global _store
+    if _store is None:
+        _store = UrlCacheStore(
+            REGION_CACHE_DB_PATH,
+            table="region_cache",
+            legacy_jsonl=REGION_CACHE_PATH,
+            logger=logger
+        )
+    return _store
+
+
+def _to_result(entry: dict) -> dict:
+    return {
+        "region": entry.get("region"),
+        "reason": entry.get("reason"),
+        "timestamp": entry.get("timestamp")
+    }
 
 
 def load_region_from_cache(url: str):
@@ -17,51 +44,63 @@ def load_region_from_cache(url: str):
     Load region classification result from cache by URL.
     Returns dict with region and reason, or None if not found.
     """
-    if not REGION_CACHE_PATH.exists():
-        logger.info("Region cache file does not exist.")
-        return None
-
     try:
-        with REGION_CACHE_PATH.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    item = json.loads(line)
-                    if item.get("url") == url:
-                        logger.info(f"Cache hit for region: {url}")
-                        return {
-                            "region": item.get("region"),
-                            "reason": item.get("reason"),
-                            "timestamp": item.get("timestamp")
-                        }
-                except json.JSONDecodeError:
-                    logger.warning("Skipping invalid JSON line in region cache.")
-                    continue
+        entry = _get_store().get(url)
     except Exception as e:
         logger.error(f"Failed to read region cache: {e}")
         return None
 
-    logger.info(f"No region cache entry found for URL: {url}")
-    return None
+    if entry is None:
+        logger.info(f"No region cache entry found for URL: {url}")
+        return None
+
+    logger.info(f"Cache hit for region: {url}")
+    return _to_result(entry)
 
 
 def save_region_to_cache(url: str, region: str, reason: str):
     """
     Save region classification result to cache.
-    Each entry is stored as JSONL with timestamp.
+    Each entry is stored with timestamp, keyed by URL.
     """
     try:
-        REGION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        entry = {
-            "url": url,
+        _get_store().put(url, {
             "region": region,
             "reason": reason,
             "timestamp": datetime.now().isoformat()
-        }
+        })
+        logger.info(f"Region cached for URL: {url} ({region})")
 
-        with REGION_CACHE_PATH.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    except Exception as e:
+        logger.error(f"Failed to save region to cache: {e}")
+
+
+def get_many(urls: list[str]) -> dict[str, dict]:
+    """
+    Batch lookup. Returns {url: {"region", "reason", "timestamp"}} for cached URLs.
+    """
+    try:
+        entries = _get_store().get_many(urls)
+    except Exception as e:
+        logger.error(f"Failed to read region cache: {e}")
+        return {}
+
+    logger.info(f"Region cache: {len(entries)}/{len(urls)} hits")
+    return {url: _to_result(entry) for url, entry in entries.items()}
 
-        logger.info(f"Region cached for URL: {url} ({region})")
 
+def put_many(regions: dict[str, tuple[str, str]]) -> None:
+    """
+    Batch save of {url: (region, reason)}.
+    """
+    if not regions:
+        return
+    try:
+        now = datetime.now().isoformat()
+        _get_store().put_many({
+            url: {"region": region, "reason": reason, "timestamp": now}
+            for url, (region, reason) in regions.items()
+        })
+        logger.info(f"Cached {len(regions)} region results.")
     except Exception as e:
-        logger.error(f"Failed to save region to cache: {e}")
\ No newline at end of file
+        logger.error(f"Failed to save regions to cache: {e}")
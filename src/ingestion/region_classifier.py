@@ -1,6 +1,7 @@
 import re
 
 from src.modules.insights_core import summarize_article, load_prompt
+from src.modules.keyword_matcher import KeywordMatcher
 
 # ------------------------------------------------------------
 # 可配置关键词（你可以随时扩展）
@@ -33,42 +34,85 @@ NIGERIA_DOMAINS = [
     "punchng.com",
 ]
 
+# 关键词表只编译一次：每段文本扫描一遍即可得到所有 region 的命中
+DOMAIN_MATCHER = KeywordMatcher({"china": CHINA_DOMAINS, "nigeria": NIGERIA_DOMAINS})
+KEYWORD_MATCHER = KeywordMatcher({"china": CHINA_KEYWORDS, "nigeria": NIGERIA_KEYWORDS})
+
+# 域名命中的权重（域名是最强信号）
+DOMAIN_WEIGHT = 10
+
+CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+
 # ------------------------------------------------------------
 # Region 分类主函数
 # ------------------------------------------------------------
 
+def _region_from_matches(domains: dict, keywords: dict, text: str) -> str:
+    # 1. 域名判断（最强信号）
+    if domains:
+        return "china" if "china" in domains else "nigeria"
+
+    # 2. 关键词判断（标题 + 摘要）
+    if keywords:
+        return "china" if "china" in keywords else "nigeria"
+
+    # 3. 中文内容 → 默认中国
+    if CJK_RE.search(text):
+        return "china"
+
+    # 4. 默认 global
+    return "global"
+
+
 def classify_region(title: str, summary: str, link: str) -> str:
     """
     根据标题 / 摘要 / 链接域名进行自动 region 分类。
     返回：china / nigeria / global
     """
+    text = f"{title} {summary}"
+    return _region_from_matches(DOMAIN_MATCHER.find(link or ""), KEYWORD_MATCHER.find(text), text)
 
-    text = f"{title} {summary}".lower()
 
-    # 1. 域名判断（最强信号）
-    for domain in CHINA_DOMAINS:
-        if domain in link.lower():
-            return "china"
+def region_scores(title: str, summary: str, link: str) -> dict[str, int]:
+    """
+    每个 region 的得分：域名命中 × DOMAIN_WEIGHT + 关键词出现次数。
+    返回：{"china": n, "nigeria": n}
+    """
+    domains = DOMAIN_MATCHER.scores(link or "")
+    keywords = KEYWORD_MATCHER.scores(f"{title} {summary}")
+    return {region: domains[region] * DOMAIN_WEIGHT + keywords[region] for region in KEYWORD_MATCHER.labels}
 
-    for domain in NIGERIA_DOMAINS:
-        if domain in link.lower():
-            return "nigeria"
 
-    # 2. 关键词判断（标题 + 摘要）
-    for kw in CHINA_KEYWORDS:
-        if kw.lower() in text:
-            return "china"
+def _article_texts(articles: list[dict]) -> tuple[list[str], list[str]]:
+    texts = [f"{a.get('title', '')} {a.get('summary', '')}" for a in articles]
+    links = [a.get("link") or "" for a in articles]
+    return texts, links
 
-    for kw in NIGERIA_KEYWORDS:
-        if kw.lower() in text:
-            return "nigeria"
 
-    # 3. 中文内容 → 默认中国
-    if re.search(r"[\u4e00-\u9fff]", text):
-        return "china"
+def classify_regions(articles: list[dict]) -> list[str]:
+    """
+    classify_region 的批量版本：articles 为 {title, summary, link} 列表，
+    所有标题 / 摘要和所有链接各只扫描一遍。
+    """
+    texts, links = _article_texts(articles)
+    domains = DOMAIN_MATCHER.find_many(links)
 
-    # 4. 默认 global
-    return "global"
+    # 域名已命中的文章不必再扫描关键词
+    pending = [i for i, found in enumerate(domains) if not found]
+    keywords: list[dict] = [{} for _ in texts]
+    for i, found in zip(pending, KEYWORD_MATCHER.find_many([texts[i] for i in pending])):
+        keywords[i] = found
+
+    return [_region_from_matches(d, k, text) for d, k, text in zip(domains, keywords, texts)]
+
+
+def region_scores_many(articles: list[dict]) -> list[dict[str, int]]:
+    """region_scores 的批量版本"""
+    texts, links = _article_texts(articles)
+    return [
+        {region: domains[region] * DOMAIN_WEIGHT + keywords[region] for region in KEYWORD_MATCHER.labels}
+        for domains, keywords in zip(DOMAIN_MATCHER.scores_many(links), KEYWORD_MATCHER.scores_many(texts))
+    ]
 
 
 
@@ -86,4 +130,4 @@ def classify_region_ai(title, summary, link, raw_text):
 
     # 你已有 summarize_article 的调用方式，这里复用
     result = summarize_article({"summary": final_prompt})
-    return result
\ No newline at end of file
+    return result
@@ -1,59 +1,63 @@
-import os
-import pandas as pd
+import threading
+from datetime import date, timedelta
+from pathlib import Path
 from src.system.logger import setup_logger
+from src.ingestion.price_history_store import PriceHistoryStore
 
 logger = setup_logger("main")
 
+_stores: dict[str, PriceHistoryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_price_store(history_file: str) -> PriceHistoryStore:
+    """
+    The price history store belonging to a configured history file.
+    Data lives next to it as <name>.sqlite3; the CSV itself is imported once.
+    """
+    history_file = str(history_file)
+    with _stores_lock:
+        store = _stores.get(history_file)
+        if store is None:
+            store = _stores[history_file] = PriceHistoryStore(
+                Path(history_file).with_suffix(".sqlite3"),
+                legacy_csv=history_file,
+                logger=logger
+            )
+        return store
+
 
 def save_price_history(prices: list[dict], history_file: str) -> None:
     """
-    Save daily price data into history CSV file.
-    Ensures correct headers, merges with existing data, and sorts by date.
+    Upsert today's prices into the history store, keyed by (item, date).
+    Only the new rows are written.
     """
+    # Stale entries are yesterday's values carried forward, not new observations
+    prices = [p for p in prices if not p.get("stale")]
     if not prices:
         logger.warning("No price data today, skipping history update.")
         return
 
-    # Ensure correct column order
-    df_new = pd.DataFrame(prices, columns=["item", "date", "price"])
-    missing = {"item", "date", "price"} - set(df_new.columns)
+    missing = {"item", "date", "price"} - set().union(*(p.keys() for p in prices))
     if missing:
         logger.error(f"Missing required columns in prices : {missing}")
 
     try:
-        # If file does not exist → create new
-        if not os.path.exists(history_file) or os.path.getsize(history_file) == 0:
-            df_new.to_csv(history_file, index=False)
-            logger.info(f"Created new history file: {history_file}")
-            return
-
-        # Read old data
-        df_old = pd.read_csv(history_file)
-
-        # Fix missing columns
-        required_cols = {"item", "date", "price"}
-        if not required_cols.issubset(df_old.columns):
-            logger.warning("History file format invalid, resetting headers.")
-            df_old = pd.DataFrame(columns=["item", "date", "price"])
-
-        # Merge
-        df_all = pd.concat([df_old, df_new], ignore_index=True)
-
-        # Ensure date column is datetime
-        df_all["date"] = pd.to_datetime(df_all["date"], errors="coerce")
-
-        # Drop rows with invalid dates
-        df_all = df_all.dropna(subset=["date"])
-
-        # Sort by date ascending
-        df_all = df_all.sort_values(by="date")
-
-        # Drop duplicates (same item + date)
-        df_all = df_all.drop_duplicates(subset=["item", "date"], keep="last")
+        written = get_price_store(history_file).upsert(prices)
+        logger.info(f"Updated price history: {history_file} with {written} new records.")
+    except Exception as e:
+        logger.error(f"Failed to update price history: {e}")
 
-        # Write back
-        df_all.to_csv(history_file, index=False)
-        logger.info(f"Updated history file: {history_file} with {len(df_new)} new records.")
 
+def load_last_known_prices(history_file: str, max_age_days: int = 7) -> dict[str, dict]:
+    """
+    Return the most recent price per item from the history store.
+    Only observations within max_age_days are considered.
+    :return: {item: {"item", "date", "price"}}
+    """
+    cutoff = date.today() - timedelta(days=max_age_days)
+    try:
+        return get_price_store(history_file).latest(since=cutoff)
     except Exception as e:
-        logger.error(f"Failed to update price history: {e}")
\ No newline at end of file
+        logger.error(f"Failed to read last known prices: {e}")
+        return {}
@@ -1,4 +1,7 @@
 import json
+import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
@@ -13,6 +16,99 @@ project_root = Path(__file__).resolve().parents[2]
 QUEUE_FILE_PATH = project_root / config["cache"]["incoming_urls_path"]
 QUEUE_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
 
+# The queue lives in SQLite (URL primary key, indexed status).
+# incoming_urls.jsonl is imported once on first use.
+QUEUE_DB_PATH = QUEUE_FILE_PATH.with_suffix(".sqlite3")
+
+_conn: sqlite3.Connection | None = None
+_lock = threading.Lock()
+
+
+def _connect() -> sqlite3.Connection:
+    """
+    Open the queue database on first use.
+    WAL + busy timeout let several processes enqueue / update concurrently.
+    """
+    global _conn
+    if _conn is not None:
+        return _conn
+
+    conn = sqlite3.connect(QUEUE_DB_PATH, timeout=30, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS url_queue (
+            url TEXT PRIMARY KEY,
+            source TEXT NOT NULL,
+            added_at TEXT,
+            status TEXT NOT NULL DEFAULT 'pending',
+            updated_at TEXT
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_url_queue_status ON url_queue(status)")
+    conn.execute("CREATE TABLE IF NOT EXISTS migrations (name TEXT PRIMARY KEY)")
+    conn.commit()
+
+    _migrate_jsonl(conn)
+    _conn = conn
+    return conn
+
+
+def _migrate_jsonl(conn: sqlite3.Connection) -> None:
+    """
+    Import the legacy incoming_urls.jsonl (only once).
+    """
+    name = f"url_queue:{QUEUE_FILE_PATH.name}"
+    if conn.execute("SELECT 1 FROM migrations WHERE name = ?", (name,)).fetchone():
+        return
+
+    rows = []
+    if QUEUE_FILE_PATH.exists():
+        with QUEUE_FILE_PATH.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    item = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Skipping invalid JSON line in queue file.")
+                    continue
+                if item.get("url"):
+                    rows.append((
+                        item["url"],
+                        item.get("source", "web"),
+                        item.get("added_at"),
+                        item.get("status", "pending"),
+                    ))
+
+    with conn:
+        # Later lines carry the latest status for a URL
+        conn.executemany(
+            "INSERT OR REPLACE INTO url_queue (url, source, added_at, status) VALUES (?, ?, ?, ?)",
+            rows
+        )
+        conn.execute("INSERT OR IGNORE INTO migrations (name) VALUES (?)", (name,))
+
+    if rows:
+        logger.info(f"Migrated {len(rows)} queue entries from {QUEUE_FILE_PATH}")
+
+
+@contextmanager
+def _transaction():
+    conn = _connect()
+    with _lock:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat(timespec="seconds") + "Z"
+
 
 def _normalize_source(url: str, explicit_source: str | None = None) -> str:
     """
@@ -29,6 +125,36 @@ def _normalize_source(url: str, explicit_source: str | None = None) -> str:
     return "web"
 
 
+def enqueue_urls(urls: list[str], source: str | None = None) -> list[dict]:
+    """
+    Add many URLs into the queue in one transaction (deduplicated).
+    Returns one record per input URL with status:
+    - pending
+    - duplicate
+    """
+    cleaned = [u.strip() for u in urls]
+    if any(not u for u in cleaned):
+        raise ValueError("URL cannot be empty")
+
+    records: list[dict] = []
+    added_at = _now()
+    with _transaction() as conn:
+        for url in cleaned:
+            src = _normalize_source(url, source)
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO url_queue (url, source, added_at, status) VALUES (?, ?, ?, 'pending')",
+                (url, src, added_at)
+            )
+            if cur.rowcount:
+                records.append({"url": url, "source": src, "added_at": added_at, "status": "pending"})
+            else:
+                records.append({"url": url, "source": src, "added_at": None, "status": "duplicate"})
+
+    added = sum(1 for r in records if r["status"] == "pending")
+    logger.info(f"Enqueued {added} URLs ({len(records) - added} duplicates ignored)")
+    return records
+
+
 def enqueue_url(url: str, source: str | None = None) -> dict:
     """
     Add a URL into the queue (deduplicated).
@@ -40,40 +166,11 @@ def enqueue_url(url: str, source: str | None = None) -> dict:
     if not url:
         raise ValueError("URL cannot be empty")
 
-    src = _normalize_source(url, source)
-
-    # Load existing URLs to avoid duplicates
-    existing_urls = set()
-    if QUEUE_FILE_PATH.exists():
-        with QUEUE_FILE_PATH.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    item = json.loads(line)
-                    existing_urls.add(item.get("url"))
-                except json.JSONDecodeError:
-                    logger.warning("Skipping invalid JSON line in queue file.")
-                    continue
-
-    if url in existing_urls:
+    record = enqueue_urls([url], source)[0]
+    if record["status"] == "duplicate":
         logger.info(f"Duplicate URL ignored: {url}")
-        return {
-            "url": url,
-            "source": src,
-            "added_at": None,
-            "status": "duplicate",
-        }
-
-    record = {
-        "url": url,
-        "source": src,
-        "added_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
-        "status": "pending",  # pending / fetched / failed
-    }
-
-    with QUEUE_FILE_PATH.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record, ensure_ascii=False) + "\n")
-
-    logger.info(f"URL enqueued: {url}")
+    else:
+        logger.info(f"URL enqueued: {url}")
     return record
 
 
@@ -81,20 +178,29 @@ def load_pending_urls() -> list[dict]:
     """
     Load all URLs with status = 'pending'.
     """
-    if not QUEUE_FILE_PATH.exists():
-        return []
+    conn = _connect()
+    with _lock:
+        rows = conn.execute(
+            "SELECT url, source, added_at, status FROM url_queue WHERE status = 'pending' ORDER BY rowid"
+        ).fetchall()
+    return [dict(row) for row in rows]
 
-    items: list[dict] = []
-    with QUEUE_FILE_PATH.open("r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                item = json.loads(line)
-            except json.JSONDecodeError:
-                logger.warning("Skipping invalid JSON line in queue file.")
-                continue
-            if item.get("status") == "pending":
-                items.append(item)
-    return items
+
+def update_url_statuses(statuses: dict[str, str]) -> None:
+    """
+    Commit many status updates ({url: fetched/failed}) in one transaction.
+    """
+    if not statuses:
+        return
+
+    updated_at = _now()
+    with _transaction() as conn:
+        conn.executemany(
+            "UPDATE url_queue SET status = ?, updated_at = ? WHERE url = ?",
+            [(status, updated_at, url) for url, status in statuses.items()]
+        )
+
+    logger.info(f"Updated status for {len(statuses)} URLs")
 
 
 def update_url_status(url: str, status: str) -> None:
@@ -103,23 +209,37 @@ def update_url_status(url: str, status: str) -> None:
     - fetched
     - failed
     """
-    if not QUEUE_FILE_PATH.exists():
-        return
+    update_url_statuses({url: status})
+    logger.info(f"Updated status for {url} → {status}")
+
+
+def export_queue_jsonl(path: Path) -> int:
+    """
+    Write a JSONL snapshot of the whole queue (used for backups).
+    Returns the number of rows written.
+    """
+    conn = _connect()
+    with _lock:
+        rows = conn.execute("SELECT url, source, added_at, status FROM url_queue ORDER BY rowid").fetchall()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(dict(row), ensure_ascii=False) + "\n")
+    return len(rows)
 
-    rows: list[dict] = []
-    with QUEUE_FILE_PATH.open("r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                item = json.loads(line)
-            except json.JSONDecodeError:
-                logger.warning("Skipping invalid JSON line in queue file.")
-                continue
-            if item.get("url") == url:
-                item["status"] = status
-            rows.append(item)
-
-    with QUEUE_FILE_PATH.open("w", encoding="utf-8") as f:
-        for item in rows:
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
-
-    logger.info(f"Updated status for {url} → {status}")
\ No newline at end of file
+
+def delete_urls_before(cutoff: datetime, keep_pending: bool = True) -> int:
+    """
+    Remove queue entries added before cutoff.
+    Entries without a valid added_at timestamp are kept.
+    Returns the number of removed entries.
+    """
+    cutoff_str = cutoff.isoformat(timespec="seconds") + "Z"
+    sql = "DELETE FROM url_queue WHERE added_at IS NOT NULL AND added_at < ?"
+    if keep_pending:
+        sql += " AND status != 'pending'"
+
+    with _transaction() as conn:
+        cur = conn.execute(sql, (cutoff_str,))
+    return cur.rowcount
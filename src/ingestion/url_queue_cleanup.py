@@ -1,16 +1,14 @@
-import json
 from pathlib import Path
 from datetime import datetime, timedelta
-import shutil
 import yaml
 from src.system.logger import setup_logger
 from src.system.config_loader import load_config
+from src.ingestion.url_queue import delete_urls_before, export_queue_jsonl
 
 logger = setup_logger("main")
 
 config = load_config()
 project_root = Path(__file__).resolve().parents[2]
-QUEUE_FILE_PATH = project_root / config["cache"]["incoming_urls_path"]
 QUEUE_FILE_BACKUP_PATH = project_root / config["cache"]["incoming_urls_backup_path"]
 
 
@@ -34,72 +32,30 @@ def load_config() -> dict:
 
 def cleanup_url_queue() -> None:
     """
-    Clean up the URL queue file:
+    Clean up the URL queue:
     - Keep pending entries
     - Keep entries within retention_days
-    - Optionally backup old file
+    - Optionally backup the queue as JSONL before cleaning
     """
-    if not QUEUE_PATH.exists():
-        logger.info("Queue file does not exist, skipping cleanup.")
-        return
-
     config = load_config().get("url_queue", {})
     retention_days = config.get("retention_days", 7)
     keep_pending = config.get("keep_pending", True)
     if_backup = config.get("if_backup", False)
 
-    cutoff = datetime.now() - timedelta(days=retention_days)
-
-    cleaned = []
-    removed = []
+    # added_at is stored in UTC
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
 
     try:
-        with QUEUE_PATH.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    item = json.loads(line)
-                except json.JSONDecodeError:
-                    logger.warning("Skipping invalid JSON line in queue file.")
-                    continue
-
-                ts_raw = item.get("timestamp")
-                status = item.get("status")
-
-                # Always keep pending
-                if keep_pending and status == "pending":
-                    cleaned.append(item)
-                    continue
-
-                # If timestamp missing or invalid → keep
-                if not isinstance(ts_raw, str):
-                    cleaned.append(item)
-                    continue
-                try:
-                    ts = datetime.fromisoformat(ts_raw)
-                except Exception:
-                    cleaned.append(item)
-                    continue
-
-                # Keep recent entries, remove old ones
-                if ts >= cutoff:
-                    cleaned.append(item)
-                else:
-                    removed.append(item)
-
-        # Backup old file if enabled
+        # Backup old queue if enabled
         if if_backup:
             try:
-                shutil.copy(QUEUE_PATH, BACKUP_PATH)
-                logger.info(f"Backup created: {BACKUP_PATH}")
+                count = export_queue_jsonl(QUEUE_FILE_BACKUP_PATH)
+                logger.info(f"Backup created: {QUEUE_FILE_BACKUP_PATH} ({count} entries)")
             except Exception as e:
                 logger.error(f"Failed to create backup: {e}")
 
-        # Write cleaned file
-        with QUEUE_PATH.open("w", encoding="utf-8") as f:
-            for item in cleaned:
-                f.write(json.dumps(item, ensure_ascii=False) + "\n")
-
-        logger.info(f"Cleanup complete: kept {len(cleaned)} entries, removed {len(removed)} entries.")
+        removed = delete_urls_before(cutoff, keep_pending=keep_pending)
+        logger.info(f"Cleanup complete: removed {removed} entries older than {retention_days} days.")
 
     except Exception as e:
-        logger.error(f"Failed to clean up queue file: {e}")
\ No newline at end of file
+        logger.error(f"Failed to clean up queue: {e}")
@@ -1,5 +1,5 @@
 from pathlib import Path
-from src.ingestion.url_queue import enqueue_url
+from src.ingestion.url_queue import enqueue_urls
 from src.system.config_loader import load_config
 from src.system.logger import setup_logger
 
@@ -42,8 +42,8 @@ def read_links_from_file(path: Path = WECHAT_LINKS_PATH) -> list[str]:
 
 def ingest_links_to_queue() -> None:
     """
-    Read all URLs from wechat_links.txt and enqueue them into incoming_urls.jsonl.
-    Duplicate URLs will be ignored by url_queue.enqueue_url().
+    Read all URLs from wechat_links.txt and enqueue them into the URL queue.
+    Duplicate URLs will be ignored by url_queue.enqueue_urls().
     """
     logger.info("Starting WeChat link ingestion...")
 
@@ -52,14 +52,14 @@ def ingest_links_to_queue() -> None:
         logger.info("No valid WeChat article URLs found.")
         return
 
-    for url in links:
-        record = enqueue_url(url, source="wechat")
+    for record in enqueue_urls(links, source="wechat"):
+        url = record["url"]
         if record["status"] == "duplicate":
             logger.info(f"Duplicate (skipped): {url}")
         else:
             logger.info(f"Added to queue: {url}")
 
-    logger.info("All links have been written to incoming_urls.jsonl")
+    logger.info("All links have been written to the URL queue")
 
 
 if __name__ == "__main__":
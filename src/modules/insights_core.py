@@ -1,33 +1,151 @@
 import time
 import json
+import asyncio
+import weakref
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from openai import OpenAI
 from src.system.utils import get_env
 from src.system.logger import setup_logger
+from src.system.config_loader import load_config
+from src.system.cache_manager import LLMResponseCache
+from src.modules.keyword_matcher import KeywordMatcher
+
+if TYPE_CHECKING:
+    from openai import OpenAI, AsyncOpenAI
 
 logger = setup_logger("main")
+config = load_config()
+project_root = Path(__file__).resolve().parents[2]
 
 # ============================================================
 # DeepSeek API client
+# openai / httpx are imported and the clients built on first use, so importing
+# this module neither costs the SDK import nor needs DEEPSEEK_API_KEY.
+# ============================================================
+DEEPSEEK_BASE_URL = "https://api.deepseek.com"
+DEEPSEEK_MODEL = "deepseek-chat"
+DEEPSEEK_TEMPERATURE = 0.3
+
+_ai_cfg = config.get("ai", {})
+
+
+def _http_options() -> dict:
+    """Shared connection pool limits for both sync and async clients."""
+    import httpx
+    return {
+        "limits": httpx.Limits(
+            max_connections=32,
+            max_keepalive_connections=16,
+            keepalive_expiry=60
+        ),
+        "timeout": httpx.Timeout(30, connect=10),
+    }
+
+
+client: "OpenAI | None" = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> "OpenAI":
+    """
+    Return the shared OpenAI client (created on first use).
+    """
+    global client
+    with _client_lock:
+        if client is None:
+            import httpx
+            from openai import OpenAI
+            client = OpenAI(
+                api_key=get_env("DEEPSEEK_API_KEY", required=True),
+                base_url=DEEPSEEK_BASE_URL,
+                timeout=30,
+                http_client=httpx.Client(**_http_options())
+            )
+        return client
+
+
+# AsyncOpenAI pools are bound to the event loop they were created on,
+# so one async client is kept per live event loop.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = weakref.WeakKeyDictionary()
+_async_clients_lock = threading.Lock()
+
+
+def get_async_client() -> "AsyncOpenAI":
+    """
+    Return the AsyncOpenAI client for the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        async_client = _async_clients.get(loop)
+        if async_client is None:
+            import httpx
+            from openai import AsyncOpenAI
+            async_client = AsyncOpenAI(
+                api_key=get_env("DEEPSEEK_API_KEY", required=True),
+                base_url=DEEPSEEK_BASE_URL,
+                timeout=30,
+                http_client=httpx.AsyncClient(**_http_options())
+            )
+            _async_clients[loop] = async_client
+        return async_client
+
+
+async def aclose_async_client() -> None:
+    """
+    Close the running loop's client and its connections. Call at the end of
+    the coroutine passed to asyncio.run(): once that loop is closed, the pool
+    can no longer be shut down cleanly ("Event loop is closed" at teardown).
+    """
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        async_client = _async_clients.pop(loop, None)
+    if async_client is not None:
+        await async_client.close()
+
+
 # ============================================================
-client = OpenAI(
-    api_key=get_env("DEEPSEEK_API_KEY", required=True),
-    base_url="https://api.deepseek.com",
-    timeout=30
-)
+# Persistent LLM response cache (content-addressed, shared across days)
+# Opened on first lookup.
+# ============================================================
+_cache_cfg = config.get("cache", {})
+_llm_cache: LLMResponseCache | None = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache | None:
+    """
+    Return the LLM response cache, or None when cache.llm_cache_enabled is false.
+    """
+    global _llm_cache
+    if not _cache_cfg.get("llm_cache_enabled", True):
+        return None
+    with _llm_cache_lock:
+        if _llm_cache is None:
+            _llm_cache = LLMResponseCache(
+                project_root / _cache_cfg.get("llm_cache_path", "src/data/news_ai/llm_cache.sqlite3"),
+                ttl_days=_cache_cfg.get("llm_cache_ttl_days", 30),
+                max_entries=_cache_cfg.get("llm_cache_max_entries", 5000),
+                logger=logger
+            )
+        return _llm_cache
 
 
-def safe_request(prompt: str):
+def safe_request(prompt: str, timeout: float | None = None):
     """
     Wrapper for DeepSeek API with automatic retries.
+    :param timeout: Optional per-request timeout in seconds (overrides client default)
     """
+    options = {"timeout": timeout} if timeout else {}
     for attempt in range(3):
         try:
-            return client.chat.completions.create(
-                model="deepseek-chat",
+            return get_client().chat.completions.create(
+                model=DEEPSEEK_MODEL,
                 messages=[{"role": "user", "content": prompt}],
-                temperature=0.3
+                temperature=DEEPSEEK_TEMPERATURE,
+                **options
             )
         except Exception as e:
             logger.warning(f"DeepSeek API request failed (attempt {attempt+1}): {e}")
@@ -35,6 +153,89 @@ def safe_request(prompt: str):
     logger.error("DeepSeek API failed after 3 retries")
     raise RuntimeError("DeepSeek API failed after 3 retries")
 
+
+async def asafe_request(prompt: str, timeout: float | None = None, max_tokens: int | None = None):
+    """
+    Async version of safe_request, using the shared AsyncOpenAI client.
+    :param max_tokens: Optional cap on the completion length
+    """
+    options = {"timeout": timeout} if timeout else {}
+    if max_tokens:
+        options["max_tokens"] = max_tokens
+    for attempt in range(3):
+        try:
+            return await get_async_client().chat.completions.create(
+                model=DEEPSEEK_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=DEEPSEEK_TEMPERATURE,
+                **options
+            )
+        except Exception as e:
+            logger.warning(f"DeepSeek API request failed (attempt {attempt+1}): {e}")
+            await asyncio.sleep(2)
+    logger.error("DeepSeek API failed after 3 retries")
+    raise RuntimeError("DeepSeek API failed after 3 retries")
+
+def _is_json(raw: str) -> bool:
+    try:
+        json.loads(raw)
+        return True
+    except Exception:
+        return False
+
+
+def _cache_lookup(prompt: str):
+    llm_cache = get_llm_cache()
+    if llm_cache is None:
+        return None, None
+    key = LLMResponseCache.make_key(DEEPSEEK_MODEL, DEEPSEEK_TEMPERATURE, prompt)
+    return key, llm_cache.get(key)
+
+
+def _cache_store(key: str | None, raw: str) -> None:
+    # Only keep parseable outputs, so a bad answer is retried on the next run
+    if key and _is_json(raw):
+        get_llm_cache().put(key, raw, model=DEEPSEEK_MODEL)
+
+
+def cached_request(prompt: str, timeout: float | None = None, cacheable: bool = True) -> str:
+    """
+    Return the raw model output for a prompt, served from llm_cache when possible.
+    Falls through to safe_request (with retries) on a cache miss.
+    """
+    key, raw = _cache_lookup(prompt) if cacheable else (None, None)
+    if raw is not None:
+        return raw
+
+    resp = safe_request(prompt, timeout=timeout)
+    raw = resp.choices[0].message.content
+    _cache_store(key, raw)
+    return raw
+
+
+async def acached_request(prompt: str, timeout: float | None = None, cacheable: bool = True) -> str:
+    """
+    Async version of cached_request.
+    """
+    key, raw = _cache_lookup(prompt) if cacheable else (None, None)
+    if raw is not None:
+        return raw
+
+    resp = await asafe_request(prompt, timeout=timeout)
+    raw = resp.choices[0].message.content
+    _cache_store(key, raw)
+    return raw
+
+
+def llm_cache_stats() -> dict:
+    """
+    Hit/miss counters of the persistent LLM cache for this process.
+    """
+    if _llm_cache is None:
+        return {"hits": 0, "misses": 0, "hit_rate": 0.0}
+    return _llm_cache.stats()
+
+
 def load_prompt(name: str) -> str:
     """
     Load prompt file from src/prompts/{name}.txt
@@ -53,10 +254,10 @@ def load_prompt(name: str) -> str:
 # ============================================================
 # 1) News Summary (structured JSON)
 # ============================================================
-def summarize_article(article: dict) -> dict:
+def _build_summary_prompt(article: dict) -> tuple[str, str, str]:
     """
-    Input: {"summary": "..."}
-    Output: JSON dict (rendered into HTML later)
+    Render the summarize_article prompt.
+    Returns (prompt, link, pub_date) so the fallback can reuse them.
     """
     prompt = load_prompt("summarize_article")
     prompt = prompt.replace("{summary}", article.get("summary", ""))
@@ -69,10 +270,10 @@ def summarize_article(article: dict) -> dict:
 
     prompt = prompt.replace("{link}", str(link))
     prompt = prompt.replace("{pub_date}", str(pub_date))
+    return prompt, link, pub_date
 
-    resp = safe_request(prompt)
-    raw = resp.choices[0].message.content
 
+def _parse_summary(raw: str, article: dict, link: str, pub_date: str) -> dict:
     try:
         return json.loads(raw)
     except Exception as e:
@@ -93,20 +294,281 @@ def summarize_article(article: dict) -> dict:
         }
 
 
+def summarize_article(article: dict, timeout: float | None = None) -> dict:
+    """
+    Input: {"summary": "..."}
+    Output: JSON dict (rendered into HTML later)
+    """
+    prompt, link, pub_date = _build_summary_prompt(article)
+
+    raw = cached_request(prompt, timeout=timeout)
+    return _parse_summary(raw, article, link, pub_date)
+
+
+async def asummarize_article(article: dict, timeout: float | None = None) -> dict:
+    """
+    Async version of summarize_article.
+    """
+    prompt, link, pub_date = _build_summary_prompt(article)
+
+    raw = await acached_request(prompt, timeout=timeout)
+    return _parse_summary(raw, article, link, pub_date)
+
+
+def summarize_articles(articles: list[dict], max_workers: int = 4,
+                       timeout: float | None = None) -> list[dict]:
+    """
+    Summarize many articles concurrently with a bounded worker pool.
+    Each call goes through safe_request (retries included).
+    :param articles: List of article dicts accepted by summarize_article
+    :param max_workers: Maximum number of in-flight DeepSeek requests
+    :param timeout: Optional per-request timeout in seconds
+    :return: List of JSON dicts, in the same order as the input
+    """
+    if not articles:
+        return []
+
+    workers = max(1, min(max_workers, len(articles)))
+    logger.info(f"Summarizing {len(articles)} articles with {workers} workers...")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="summarize") as pool:
+        results = list(pool.map(lambda a: summarize_article(a, timeout=timeout), articles))
+
+    logger.info(f"Summarized {len(results)} articles in {time.perf_counter() - start:.2f}s")
+    return results
+
+
+async def asummarize_articles(articles: list[dict], max_concurrency: int = 4,
+                              timeout: float | None = None, batch: bool | None = None) -> list[dict]:
+    """
+    Async version of summarize_articles, bounded by a semaphore.
+    :param batch: Pack several articles per request (asummarize_articles_batched);
+                  defaults to ai.batch_mode
+    :return: List of JSON dicts, in the same order as the input
+    """
+    if not articles:
+        return []
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _bounded(article: dict) -> dict:
+        async with semaphore:
+            return await asummarize_article(article, timeout=timeout)
+
+    if _ai_cfg.get("batch_mode", False) if batch is None else batch:
+        return await asummarize_articles_batched(articles, max_concurrency=max_concurrency, timeout=timeout)
+
+    logger.info(f"Summarizing {len(articles)} articles (async, concurrency={max_concurrency})...")
+    start = time.perf_counter()
+    results = await asyncio.gather(*(_bounded(a) for a in articles))
+    logger.info(f"Summarized {len(results)} articles in {time.perf_counter() - start:.2f}s")
+    return list(results)
+
+
 # ============================================================
-# 2) Price Impact Analysis (structured JSON)
+# 1b) Batched News Summary
+# Several articles per request: the instruction prompt is paid once per
+# batch instead of once per article. Batches are packed to a token budget,
+# each element of the returned JSON array is validated on its own and an
+# article whose element is missing or invalid gets a single-article call.
 # ============================================================
-def analyze_price_impact(price_list: list[dict]) -> dict:
+BATCH_MAX_ARTICLES = _ai_cfg.get("batch_max_articles", 12)
+BATCH_INPUT_TOKENS = _ai_cfg.get("batch_input_tokens", 12000)
+BATCH_OUTPUT_TOKENS = _ai_cfg.get("batch_output_tokens", 7000)
+BATCH_OUTPUT_TOKENS_PER_ARTICLE = _ai_cfg.get("batch_output_tokens_per_article", 500)
+
+SUMMARY_FIELDS = ("title", "source", "link", "pub_date", "region", "cn_summary", "en_summary",
+                  "cn_insights", "en_insights", "supply_chain", "nigeria_impact", "recommendation")
+SUMMARY_REGIONS = ("china", "nigeria", "global")
+
+
+def estimate_tokens(text: str) -> int:
     """
-    Input: price_list
-    Output: JSON dict (rendered into HTML later)
+    Rough token count without a tokenizer: about one token per CJK
+    character and per four other characters. Errs on the high side.
+    """
+    cjk = sum(1 for ch in text if "\u4e00" <= ch <= "\u9fff")
+    return cjk + (len(text) - cjk) // 4 + 1
+
+
+def _batch_item(article_id: str, article: dict) -> dict:
+    _, link, pub_date = _build_summary_prompt(article)
+    return {
+        "id": article_id,
+        "summary": article.get("summary", ""),
+        "source": article.get("source", "Unknown"),
+        "link": str(link),
+        "pub_date": str(pub_date),
+    }
+
+
+def pack_batches(items: list[dict], max_articles: int = BATCH_MAX_ARTICLES,
+                 input_tokens: int = BATCH_INPUT_TOKENS, output_tokens: int = BATCH_OUTPUT_TOKENS,
+                 output_per_article: int = BATCH_OUTPUT_TOKENS_PER_ARTICLE) -> list[list[dict]]:
+    """
+    Greedily group batch items (in order) so each request stays within the
+    input budget (instruction + articles) and its expected output within the
+    output budget. An article larger than the budget gets a batch of its own.
+    """
+    overhead = estimate_tokens(load_prompt("summarize_articles_batch"))
+    per_batch = max(1, min(max_articles, output_tokens // max(1, output_per_article)))
+
+    batches, current, used = [], [], overhead
+    for item in items:
+        cost = estimate_tokens(json.dumps(item, ensure_ascii=False))
+        if current and (len(current) >= per_batch or used + cost > input_tokens):
+            batches.append(current)
+            current, used = [], overhead
+        current.append(item)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _valid_summary(element) -> bool:
+    return (
+        isinstance(element, dict)
+        and all(field in element for field in SUMMARY_FIELDS)
+        and element.get("region") in SUMMARY_REGIONS
+        and isinstance(element.get("cn_insights"), list)
+        and isinstance(element.get("en_insights"), list)
+    )
+
+
+def parse_batch_response(raw: str, ids) -> dict[str, dict]:
+    """
+    Split a batch answer into {id: summary} for the valid elements.
+    Elements are decoded one at a time, so a malformed or truncated element
+    only loses that element; unknown or duplicate ids are ignored.
+    """
+    wanted, results = set(ids), {}
+    start = raw.find("[")
+    if start < 0:
+        return results
+
+    decoder = json.JSONDecoder()
+    pos = start + 1
+    while pos < len(raw):
+        # Skip separators / whitespace up to the next element
+        while pos < len(raw) and raw[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(raw) or raw[pos] == "]":
+            break
+        try:
+            element, pos = decoder.raw_decode(raw, pos)
+        except json.JSONDecodeError:
+            # Resume at the next object; a broken element is simply dropped
+            next_obj = raw.find("{", pos + 1)
+            if next_obj < 0:
+                break
+            pos = next_obj
+            continue
+        element_id = str(element.get("id")) if isinstance(element, dict) else None
+        if element_id in wanted and element_id not in results and _valid_summary(element):
+            results[element_id] = {k: v for k, v in element.items() if k != "id"}
+    return results
+
+
+async def _asummarize_batch(batch: list[dict], timeout: float | None, stats: dict) -> tuple[dict[str, dict], bool]:
+    """One batch request: ({id: summary} of the valid elements, whether the answer was cut off)"""
+    prompt = load_prompt("summarize_articles_batch").replace(
+        "{articles}", json.dumps(batch, ensure_ascii=False, indent=1)
+    )
+    max_tokens = min(BATCH_OUTPUT_TOKENS, len(batch) * BATCH_OUTPUT_TOKENS_PER_ARTICLE * 2)
+    try:
+        resp = await asafe_request(prompt, timeout=timeout, max_tokens=max_tokens)
+    except Exception as e:
+        logger.warning(f"Batch summarize request failed ({len(batch)} articles): {e}")
+        return {}, False
+    stats["requests"] += 1
+
+    choice = resp.choices[0]
+    results = parse_batch_response(choice.message.content or "", [item["id"] for item in batch])
+    truncated = getattr(choice, "finish_reason", None) == "length"
+    stats["truncated"] += truncated
+    return results, truncated
+
+
+async def asummarize_articles_batched(articles: list[dict], max_concurrency: int = 4,
+                                      timeout: float | None = None) -> list[dict]:
     """
+    Batch mode of asummarize_articles.
+    - Articles with a cached single-article answer are served from llm_cache
+    - The rest are packed into batches (pack_batches) and sent concurrently
+    - Every valid element is cached under its single-article prompt, so later
+      runs hit the cache no matter how the batches are composed
+    - A batch cut off at the output limit is retried in halves;
+      articles still missing afterwards get a single-article call
+    :return: List of JSON dicts, in the same order as the input
+    """
+    if not articles:
+        return []
+
+    start = time.perf_counter()
+    stats = {"cached": 0, "requests": 0, "truncated": 0, "fallback": 0}
+    results: list[dict | None] = [None] * len(articles)
+    pending = {}
+    for i, article in enumerate(articles):
+        prompt, link, pub_date = _build_summary_prompt(article)
+        key, raw = _cache_lookup(prompt)
+        if raw is not None:
+            results[i] = _parse_summary(raw, article, link, pub_date)
+            stats["cached"] += 1
+        else:
+            pending[str(i)] = key
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _run(batch: list[dict]) -> dict[str, dict]:
+        async with semaphore:
+            found, truncated = await _asummarize_batch(batch, timeout, stats)
+        missing = [item for item in batch if item["id"] not in found]
+        if truncated and len(missing) > 1:
+            # The answer hit the output limit: send the rest again in two smaller batches
+            half = (len(missing) + 1) // 2
+            for part in (missing[:half], missing[half:]):
+                found.update(await _run(part))
+        return found
+
+    items = [_batch_item(i, articles[int(i)]) for i in pending]
+    batches = pack_batches(items)
+    done: dict[str, dict] = {}
+    for found in await asyncio.gather(*(_run(b) for b in batches)):
+        done.update(found)
+
+    async def _single(i: int) -> dict:
+        async with semaphore:
+            return await asummarize_article(articles[i], timeout=timeout)
+
+    fallback = [int(i) for i in pending if i not in done]
+    stats["fallback"] = len(fallback)
+    for i, summary in zip(fallback, await asyncio.gather(*(_single(i) for i in fallback))):
+        results[i] = summary
+
+    for i, summary in done.items():
+        results[int(i)] = summary
+        _cache_store(pending[i], json.dumps(summary, ensure_ascii=False))
+
+    logger.info(
+        f"Summarized {len(articles)} articles in {time.perf_counter() - start:.2f}s: "
+        f"{stats['cached']} cached, {len(items)} in {len(batches)} batches "
+        f"({stats['requests']} requests, {stats['truncated']} truncated), "
+        f"{stats['fallback']} single-article fallbacks"
+    )
+    return results
+
+
+# ============================================================
+# 2) Price Impact Analysis (structured JSON)
+# ============================================================
+def _build_price_prompt(price_list: list[dict]) -> str:
     prompt = load_prompt("analyze_price_impact")
-    prompt = prompt.replace("{price_list}", json.dumps(price_list, ensure_ascii=False))
+    return prompt.replace("{price_list}", json.dumps(price_list, ensure_ascii=False))
 
-    resp = safe_request(prompt)
-    raw = resp.choices[0].message.content
 
+def _parse_price_impact(raw: str) -> dict:
     try:
         return json.loads(raw)
     except Exception as e:
@@ -122,18 +584,27 @@ def analyze_price_impact(price_list: list[dict]) -> dict:
         }
 
 
-# ============================================================
-# 3) Daily Insight (structured JSON)
-# ============================================================
-def generate_daily_insight() -> dict:
+def analyze_price_impact(price_list: list[dict]) -> dict:
     """
+    Input: price_list
     Output: JSON dict (rendered into HTML later)
     """
-    prompt = load_prompt("daily_insight")
+    raw = cached_request(_build_price_prompt(price_list))
+    return _parse_price_impact(raw)
+
+
+async def aanalyze_price_impact(price_list: list[dict]) -> dict:
+    """
+    Async version of analyze_price_impact.
+    """
+    raw = await acached_request(_build_price_prompt(price_list))
+    return _parse_price_impact(raw)
 
-    resp = safe_request(prompt)
-    raw = resp.choices[0].message.content
 
+# ============================================================
+# 3) Daily Insight (structured JSON)
+# ============================================================
+def _parse_daily_insight(raw: str) -> dict:
     try:
         return json.loads(raw)
     except Exception as e:
@@ -146,6 +617,24 @@ def generate_daily_insight() -> dict:
         }
 
 
+def generate_daily_insight() -> dict:
+    """
+    Output: JSON dict (rendered into HTML later)
+    The prompt carries no date, so it bypasses the cross-day LLM cache
+    (DailyCache still covers same-day reruns).
+    """
+    raw = cached_request(load_prompt("daily_insight"), cacheable=False)
+    return _parse_daily_insight(raw)
+
+
+async def agenerate_daily_insight() -> dict:
+    """
+    Async version of generate_daily_insight.
+    """
+    raw = await acached_request(load_prompt("daily_insight"), cacheable=False)
+    return _parse_daily_insight(raw)
+
+
 # ============================================================
 # 4) Safe AI Summary
 # ============================================================
@@ -169,24 +658,44 @@ def safe_ai_summary(text: str) -> str:
 # ============================================================
 # 5) Industry Detection
 # ============================================================
+# Checked in this order: the first industry with a keyword in the text wins
+INDUSTRY_KEYWORDS = {
+    "pv": ["硅料", "硅片", "组件", "光伏", "n型", "p型", "电池片"],
+    "bess": ["储能", "bess", "电池", "并网", "系统集成"],
+    "inverter": ["逆变器", "inverter", "mppt", "效率"],
+    "power": ["电价", "tariff", "nerc", "ferc", "电力市场"],
+    "overseas": ["europe", "us", "germany", "uk", "海外", "出口"],
+}
+INDUSTRY_MATCHER = KeywordMatcher(INDUSTRY_KEYWORDS)
+
+
+def _industry_from_matches(found: dict) -> str:
+    if found:
+        for industry in INDUSTRY_KEYWORDS:
+            if industry in found:
+                return industry
+    return "general"
+
+
 def detect_industry(text: str) -> str:
     """
     Simple industry detection based on keywords.
     """
-    t = text.lower()
+    return _industry_from_matches(INDUSTRY_MATCHER.find(text))
 
-    if any(k in t for k in ["硅料", "硅片", "组件", "光伏", "n型", "p型", "电池片"]):
-        return "pv"
-    if any(k in t for k in ["储能", "bess", "电池", "并网", "系统集成"]):
-        return "bess"
-    if any(k in t for k in ["逆变器", "inverter", "mppt", "效率"]):
-        return "inverter"
-    if any(k in t for k in ["电价", "tariff", "nerc", "ferc", "电力市场"]):
-        return "power"
-    if any(k in t for k in ["europe", "us", "germany", "uk", "海外", "出口"]):
-        return "overseas"
 
-    return "general"
+def industry_scores(text: str) -> dict[str, int]:
+    """Keyword occurrences per industry, for every industry in INDUSTRY_KEYWORDS."""
+    return INDUSTRY_MATCHER.scores(text)
+
+
+def industry_scores_many(texts: list[str]) -> list[dict[str, int]]:
+    return INDUSTRY_MATCHER.scores_many(texts)
+
+
+def detect_industries(texts: list[str]) -> list[str]:
+    """detect_industry for a list of texts, scanned in one pass."""
+    return [_industry_from_matches(found) for found in INDUSTRY_MATCHER.find_many(texts)]
 
 
 # ============================================================
@@ -0,0 +1,112 @@
+import re
+from bisect import bisect_right
+from itertools import accumulate
+
+
+# ============================================================
+# Compiled multi-keyword matcher
+# All keywords of a {label: [keywords]} table are compiled into one regex,
+# so a text is scanned once (in C) instead of once per keyword.
+# The alternation is built as a trie ("电(?:池(?:片)?|价)"): at each position only
+# the branches for the next character are tried, and the longest keyword
+# starting there is found first. Shorter keywords that are prefixes of it
+# are added from a table, and the next search starts one character after the
+# match, so every occurrence of every keyword is reported, overlapping ones
+# included (the same result as testing `kw in text` for each keyword).
+# ============================================================
+class KeywordMatcher:
+    """
+    Case-insensitive substring matcher over a {label: [keywords]} table.
+    A keyword may be listed under several labels.
+    """
+
+    def __init__(self, table: dict[str, list[str]]):
+        self.labels = list(table)
+        self.labels_of: dict[str, list[str]] = {}
+        for label, keywords in table.items():
+            for kw in keywords:
+                kw = kw.lower()
+                if kw and label not in self.labels_of.setdefault(kw, []):
+                    self.labels_of[kw].append(label)
+
+        # keyword -> itself and every shorter keyword it starts with
+        self._prefixes = {
+            kw: [kw[:i] for i in range(1, len(kw) + 1) if kw[:i] in self.labels_of]
+            for kw in self.labels_of
+        }
+        self.pattern = re.compile(self._trie_pattern()) if self.labels_of else None
+
+    def _trie_pattern(self) -> str:
+        trie: dict = {}
+        for kw in self.labels_of:
+            node = trie
+            for ch in kw:
+                node = node.setdefault(ch, {})
+            node[""] = True
+
+        def build(node: dict) -> str:
+            branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+            if "" in node:
+                # A keyword ends here; the greedy "?" still tries the longer ones first
+                return f"(?:{body})?"
+            return body
+
+        return build(trie)
+
+    def _hits(self, text: str) -> list[tuple[int, str]]:
+        """(position, keyword) of every keyword occurrence in lower-cased text."""
+        hits = []
+        search, prefixes = self.pattern.search, self._prefixes
+        m = search(text)
+        while m:
+            start = m.start()
+            hits.extend((start, kw) for kw in prefixes[m.group()])
+            m = search(text, start + 1)
+        return hits
+
+    def find(self, text: str) -> dict[str, list[str]]:
+        """{label: [matched keywords, one entry per occurrence]} for the labels that matched."""
+        found: dict[str, list[str]] = {}
+        if self.pattern is None or not text:
+            return found
+        for _, kw in self._hits(text.lower()):
+            for label in self.labels_of[kw]:
+                found.setdefault(label, []).append(kw)
+        return found
+
+    def scores(self, text: str) -> dict[str, int]:
+        """Number of keyword occurrences for every label (0 when none matched)."""
+        found = self.find(text)
+        return {label: len(found.get(label, ())) for label in self.labels}
+
+    def find_many(self, texts: list[str]) -> list[dict[str, list[str]]]:
+        """
+        find() for a list of texts with a single scan: the texts are joined
+        with a separator no keyword contains, and hits are mapped back by offset.
+        """
+        results: list[dict[str, list[str]]] = [{} for _ in texts]
+        if self.pattern is None or not texts:
+            return results
+
+        texts = [text or "" for text in texts]
+        joined = "\x00".join(texts)
+        lowered = joined.lower()
+        if len(lowered) != len(joined):
+            # lower() changed some text's length: measure the lower-cased texts instead
+            texts = [text.lower() for text in texts]
+            lowered = "\x00".join(texts)
+
+        starts = list(accumulate((len(text) + 1 for text in texts[:-1]), initial=0))
+
+        labels_of = self.labels_of
+        for pos, kw in self._hits(lowered):
+            found = results[bisect_right(starts, pos) - 1]
+            for label in labels_of[kw]:
+                found.setdefault(label, []).append(kw)
+        return results
+
+    def scores_many(self, texts: list[str]) -> list[dict[str, int]]:
+        return [{label: len(found.get(label, ())) for label in self.labels} for found in self.find_many(texts)]
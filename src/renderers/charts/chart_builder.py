@@ -1,78 +1,276 @@
-import matplotlib.pyplot as plt
-import pandas as pd
 import os
+import json
+import math
+import shutil
+import hashlib
 import datetime
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from src.system.config_loader import load_config
 from src.system.logger import setup_logger
+from src.ingestion.save_price_history import get_price_store
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 config = load_config()
 charts_dir = Path(config["paths"]["charts_dir"]).resolve()
 
+charts_cfg = config.get("charts", {})
+CHART_MAX_WORKERS = charts_cfg.get("max_workers", 4)
+
+# Bump when the plotting code changes, so unchanged data is still re-rendered once
+CHART_STYLE_VERSION = 1
+FINGERPRINT_FILE = "chart_fingerprints.json"
+
 logger = setup_logger("main")
 
 
-def build_price_chart(history_file: str, output_path: str | None = None) -> str | None:
+@dataclass(frozen=True)
+class ChartVariant:
+    name: str
+    days: int | None = None  # None = full history
+    panels: bool = False     # one subplot per item instead of one shared axis
+
+    @property
+    def title(self) -> str:
+        window = f"Last {self.days} Days" if self.days else "Historical"
+        return f"{window} Price Trends" + (" by Item" if self.panels else "")
+
+
+DEFAULT_VARIANTS = [
+    ChartVariant("panels", panels=True),
+    ChartVariant("30d", days=30),
+    ChartVariant("90d", days=90),
+    ChartVariant("365d", days=365),
+]
+
+
+# ============================================================
+# Data + fingerprint
+# ============================================================
+def _pyplot():
+    """matplotlib is imported on first render, always with the headless Agg backend."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def load_price_pivot(history_file: str, until: str | None = None) -> "pd.DataFrame":
+    """
+    Price history as a date x item table (NaN where an item has no price that day).
+    :param until: Last date to include (ISO string); None = everything
+    """
+    import pandas as pd
+
+    series = get_price_store(history_file).get_range(end=until)
+    if not series:
+        return pd.DataFrame()
+    return pd.concat(
+        {item: pd.Series(values, index=pd.DatetimeIndex(dates)) for item, (dates, values) in series.items()},
+        axis=1
+    ).sort_index()
+
+
+def _window(pivot: "pd.DataFrame", days: int | None) -> "pd.DataFrame":
+    import pandas as pd
+
+    if not days or pivot.empty:
+        return pivot
+    cutoff = pivot.index.max() - pd.Timedelta(days=days - 1)
+    return pivot[pivot.index >= cutoff].dropna(axis=1, how="all")
+
+
+def fingerprint(pivot: "pd.DataFrame", variant: ChartVariant) -> str:
+    h = hashlib.sha256()
+    h.update(json.dumps([CHART_STYLE_VERSION, asdict(variant)]).encode("utf-8"))
+    h.update("\x1f".join(map(str, pivot.columns)).encode("utf-8"))
+    h.update(pivot.index.asi8.tobytes())
+    h.update(pivot.to_numpy(dtype="float64").tobytes())
+    return h.hexdigest()
+
+
+def _load_fingerprints(output_dir: Path) -> dict:
+    try:
+        return json.loads((output_dir / FINGERPRINT_FILE).read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+
+def _save_fingerprints(output_dir: Path, fingerprints: dict) -> None:
+    path = output_dir / FINGERPRINT_FILE
+    # Per-process temp name: backfill workers may save at the same time
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(fingerprints, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _reuse(previous: dict | None, fp: str, output_path: Path) -> bool:
+    """
+    True when the same input was already rendered; copies the earlier image
+    to output_path if it was written under another name (e.g. yesterday's date).
+    """
+    if not previous or previous.get("fingerprint") != fp:
+        return False
+    previous_path = Path(previous.get("path", ""))
+    if not previous_path.exists():
+        return False
+    if previous_path.resolve() != output_path.resolve():
+        shutil.copyfile(previous_path, output_path)
+    return True
+
+
+# ============================================================
+# Rendering
+# ============================================================
+def _render(pivot: "pd.DataFrame", output_path: str, title: str, panels: bool = False) -> str:
+    """
+    Draw one chart from a date x item pivot. Runs in worker processes too,
+    so it only touches its arguments.
+    """
+    plt = _pyplot()
+    if panels:
+        ncols = 2 if len(pivot.columns) > 1 else 1
+        nrows = math.ceil(len(pivot.columns) / ncols)
+        fig, axes = plt.subplots(nrows, ncols, figsize=(10, 2.5 * nrows + 1), sharex=True, squeeze=False)
+        for ax, item in zip(axes.flat, pivot.columns):
+            col = pivot[item].dropna()
+            ax.plot(col.index, col.to_numpy())
+            ax.set_title(str(item), fontsize=9)
+        n = len(pivot.columns)
+        for i, ax in enumerate(axes.flat):
+            if i >= n:
+                ax.set_visible(False)
+            elif i + ncols >= n:
+                # Bottom panel of its column: show the shared date axis
+                ax.tick_params(axis="x", labelbottom=True, labelrotation=45)
+        fig.suptitle(title)
+    else:
+        fig, ax = plt.subplots(figsize=(10, 5))
+        for item in pivot.columns:
+            col = pivot[item].dropna()
+            ax.plot(col.index, col.to_numpy(), label=item)
+        ax.set_title(title)
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Price")
+        ax.tick_params(axis="x", labelrotation=45)
+        ax.legend()
+
+    fig.tight_layout()
+    fig.savefig(output_path)
+    plt.close(fig)
+    return output_path
+
+
+def build_price_chart(history_file: str, output_path: str | None = None,
+                      variant: ChartVariant | None = None, force: bool = False,
+                      until: str | None = None) -> str | None:
     """
     Build historical price line chart.
-    :param history_file: Path to CSV file containing price history
+    Skips rendering when the input series are unchanged since the last render
+    (the earlier image is reused).
+    :param history_file: Configured price history file (read through the price history store)
     :param output_path: Optional path to save chart image. If None, auto-generate under src/runtime_output/charts
+    :param variant: Window / layout; defaults to the full history on one axis
+    :param force: Render even if the fingerprint matches
+    :param until: Only use prices up to this date (for charts of past days)
     :return: Path to generated chart file, or None if skipped
     """
+    variant = variant or ChartVariant("main")
     try:
-        # Check file existence and non-empty
-        if not os.path.exists(history_file) or os.path.getsize(history_file) == 0:
-            logger.warning("History price file is missing or empty, skip chart generation.")
-            return None
-
-        df = pd.read_csv(history_file)
+        pivot = _window(load_price_pivot(history_file, until), variant.days)
 
-        # Check empty dataframe
-        if df.empty:
+        # Check empty history
+        if pivot.empty:
             logger.warning("History price data is empty, skip chart generation.")
             return None
 
-        # Check required columns
-        required_cols = {"item", "date", "price"}
-        if not required_cols.issubset(df.columns):
-            logger.warning("History price file format invalid, skip chart generation.")
-            return None
-
-        # Ensure date column is datetime
-        try:
-            df["date"] = pd.to_datetime(df["date"])
-        except Exception:
-            logger.warning("Failed to parse 'date' column, using raw values.")
-
-        # Plot chart
-        plt.figure(figsize=(10, 5))
-        for item in df["item"].unique():
-            sub = df[df["item"] == item]
-            plt.plot(sub["date"], sub["price"], label=item)
-
-        plt.title("Historical Price Trends")
-        plt.xlabel("Date")
-        plt.ylabel("Price")
-        plt.xticks(rotation=45)
-        plt.legend()
-        plt.tight_layout()
-
         # Determine output path
         if output_path is None:
             date_str = datetime.date.today().isoformat()
             output_path = charts_dir / f"price_chart_{date_str}.png"
-        else:
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            output_path = Path(output_path).resolve()
+        output_path = Path(output_path).resolve()
+        os.makedirs(output_path.parent, exist_ok=True)
 
-        # Save chart
-        plt.savefig(output_path)
-        plt.close()
+        fingerprints = _load_fingerprints(output_path.parent)
+        fp = fingerprint(pivot, variant)
+        if not force and _reuse(fingerprints.get(variant.name), fp, output_path):
+            logger.info(f"Price data unchanged, reusing chart: {output_path}")
+            return str(output_path)
+
+        _render(pivot, str(output_path), variant.title, variant.panels)
+        fingerprints[variant.name] = {"fingerprint": fp, "path": str(output_path)}
+        _save_fingerprints(output_path.parent, fingerprints)
 
         logger.info(f"Price chart generated: {output_path}")
         return str(output_path)
 
     except Exception as e:
         logger.error(f"Failed to generate price chart: {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+def build_chart_variants(history_file: str, output_dir: str, date_str: str,
+                         variants: list[ChartVariant] | None = None,
+                         max_workers: int | None = None, force: bool = False,
+                         until: str | None = None) -> dict[str, str]:
+    """
+    Render several chart variants (windows, per-item panels) as
+    <output_dir>/price_chart_<date>_<variant>.png.
+    The history is loaded once; unchanged variants are reused and the rest
+    are rendered in a process pool.
+    :return: {variant name: image path}
+    """
+    variants = variants or DEFAULT_VARIANTS
+    output_dir = Path(output_dir).resolve()
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    pivot = load_price_pivot(history_file, until)
+    if pivot.empty:
+        logger.warning("History price data is empty, skip chart variants.")
+        return {}
+
+    fingerprints = _load_fingerprints(output_dir)
+    paths, jobs = {}, {}
+    for variant in variants:
+        path = output_dir / f"price_chart_{date_str}_{variant.name}.png"
+        window = _window(pivot, variant.days)
+        if window.empty:
+            continue
+        fp = fingerprint(window, variant)
+        if not force and _reuse(fingerprints.get(variant.name), fp, path):
+            paths[variant.name] = str(path)
+            continue
+        jobs[variant.name] = (window, str(path), variant.title, variant.panels)
+        fingerprints[variant.name] = {"fingerprint": fp, "path": str(path)}
+
+    workers = min(len(jobs), max_workers or CHART_MAX_WORKERS, os.cpu_count() or 1)
+    if workers <= 1:
+        # Not worth a worker process start-up (matplotlib import ≈ 0.5s)
+        for name, args in jobs.items():
+            try:
+                paths[name] = _render(*args)
+            except Exception as e:
+                logger.error(f"Failed to render chart variant {name}: {e}")
+                fingerprints.pop(name, None)
+    else:
+        # spawn: the caller may be running other threads, which fork does not mix with
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            futures = {name: pool.submit(_render, *args) for name, args in jobs.items()}
+            for name, future in futures.items():
+                try:
+                    paths[name] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to render chart variant {name}: {e}")
+                    fingerprints.pop(name, None)
+
+    _save_fingerprints(output_dir, fingerprints)
+    rendered = sum(name in paths for name in jobs)
+    logger.info(f"Chart variants: {rendered} rendered, {len(paths) - rendered} reused")
+    return paths
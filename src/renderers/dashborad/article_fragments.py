@@ -0,0 +1,108 @@
+import json
+import time
+import inspect
+import hashlib
+import threading
+from pathlib import Path
+
+from src.renderers.dashborad import article_renderer
+from src.system.cache_manager import FragmentCache
+from src.system.config_loader import load_config
+from src.system.logger import setup_logger
+
+logger = setup_logger("main")
+config = load_config()
+project_root = Path(__file__).resolve().parents[3]
+
+_cache_cfg = config.get("cache", {})
+
+# Changing article_renderer changes every key, so stale markup is never reused
+RENDERER_HASH = hashlib.sha256(inspect.getsource(article_renderer).encode("utf-8")).hexdigest()[:16]
+
+
+# ============================================================
+# Article card fragments: rendered once per content, reused across
+# sections, outputs (email / PDF / docs) and runs
+# ============================================================
+_memo: dict[str, str] = {}
+_store: FragmentCache | None = None
+_lock = threading.Lock()
+_stats = {"rendered": 0, "reused_run": 0, "reused_disk": 0, "render_seconds": 0.0}
+
+
+def get_fragment_cache() -> FragmentCache | None:
+    """
+    Return the persistent fragment store, or None when cache.fragment_cache_enabled is false.
+    """
+    global _store
+    if not _cache_cfg.get("fragment_cache_enabled", True):
+        return None
+    with _lock:
+        if _store is None:
+            _store = FragmentCache(
+                project_root / _cache_cfg.get("fragment_cache_path", "src/data/fragment_cache.sqlite3"),
+                max_age_days=_cache_cfg.get("fragment_cache_max_age_days", 30),
+                logger=logger
+            )
+        return _store
+
+
+def article_key(article: dict) -> str:
+    raw = json.dumps(article, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(f"{RENDERER_HASH}\x00{raw}".encode("utf-8")).hexdigest()
+
+
+def render_article_fragments(articles: list[dict]) -> list[str]:
+    """
+    Article cards for the given articles, in order.
+    Looks each card up in this run's memo, then in the persistent store,
+    and only renders the rest.
+    """
+    keys = [article_key(a) for a in articles]
+
+    with _lock:
+        missing = [k for k in dict.fromkeys(keys) if k not in _memo]
+        _stats["reused_run"] += len(keys) - len(missing)
+
+    store = get_fragment_cache()
+    if missing and store is not None:
+        found = store.get_many(missing)
+        with _lock:
+            _memo.update(found)
+            _stats["reused_disk"] += len(found)
+        missing = [k for k in missing if k not in found]
+
+    if missing:
+        start = time.perf_counter()
+        by_key = dict(zip(keys, articles))
+        rendered = {k: article_renderer.render_article(by_key[k]) for k in missing}
+        elapsed = time.perf_counter() - start
+
+        if store is not None:
+            store.put_many(rendered)
+        with _lock:
+            _memo.update(rendered)
+            _stats["rendered"] += len(rendered)
+            _stats["render_seconds"] += elapsed
+
+    with _lock:
+        return [_memo[k] for k in keys]
+
+
+def fragment_stats() -> dict:
+    with _lock:
+        return dict(_stats)
+
+
+def log_fragment_stats(assemble_seconds: float | None = None) -> None:
+    stats = fragment_stats()
+    reused = stats["reused_run"] + stats["reused_disk"]
+    total = stats["rendered"] + reused
+    message = (
+        f"[Fragments] {total} article cards: {stats['rendered']} rendered in "
+        f"{stats['render_seconds'] * 1000:.1f}ms, {reused} reused "
+        f"({stats['reused_disk']} from previous runs, {stats['reused_run']} within this run)"
+    )
+    if assemble_seconds is not None:
+        message += f", sections assembled in {assemble_seconds * 1000:.1f}ms"
+    logger.info(message)
@@ -16,6 +16,7 @@ def render_article(data):
     supply_chain = data.get("supply_chain", "")
     nigeria_impact = data.get("nigeria_impact", "")
     recommendation = data.get("recommendation", "")
+    also_reported_by = data.get("also_reported_by", [])
 
     # Region icon mapping
     region_icons = {
@@ -28,6 +29,16 @@ def render_article(data):
     # Correct clickable link
     link_html = f'<a href="{link}" target="_blank">Read Original Article</a >' if link else ""
 
+    # Other outlets carrying the same story (see ingestion/news_dedup.py)
+    also_html = ""
+    if also_reported_by:
+        sources = ", ".join(
+            f'<a href="{x.get("link", "")}" target="_blank">{x.get("source", "Unknown")}</a>' if x.get("link")
+            else x.get("source", "Unknown")
+            for x in also_reported_by
+        )
+        also_html = f"<p><strong>Also reported by:</strong> {sources}</p>"
+
     html = f"""
     <div class="news-item">
         <h3>{title}</h3>
@@ -36,6 +47,7 @@ def render_article(data):
         <p><strong>Source:</strong> {source}</p>
         <p><strong>Published:</strong> {pub_date}</p>
         <p>{link_html}</p>
+        {also_html}
 
         <p><strong>Chinese Summary:</strong></p>
         <p>{cn_summary}</p>
@@ -1,4 +1,7 @@
+import os
+import gzip
 import json
+import hashlib
 from pathlib import Path
 
 from src.system.config_loader import load_config
@@ -11,81 +14,248 @@ docs_datas = Path(config["paths"]["docs_datas"]).resolve()
 logger = setup_logger("main")
 
 
+# v2: articles and prices are stored once as records (the page renders the
+# cards itself) and the file is written without indentation
+DAILY_JSON_VERSION = 2
+
+# Fields of an analysed article that the report pages show
+ARTICLE_FIELDS = (
+    "title", "source", "link", "pub_date", "region",
+    "cn_summary", "en_summary", "cn_insights", "en_insights",
+    "supply_chain", "nigeria_impact", "recommendation", "also_reported_by",
+)
+PRICE_FIELDS = ("item", "price", "change", "source")
+
+docs_cfg = config.get("docs", {})
+
+
+def article_record(article: dict) -> dict:
+    """The displayed fields of an article; empty values are left out."""
+    return {k: article[k] for k in ARTICLE_FIELDS if article.get(k) not in (None, "", [])}
+
+
+def price_record(price: dict) -> dict:
+    return {k: "" if price.get(k) is None else str(price[k]) for k in PRICE_FIELDS}
+
+
+def dump_compact(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def write_json_file(path: Path, data, precompress=None) -> int:
+    """
+    Write data as compact JSON, plus precompressed siblings
+    (path.gz / path.br) for each encoding in docs.precompress.
+    Siblings of encodings that are no longer configured are removed.
+    :return: size of the uncompressed file in bytes
+    """
+    raw = dump_compact(data).encode("utf-8")
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(raw)
+    os.replace(tmp, path)
+
+    encodings = docs_cfg.get("precompress", []) if precompress is None else precompress
+    for encoding in ("gz", "br"):
+        sibling = path.with_name(f"{path.name}.{encoding}")
+        if encoding not in encodings:
+            sibling.unlink(missing_ok=True)
+            continue
+        if encoding == "gz":
+            # mtime=0: identical content gives identical bytes (no spurious git diffs)
+            sibling.write_bytes(gzip.compress(raw, compresslevel=9, mtime=0))
+        else:
+            try:
+                import brotli
+            except ImportError:
+                logger.warning("brotli is not installed, skipping .br output.")
+                continue
+            sibling.write_bytes(brotli.compress(raw, quality=11))
+    return len(raw)
+
+
 def save_daily_json(
     date_str: str,
-    news_html: str,
-    news_china_html: str,
-    news_nigeria_html: str,
-    news_global_html: str,
-    price_html: str,
+    articles: list[dict],
+    prices: list[dict],
     price_insight_html: str,
     daily_insight_html: str,
     chart_rel_path: str,
-) -> None:
+) -> Path | None:
     """
-    Save a full daily report snapshot for GitHub Pages.
-    The JSON will contain all key HTML sections that are already used
-    in the email and PDF, so the website can render a page similar to
-    the internal daily report.
+    Save a daily report snapshot for GitHub Pages (format v2).
+    Articles and prices are stored as records (see ARTICLE_FIELDS /
+    PRICE_FIELDS); daily-data.html renders the cards and the price table
+    from them. The insight sections are stored as the HTML used in the
+    email and PDF.
+    :return: path of the written file, or None on failure
     """
     try:
         docs_datas.mkdir(parents=True, exist_ok=True)
 
         data = {
+            "version": DAILY_JSON_VERSION,
             "date": date_str,
-            "news_html": news_html,
-            "news_china_html": news_china_html,
-            "news_nigeria_html": news_nigeria_html,
-            "news_global_html": news_global_html,
-            "price_html": price_html,
+            "articles": [article_record(a) for a in articles],
+            "prices": [price_record(p) for p in prices],
             "price_insight_html": price_insight_html,
             "daily_insight_html": daily_insight_html,
             "chart_path": chart_rel_path,  # relative path from docs root
         }
 
         output_file = docs_datas / f"{date_str}.json"
-        output_file.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
-        logger.info(f"Daily JSON saved: {output_file}")
+        size = write_json_file(output_file, data)
+        logger.info(f"Daily JSON saved: {output_file} ({size / 1024:.0f} KB)")
+        return output_file
 
     except Exception as e:
         logger.error(f"Failed to save daily JSON for {date_str}: {e}")
+        return None
 
 
-def update_index_json(date_str: str) -> None:
+# ============================================================
+# Index manifest
+#   datas/index.json           months (newest first) + the most recent days
+#   datas/index/YYYY-MM.json   one entry per day of that month
+# A run only rewrites its own month page and the small root file.
+# ============================================================
+INDEX_VERSION = 2
+INDEX_DIR = "index"
+INDEX_HEADLINES = docs_cfg.get("index_headlines", 5)
+INDEX_RECENT_DAYS = docs_cfg.get("index_recent_days", 7)
+REGIONS = ("china", "nigeria", "global")
+
+
+def content_hash(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def read_json(path: Path, default=None):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return default
+    except Exception:
+        logger.warning(f"{path.name} is corrupted, rebuilding it.")
+        return default
+
+
+def index_entry(daily_file: Path) -> dict:
     """
-    Update docs/datas/index.json with the new date.
-    GitHub Pages will use this index to know which dates are available.
+    Manifest entry of one daily file: article counts per region, headlines,
+    price snapshot, file sizes and content hash.
     """
-    try:
-        index_file = docs_datas / "index.json"
-        index_file.parent.mkdir(parents=True, exist_ok=True)
+    raw = daily_file.read_bytes()
+    data = json.loads(raw)
+    if data.get("version") != DAILY_JSON_VERSION:
+        from src.renderers.dashborad.daily_json_converter import convert_v1
+        data = convert_v1(data)
 
-        if index_file.exists():
-            try:
-                index = json.loads(index_file.read_text(encoding="utf-8"))
-            except Exception:
-                logger.warning("Index file corrupted, reinitializing.")
-                index = {"dates": []}
-        else:
-            index = {"dates": []}
+    articles = data.get("articles", [])
+    counts = {region: 0 for region in REGIONS}
+    for a in articles:
+        region = a.get("region", "global")
+        counts[region] = counts.get(region, 0) + 1
+
+    sizes = {"json": len(raw)}
+    for encoding in ("gz", "br"):
+        sibling = daily_file.with_name(f"{daily_file.name}.{encoding}")
+        if sibling.exists():
+            sizes[encoding] = sibling.stat().st_size
+
+    return {
+        "date": data.get("date") or daily_file.stem,
+        "path": daily_file.name,
+        "articles": counts,
+        "headlines": [a["title"] for a in articles[:INDEX_HEADLINES] if a.get("title")],
+        "prices": {p["item"]: p["price"] for p in data.get("prices", []) if p.get("item")},
+        "chart_path": data.get("chart_path", ""),
+        "sizes": sizes,
+        "sha256": content_hash(raw),
+    }
+
+
+def _write_month_page(datas_dir: Path, month: str, days: dict[str, dict]) -> dict:
+    """Write index/<month>.json (newest day first) and return its summary for the root index"""
+    entries = [days[d] for d in sorted(days, reverse=True)]
+    page = {"version": INDEX_VERSION, "month": month, "days": entries}
+    path = datas_dir / INDEX_DIR / f"{month}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_json_file(path, page)
+    return {
+        "month": month,
+        "path": f"{INDEX_DIR}/{month}.json",
+        "days": len(entries),
+        "articles": sum(sum(e["articles"].values()) for e in entries),
+        "first": entries[-1]["date"],
+        "last": entries[0]["date"],
+        "sha256": content_hash(dump_compact(page).encode("utf-8")),
+    }
+
+
+def _write_root_index(datas_dir: Path, months: dict[str, dict], recent: list[dict]) -> None:
+    ordered = [months[m] for m in sorted(months, reverse=True)]
+    recent = sorted(recent, key=lambda e: e["date"], reverse=True)[:INDEX_RECENT_DAYS]
+    write_json_file(datas_dir / "index.json", {
+        "version": INDEX_VERSION,
+        "latest": recent[0]["date"] if recent else None,
+        "months": ordered,
+        "recent": recent,
+    })
+
+
+def rebuild_index(datas_dir: Path = docs_datas) -> int:
+    """
+    Build the whole manifest from the daily files in datas_dir
+    (first run, or migration from the flat v1 {"dates": [...]} index).
+    :return: number of days indexed
+    """
+    by_month: dict[str, dict[str, dict]] = {}
+    for path in sorted(datas_dir.glob("????-??-??.json")):
+        try:
+            entry = index_entry(path)
+        except Exception as e:
+            logger.error(f"Failed to index {path.name}: {e}")
+            continue
+        by_month.setdefault(entry["date"][:7], {})[entry["date"]] = entry
+
+    months = {month: _write_month_page(datas_dir, month, days) for month, days in by_month.items()}
+    recent = [e for days in by_month.values() for e in days.values()]
+    _write_root_index(datas_dir, months, recent)
+    logger.info(f"Index rebuilt: {len(recent)} days in {len(months)} months")
+    return len(recent)
+
+
+def update_index_json(date_str: str, datas_dir: Path = docs_datas) -> None:
+    """
+    Add (or refresh) one day in the index manifest.
+    GitHub Pages uses the manifest to list the available dates with their
+    metadata; only that day's month page and the root index are rewritten.
+    """
+    try:
+        datas_dir.mkdir(parents=True, exist_ok=True)
+        index_file = datas_dir / "index.json"
+        root = read_json(index_file, {})
 
-        # Ensure dates list exists
-        if "dates" not in index or not isinstance(index["dates"], list):
-            index["dates"] = []
+        if root.get("version") != INDEX_VERSION:
+            rebuild_index(datas_dir)
+            return
 
-        if date_str not in index["dates"]:
-            index["dates"].append(date_str)
+        entry = index_entry(datas_dir / f"{date_str}.json")
+        month = entry["date"][:7]
+        months = {m["month"]: m for m in root.get("months", [])}
+        page = read_json(datas_dir / INDEX_DIR / f"{month}.json")
+        if page is None and month in months:
+            # Month page lost: rebuilding is the only way to recover its other days
+            rebuild_index(datas_dir)
+            return
 
-        index["dates"] = sorted(set(index["dates"]))
+        days = {e["date"]: e for e in (page or {}).get("days", [])}
+        days[entry["date"]] = entry
+        months[month] = _write_month_page(datas_dir, month, days)
 
-        index_file.write_text(
-            json.dumps(index, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        recent = [e for e in root.get("recent", []) if e["date"] != entry["date"]] + [entry]
+        _write_root_index(datas_dir, months, recent)
         logger.info(f"Index updated with date {date_str}")
 
     except Exception as e:
-        logger.error(f"Failed to update index.json with {date_str}: {e}")
\ No newline at end of file
+        logger.error(f"Failed to update index.json with {date_str}: {e}")
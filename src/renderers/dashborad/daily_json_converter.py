@@ -0,0 +1,154 @@
+"""
+Convert docs/datas/YYYY-MM-DD.json files from the v1 format (pretty-printed,
+news sections as HTML, news_html repeating all of them) to v2 (compact,
+articles and prices as records).
+
+Usage:
+    python -m src.renderers.dashborad.daily_json_converter [--dir docs/datas] [--precompress gz br] [--dry-run]
+
+Files that are already v2 are left alone (their siblings are refreshed
+when --precompress is given). The index manifest is rebuilt afterwards.
+"""
+import re
+import json
+import argparse
+from pathlib import Path
+
+from src.renderers.dashborad.daily_exporter import (
+    DAILY_JSON_VERSION, article_record, docs_datas, dump_compact, price_record, rebuild_index, write_json_file
+)
+from src.system.logger import setup_logger
+
+logger = setup_logger("main")
+
+DATE_FILE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}\.json$")
+
+V1_NEWS_SECTIONS = (
+    ("news_china_html", "china"),
+    ("news_nigeria_html", "nigeria"),
+    ("news_global_html", "global"),
+)
+
+# <strong> label in a v1 card -> article field
+CARD_LABELS = {
+    "Source:": "source",
+    "Published:": "pub_date",
+    "Chinese Summary:": "cn_summary",
+    "English Summary:": "en_summary",
+    "Chinese Key Insights:": "cn_insights",
+    "English Key Insights:": "en_insights",
+    "Supply Chain Impact:": "supply_chain",
+    "Impact on Nigeria Microgrid Projects:": "nigeria_impact",
+    "Procurement Recommendation:": "recommendation",
+}
+INLINE_FIELDS = ("source", "pub_date")
+LIST_FIELDS = ("cn_insights", "en_insights")
+
+
+def _soup(html: str):
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html or "", "html.parser")
+
+
+def parse_cards(html: str, region: str) -> list[dict]:
+    """Articles from the cards rendered by article_renderer.render_article."""
+    articles = []
+    for card in _soup(html).select("div.news-item"):
+        article = {"region": region}
+        title = card.find("h3")
+        if title:
+            article["title"] = title.get_text(strip=True)
+        link = card.find("a", href=True)
+        if link:
+            article["link"] = link["href"]
+
+        for strong in card.find_all("strong"):
+            field = CARD_LABELS.get(strong.get_text(strip=True))
+            if not field:
+                continue
+            label_p = strong.find_parent("p")
+            if field in INLINE_FIELDS:
+                # <p><strong>Source:</strong> China Daily</p>
+                article[field] = label_p.get_text(strip=True)[len(strong.get_text(strip=True)):].strip()
+            elif field in LIST_FIELDS:
+                ul = label_p.find_next_sibling("ul")
+                article[field] = [li.get_text(strip=True) for li in ul.find_all("li")] if ul else []
+            else:
+                value_p = label_p.find_next_sibling("p")
+                article[field] = value_p.get_text(strip=True) if value_p else ""
+        articles.append(article_record(article))
+    return articles
+
+
+def parse_price_table(html: str) -> list[dict]:
+    prices = []
+    for row in _soup(html).find_all("tr"):
+        cells = [td.get_text(strip=True) for td in row.find_all("td")]
+        if cells:
+            prices.append(price_record(dict(zip(("item", "price", "change", "source"), cells))))
+    return prices
+
+
+def convert_v1(data: dict) -> dict:
+    """A v1 daily report dict as v2"""
+    articles = []
+    for key, region in V1_NEWS_SECTIONS:
+        articles.extend(parse_cards(data.get(key, ""), region))
+    return {
+        "version": DAILY_JSON_VERSION,
+        "date": data.get("date"),
+        "articles": articles,
+        "prices": parse_price_table(data.get("price_html", "")),
+        "price_insight_html": data.get("price_insight_html", ""),
+        "daily_insight_html": data.get("daily_insight_html", ""),
+        "chart_path": data.get("chart_path", ""),
+    }
+
+
+def convert_dir(datas_dir: Path, precompress=None, dry_run: bool = False) -> tuple[int, int]:
+    """
+    Convert every v1 daily file in datas_dir in place.
+    :return: (bytes before, bytes after) over all daily files
+    """
+    before = after = 0
+    for path in sorted(datas_dir.iterdir()):
+        if not DATE_FILE_RE.match(path.name):
+            continue
+        size = path.stat().st_size
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.error(f"[Convert] Skipping unreadable {path.name}: {e}")
+            continue
+
+        converted = data if data.get("version") == DAILY_JSON_VERSION else convert_v1(data)
+        if dry_run:
+            new_size = len(dump_compact(converted).encode("utf-8"))
+        else:
+            new_size = write_json_file(path, converted, precompress)
+
+        before += size
+        after += new_size
+        logger.info(f"[Convert] {path.name}: {len(converted['articles'])} articles, "
+                    f"{size / 1024:.0f} KB -> {new_size / 1024:.0f} KB")
+    return before, after
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", type=Path, default=docs_datas)
+    parser.add_argument("--precompress", nargs="*", choices=("gz", "br"), default=None,
+                        help="encodings to write next to each file (default: docs.precompress)")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    datas_dir = args.dir.resolve()
+    before, after = convert_dir(datas_dir, args.precompress, args.dry_run)
+    if not args.dry_run:
+        rebuild_index(datas_dir)
+    if before:
+        print(f"{before / 1024:.0f} KB -> {after / 1024:.0f} KB ({after / before:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""
+Inverted index over the published articles, searched in the browser
+(archive.html).
+
+Layout under docs/datas/search/:
+    manifest.json                  per month: doc and day counts, version hash
+    YYYY-MM/<shard>.json           {term: [doc, tf, doc, tf, ...]} for the terms of one shard_key()
+    YYYY-MM/dDD.json               that day's documents ([title, region] per article)
+                                   and the shards its terms live in
+
+A document id is day * 1000 + position of the article in the daily file,
+so ids stay stable and a day's postings can be dropped without a lookup table.
+English is split into words, Chinese into character bigrams; the tokenizer
+and shard_key() are mirrored in archive.html.
+
+Usage (rebuild from all daily files):
+    python -m src.renderers.dashborad.search_index [--dir docs/datas]
+"""
+import re
+import json
+import shutil
+import argparse
+from collections import Counter
+from pathlib import Path
+
+from src.renderers.dashborad.daily_exporter import (
+    DAILY_JSON_VERSION, content_hash, read_json, docs_datas, dump_compact, write_json_file
+)
+from src.system.logger import setup_logger
+
+logger = setup_logger("main")
+
+SEARCH_VERSION = 1
+SEARCH_DIR = "search"
+TITLE_WEIGHT = 3
+MAX_ARTICLES_PER_DAY = 1000
+CJK_BUCKETS = 128
+
+TOKEN_RE = re.compile(r"[a-z0-9]+|[\u4e00-\u9fff]+")
+STOPWORDS = frozenset(
+    "an and are as at be been but by for from has have in into is it its of on or "
+    "that the their this to was were will with".split()
+)
+INDEXED_FIELDS = ("cn_summary", "en_summary")
+INDEXED_LISTS = ("cn_insights", "en_insights")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased English words / numbers and Chinese character bigrams."""
+    tokens = []
+    for run in TOKEN_RE.findall((text or "").lower()):
+        if run[0] < "\u4e00":
+            if len(run) > 1 and run not in STOPWORDS:
+                tokens.append(run)
+        elif len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def shard_key(term: str) -> str:
+    """
+    English / numbers: the first two characters. Chinese: one of
+    CJK_BUCKETS buckets by both characters of the bigram (bucketing by the
+    first character alone puts every "能..." term into one large shard).
+    """
+    if term[0] < "\u4e00":
+        return term[:2]
+    return f"c{(ord(term[0]) * 31 + ord(term[-1])) % CJK_BUCKETS:02x}"
+
+
+def article_terms(article: dict) -> Counter:
+    terms = Counter()
+    for token in tokenize(article.get("title", "")):
+        terms[token] += TITLE_WEIGHT
+    for field in INDEXED_FIELDS:
+        terms.update(tokenize(article.get(field, "")))
+    for field in INDEXED_LISTS:
+        for item in article.get(field) or []:
+            terms.update(tokenize(item))
+    return terms
+
+
+class SearchIndex:
+    """
+    Loads shards on demand, applies day updates in memory and writes only
+    the shards, day files and manifest entries that changed on flush().
+    """
+
+    def __init__(self, datas_dir: Path = docs_datas):
+        self.root = Path(datas_dir) / SEARCH_DIR
+        self.manifest = read_json(self.root / "manifest.json", {})
+        if self.manifest.get("version") != SEARCH_VERSION:
+            self.manifest = {"version": SEARCH_VERSION, "months": {}}
+        self._shards: dict[tuple[str, str], dict] = {}
+        self._loaded: dict[tuple[str, str], str] = {}
+        self._dirty_shards: set[tuple[str, str]] = set()
+        self._days: dict[tuple[str, str], dict] = {}
+
+    def _month(self, month: str) -> dict:
+        return self.manifest["months"].setdefault(month, {"docs": 0, "days": 0, "v": ""})
+
+    def _shard(self, month: str, key: str) -> dict:
+        if (month, key) not in self._shards:
+            shard = dict(sorted(read_json(self.root / month / f"{key}.json", {}).items()))
+            self._shards[(month, key)] = shard
+            self._loaded[(month, key)] = content_hash(dump_compact(shard).encode("utf-8"))
+        return self._shards[(month, key)]
+
+    def update_day(self, date_str: str, articles: list[dict]) -> None:
+        """Replace the postings of one day with those of the given articles."""
+        month, day = date_str[:7], date_str[8:10]
+        base = int(day) * MAX_ARTICLES_PER_DAY
+        previous = read_json(self.root / month / f"d{day}.json", {}) if (month, day) not in self._days \
+            else self._days[(month, day)]
+
+        indexed = articles[:MAX_ARTICLES_PER_DAY]
+        postings: dict[str, dict[str, list[int]]] = {}
+        for i, article in enumerate(indexed):
+            for term, tf in article_terms(article).items():
+                postings.setdefault(shard_key(term), {}).setdefault(term, []).extend((base + i, tf))
+
+        # Shards holding the day's old terms or its new ones; nothing else changes
+        for key in set(previous.get("shards", [])) | set(postings):
+            shard = self._shard(month, key)
+            for term in list(shard):
+                flat = shard[term]
+                kept = [x for j in range(0, len(flat), 2) if flat[j] // MAX_ARTICLES_PER_DAY != int(day)
+                        for x in flat[j:j + 2]]
+                if kept:
+                    shard[term] = kept
+                else:
+                    del shard[term]
+            for term, flat in postings.get(key, {}).items():
+                merged = shard.get(term, []) + flat
+                pairs = sorted(zip(merged[::2], merged[1::2]))
+                shard[term] = [x for pair in pairs for x in pair]
+            self._dirty_shards.add((month, key))
+
+        entry = self._month(month)
+        entry["docs"] += len(indexed) - len(previous.get("docs", []))
+        entry["days"] += 0 if previous else 1
+        self._days[(month, day)] = {
+            "date": date_str,
+            "docs": [[a.get("title", ""), a.get("region", "global")] for a in indexed],
+            "shards": sorted(postings),
+        }
+
+    def flush(self) -> int:
+        """Write changed files; returns how many were written."""
+        changed: dict[str, list[str]] = {}
+        for month, key in sorted(self._dirty_shards):
+            path = self.root / month / f"{key}.json"
+            # Sorted terms: the same postings always give the same bytes
+            shard = dict(sorted(self._shards[(month, key)].items()))
+            digest = content_hash(dump_compact(shard).encode("utf-8"))
+            if digest == self._loaded.get((month, key)):
+                continue
+            if shard:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                write_json_file(path, shard)
+            else:
+                path.unlink(missing_ok=True)  # the browser treats a missing shard as empty
+            self._loaded[(month, key)] = digest
+            changed.setdefault(month, []).append(f"{key}:{digest}")
+
+        for (month, day), doc in sorted(self._days.items()):
+            path = self.root / month / f"d{day}.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_json_file(path, doc)
+            changed.setdefault(month, []).append(f"d{day}:{content_hash(dump_compact(doc).encode('utf-8'))}")
+
+        # "v" changes whenever a file of the month does; the browser appends it
+        # to the month's URLs, so only changed months are downloaded again
+        for month, files in changed.items():
+            entry = self._month(month)
+            entry["v"] = content_hash("\n".join([entry["v"], *files]).encode("utf-8"))
+
+        self.manifest["months"] = dict(sorted(self.manifest["months"].items(), reverse=True))
+        self.root.mkdir(parents=True, exist_ok=True)
+        write_json_file(self.root / "manifest.json", self.manifest)
+
+        self._dirty_shards.clear()
+        self._days.clear()
+        return sum(map(len, changed.values())) + 1
+
+
+def _daily_articles(daily_file: Path) -> list[dict]:
+    data = json.loads(daily_file.read_text(encoding="utf-8"))
+    if data.get("version") != DAILY_JSON_VERSION:
+        from src.renderers.dashborad.daily_json_converter import convert_v1
+        data = convert_v1(data)
+    return data.get("articles", [])
+
+
+def update_search_index(date_str: str, datas_dir: Path = docs_datas) -> None:
+    """
+    Index (or re-index) one day's articles. Only the shards that hold the
+    day's old or new terms are rewritten. Builds the whole index when it
+    does not exist yet.
+    """
+    try:
+        index = SearchIndex(datas_dir)
+        if not index.manifest["months"]:
+            rebuild_search_index(datas_dir)
+            return
+        index.update_day(date_str, _daily_articles(datas_dir / f"{date_str}.json"))
+        written = index.flush()
+        logger.info(f"Search index updated with date {date_str} ({written} files written)")
+    except Exception as e:
+        logger.error(f"Failed to update search index with {date_str}: {e}")
+
+
+def rebuild_search_index(datas_dir: Path = docs_datas) -> int:
+    """
+    Build the search index from every daily file in datas_dir.
+    :return: number of days indexed
+    """
+    shutil.rmtree(Path(datas_dir) / SEARCH_DIR, ignore_errors=True)
+    index = SearchIndex(datas_dir)
+    days = 0
+    for path in sorted(Path(datas_dir).glob("????-??-??.json")):
+        try:
+            index.update_day(path.stem, _daily_articles(path))
+            days += 1
+        except Exception as e:
+            logger.error(f"Failed to index {path.name}: {e}")
+    written = index.flush()
+    logger.info(f"Search index rebuilt: {days} days, {written} files")
+    return days
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", type=Path, default=docs_datas)
+    args = parser.parse_args()
+    rebuild_search_index(args.dir.resolve())
+
+
+if __name__ == "__main__":
+    main()
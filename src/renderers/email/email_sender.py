@@ -1,13 +1,11 @@
 import os
 import smtplib
-from pathlib import Path
 from email.mime.application import MIMEApplication
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.image import MIMEImage
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
+from src.renderers.template_env import get_template
 from src.system.config_loader import load_config
 from src.system.logger import setup_logger
 from src.system.utils import get_env
@@ -21,13 +19,8 @@ logger = setup_logger("main")
 # Render HTML template with Jinja2
 # ============================
 def render_email_html(**kwargs) -> str:
-    templates_dir = Path(config["paths"]["templates_dir"]).resolve()
-    env = Environment(
-        loader=FileSystemLoader(templates_dir),
-        autoescape=select_autoescape(["html", "xml"])
-    )
     try:
-        template = env.get_template("email_template.html")
+        template = get_template("email_template.html")
         return template.render(**kwargs)
     except Exception as e:
         logger.error(f"Failed to render email template: {e}")
@@ -1,8 +1,11 @@
+import atexit
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from weasyprint import HTML
-from bs4 import BeautifulSoup
 
+from src.renderers.template_env import get_template
 from src.system.config_loader import load_config
 from src.system.logger import setup_logger
 
@@ -10,57 +13,160 @@ config = load_config()
 
 logger = setup_logger("main")
 
-def build_pdf(**kwargs):
+pdf_cfg = config.get("pdf", {})
+PDF_USE_WORKER = pdf_cfg.get("worker", True)
+
+# Section headings of pdf_template.html. The template renders its headings
+# from this list too, so the table of contents is known before rendering.
+PDF_HEADINGS = [
+    {"id": "sec1", "text": "1. Price Impact Analysis", "level": 1},
+    {"id": "sec2", "text": "2. Market Prices", "level": 1},
+    {"id": "sec3", "text": "3. Industry News", "level": 1},
+    {"id": "sec31", "text": "3.1 🇨🇳China Supply Chain", "level": 2},
+    {"id": "sec32", "text": "3.2 🇳🇬Nigeria Market", "level": 2},
+    {"id": "sec33", "text": "3.3 🌍Global Solar & Storage", "level": 2},
+    {"id": "sec4", "text": "4. Daily Insight", "level": 1},
+    {"id": "sec5", "text": "5. Price Trend Chart", "level": 1},
+]
+
+
+# ============================================================
+# Persistent WeasyPrint worker
+# One long-lived process imports WeasyPrint and keeps its font
+# configuration, so only the first PDF pays for loading them.
+# ============================================================
+_font_config = None
+
+
+def _init_worker() -> None:
+    global _font_config
+    from weasyprint.text.fonts import FontConfiguration
+    _font_config = FontConfiguration()
+
+
+def _ping() -> None:
+    return None
+
+
+def _write_pdf(html_content: str, base_url: str, output_path: str) -> str:
+    from weasyprint import HTML
+    if _font_config is None:
+        _init_worker()
+    HTML(string=html_content, base_url=base_url).write_pdf(output_path, font_config=_font_config)
+    return output_path
+
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def start_pdf_worker() -> None:
     """
-    Render PDF using Jinja2 + WeasyPrint.
-    Supports automatic table of contents, logo, and professional layout.
+    Start the WeasyPrint worker process (no-op if it is running or disabled).
+    Call early so its start-up overlaps with other work.
     """
+    global _executor
+    if not PDF_USE_WORKER:
+        return
+    with _executor_lock:
+        if _executor is None:
+            # spawn: the caller runs other threads, which fork does not mix with
+            _executor = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+            # Start the process (and run _init_worker) now instead of on the first PDF
+            _executor.submit(_ping)
+
+
+def stop_pdf_worker() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+
+atexit.register(stop_pdf_worker)
+
+
+def _submit(html_content: str, base_url: str, output_path: str) -> Future:
+    if not PDF_USE_WORKER:
+        future = Future()
+        try:
+            future.set_result(_write_pdf(html_content, base_url, output_path))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    start_pdf_worker()
+    try:
+        return _executor.submit(_write_pdf, html_content, base_url, output_path)
+    except BrokenProcessPool:
+        # Worker died (e.g. crashed on a previous document): start a fresh one
+        stop_pdf_worker()
+        start_pdf_worker()
+        return _executor.submit(_write_pdf, html_content, base_url, output_path)
+
+
+def render_pdf_html(**kwargs) -> str:
+    """
+    Render pdf_template.html once (precompiled, from the shared environment);
+    the TOC comes from PDF_HEADINGS.
+    """
+    template = get_template("pdf_template.html")
+    titles = {h["id"]: h["text"] for h in PDF_HEADINGS}
+    return template.render(**kwargs, headings=PDF_HEADINGS, titles=titles)
+
+
+def build_pdf_async(**kwargs) -> Future:
+    """
+    Render the template in this process and hand the HTML to the WeasyPrint
+    worker. The returned future resolves to the PDF path (or None on failure).
+    """
+    result: Future = Future()
     try:
         # 1. Load templates directory
         templates_dir = Path(config["paths"]["templates_dir"]).resolve()
         if not templates_dir.exists():
             logger.error(f"Templates directory not found: {templates_dir}")
-            return None
-
-        env = Environment(
-            loader=FileSystemLoader(templates_dir),
-            autoescape=select_autoescape(["html", "xml"])
-        )
-
-        # 2. Load pdf_template.html
-        template = env.get_template("pdf_template.html")
-
-        # 3. Render HTML with headings
-        html_content = template.render(**kwargs)
-        headings = extract_headings(html_content)
-        html_content = template.render(**kwargs, headings=headings)
+            result.set_result(None)
+            return result
 
-        # 4. Generate PDF
         output_path = kwargs.get("output_path")
         if not output_path:
             logger.error("Missing output_path in build_pdf kwargs.")
-            return None
+            result.set_result(None)
+            return result
 
-        HTML(string=html_content, base_url=str(templates_dir)).write_pdf(output_path)
-        logger.info(f"PDF generated successfully: {output_path}")
-        return str(output_path)
+        # 2. Render HTML (single pass, TOC included)
+        html_content = render_pdf_html(**kwargs)
 
+        # 3. Generate PDF in the worker
+        pdf_future = _submit(html_content, str(templates_dir), str(output_path))
     except Exception as e:
         logger.error(f"Failed to generate PDF: {e}")
-        return None
+        result.set_result(None)
+        return result
 
+    def _done(f: Future):
+        try:
+            path = f.result()
+            logger.info(f"PDF generated successfully: {path}")
+            result.set_result(str(path))
+        except Exception as e:
+            logger.error(f"Failed to generate PDF: {e}")
+            result.set_result(None)
 
+    pdf_future.add_done_callback(_done)
+    return result
 
-def extract_headings(html: str):
+
+def build_pdf(**kwargs):
     """
-    Extract headings (h1, h2) with IDs for table of contents.
+    Render PDF using Jinja2 + WeasyPrint.
+    Supports automatic table of contents, logo, and professional layout.
+    Blocks until the worker has written the file.
     """
-    soup = BeautifulSoup(html, "html.parser")
-    headings = []
-    for tag in soup.find_all(["h1", "h2"]):
-        if tag.get("id"):
-            headings.append({
-                "id": tag["id"],
-                "text": tag.get_text(strip=True)
-            })
-    return headings
\ No newline at end of file
+    return build_pdf_async(**kwargs).result()
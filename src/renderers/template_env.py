@@ -0,0 +1,89 @@
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.system.config_loader import load_config
+from src.system.logger import setup_logger
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+config = load_config()
+logger = setup_logger("main")
+project_root = Path(__file__).resolve().parents[2]
+
+templates_cfg = config.get("templates", {})
+
+# Templates compiled as soon as the environment is built
+PRECOMPILED_TEMPLATES = ("pdf_template.html", "email_template.html")
+
+
+# ============================================================
+# Shared Jinja environment
+# Built once per process. Compiled templates are kept in memory and
+# their bytecode on disk, so later runs skip parsing and compiling too.
+# ============================================================
+_env: "Environment | None" = None
+_env_lock = threading.Lock()
+
+
+def _auto_reload() -> bool:
+    """Check templates for changes on every lookup only while developing (APP_ENV=dev)."""
+    return templates_cfg.get("auto_reload", os.getenv("APP_ENV", "dev") == "dev")
+
+
+def _bytecode_cache():
+    from jinja2 import FileSystemBytecodeCache
+
+    if not templates_cfg.get("bytecode_cache_enabled", True):
+        return None
+    cache_dir = project_root / templates_cfg.get("bytecode_cache_dir", "src/data/jinja_cache")
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(str(cache_dir))
+
+
+def build_template_env(templates_dir: str | Path | None = None, bytecode_cache=True,
+                       auto_reload: bool | None = None) -> "Environment":
+    """
+    A new Environment over the templates directory.
+    Use get_template_env() instead; this is for callers that need their own (e.g. benchmarks).
+    :param bytecode_cache: True for the configured on-disk cache, False for none,
+                           or a jinja2 BytecodeCache instance
+    """
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+    templates_dir = Path(templates_dir or config["paths"]["templates_dir"]).resolve()
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        autoescape=select_autoescape(["html", "xml"]),
+        bytecode_cache=_bytecode_cache() if bytecode_cache is True else (bytecode_cache or None),
+        auto_reload=_auto_reload() if auto_reload is None else auto_reload,
+        cache_size=-1
+    )
+
+
+def precompile(env: "Environment", names=PRECOMPILED_TEMPLATES) -> None:
+    """Load (and compile) the given templates into the environment's cache."""
+    for name in names:
+        try:
+            env.get_template(name)
+        except Exception as e:
+            logger.warning(f"[Templates] Failed to precompile {name}: {e}")
+
+
+def get_template_env() -> "Environment":
+    """
+    The process-wide template environment, built and precompiled on first use.
+    """
+    global _env
+    with _env_lock:
+        if _env is None:
+            env = build_template_env()
+            precompile(env)
+            _env = env
+        return _env
+
+
+def get_template(name: str) -> "Template":
+    return get_template_env().get_template(name)
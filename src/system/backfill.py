@@ -0,0 +1,207 @@
+"""
+Rebuild the outputs of past dates (HTML sections, chart, PDF, docs JSON)
+from their cached stage data, e.g. after a template or renderer change.
+
+Usage:
+    python -m src.system.backfill --start 2026-01-01 --end 2026-01-31
+        [--steps chart pdf docs] [--workers 4] [--allow-llm]
+
+Each date runs the daily stage graph in a worker process with its own
+DailyCache, minus fetching, email and git push. The AI stages load their
+cached output; a date whose AI output is not cached is skipped unless
+--allow-llm is given (then only the missing stages call the LLM, from the
+cached raw news / prices). The docs index and search index are shared
+files, so they are updated afterwards in this process, one date at a time.
+
+Only dates that still have a cache folder can be rebuilt. The daily run
+removes folders older than cache.keep_days but, with backfill.keep_inputs
+(default on), keeps the BACKFILL_INPUTS files in them; with it off, backfill
+is limited to the last cache.keep_days days.
+"""
+import os
+import time
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, timedelta
+from pathlib import Path
+
+from src.system.cache_manager import DailyCache
+from src.system.config_loader import load_config
+from src.system.logger import setup_logger
+
+config = load_config()
+logger = setup_logger("main")
+project_root = Path(__file__).resolve().parents[2]
+
+backfill_cfg = config.get("backfill", {})
+
+BACKFILL_STEPS = ("chart", "pdf", "docs")
+AI_OUTPUTS = ("news_ai", "price_insight", "daily_insight")
+REUSED_STAGES = ("news_ai", "price_insight", "daily_insight", "group", "render")
+# Cached stage data a date needs to be rebuilt; spared by the daily cache cleanup
+BACKFILL_INPUTS = ("prices", "news_raw", "news_ai", "price_insight", "daily_insight",
+                   "china", "nigeria", "global_news")
+
+
+def date_range(start: str, end: str) -> list[str]:
+    first, last = date.fromisoformat(start), date.fromisoformat(end)
+    return [(first + timedelta(days=i)).isoformat() for i in range((last - first).days + 1)]
+
+
+def cache_base() -> Path:
+    return project_root / config["cache"]["path"]
+
+
+def daily_cache(date_str: str) -> DailyCache:
+    return DailyCache(cache_base(), logger=logger, date=date_str)
+
+
+# ============================================================
+# Worker side
+# ============================================================
+def _init_worker() -> None:
+    from src.renderers.pdf import pdf_builder
+    # Already in a worker process: write PDFs here instead of starting another one
+    pdf_builder.PDF_USE_WORKER = False
+
+
+def build_backfill_stages(cache: DailyCache, steps) -> list:
+    """
+    The stages of main.build_stages(cache) that rebuild outputs, with fetching
+    replaced by loading the cached raw data of that day.
+    """
+    from src.system import main
+    from src.system.scheduler import Stage
+
+    def load_cached_inputs():
+        prices = cache.load("prices") if cache.exists("prices") else []
+        news = cache.load("news_raw") if cache.exists("news_raw") else []
+        return prices, news
+
+    def existing_chart(date):
+        filename = f"price_chart_{date}.png"
+        return os.path.abspath(os.path.join(main.charts_dir, filename)), f"charts/{filename}"
+
+    daily = {s.name: s for s in main.build_stages(cache)}
+    stages = [Stage("load", load_cached_inputs, outputs=["price_list", "news_list"])]
+    stages += [daily[name] for name in REUSED_STAGES]
+    stages.append(daily["chart"] if "chart" in steps else
+                  Stage("chart", existing_chart, inputs=["date"], outputs=["chart_path", "chart_rel_for_docs"]))
+    if "pdf" in steps:
+        stages.append(daily["pdf"])
+    if "docs" in steps:
+        stages.append(Stage("docs_json", main.save_docs_json,
+                            inputs=daily["docs_export"].inputs, outputs=["docs_path"]))
+    return stages
+
+
+def backfill_date(date_str: str, steps=BACKFILL_STEPS, allow_llm: bool = False) -> dict:
+    """
+    Rebuild one date's outputs. Runs in a worker process.
+    :return: {"date", "status": ok / skipped / failed, "seconds", "llm_stages", "error"}
+    """
+    from src.system import main
+    from src.system.scheduler import StageScheduler
+
+    start = time.perf_counter()
+    result = {"date": date_str, "status": "ok", "llm_stages": [], "error": None}
+    cache = daily_cache(date_str)
+
+    missing = [name for name in AI_OUTPUTS if not cache.exists(name)]
+    if missing and not allow_llm:
+        result.update(status="skipped", error=f"not cached: {', '.join(missing)}")
+    else:
+        try:
+            scheduler = StageScheduler(
+                build_backfill_stages(cache, steps),
+                max_workers=backfill_cfg.get("stage_workers", 2),
+                cache=cache,
+                cache_enabled=True
+            )
+            scheduler.run({"date": date_str, "history_file": str(main.history_file_path)})
+            result["llm_stages"] = [
+                name for name in AI_OUTPUTS
+                if name in scheduler.timings and not scheduler.timings[name].cached
+            ]
+        except Exception as e:
+            result.update(status="failed", error=str(e))
+
+    result["seconds"] = round(time.perf_counter() - start, 2)
+    return result
+
+
+# ============================================================
+# Driver
+# ============================================================
+def run_backfill(start: str, end: str, steps=BACKFILL_STEPS, workers: int | None = None,
+                 allow_llm: bool = False) -> list[dict]:
+    """
+    Rebuild every date between start and end (inclusive) that has a cache
+    folder, in a process pool. Returns one result per date, in date order.
+    """
+    cached_dates = set(DailyCache.available_dates(cache_base()))
+    dates = [d for d in date_range(start, end) if d in cached_dates]
+    results = [{"date": d, "status": "skipped", "seconds": 0, "llm_stages": [], "error": "no cache folder"}
+               for d in date_range(start, end) if d not in cached_dates]
+    if not dates:
+        logger.warning(f"[Backfill] No cached dates between {start} and {end}")
+        return results
+
+    workers = min(len(dates), workers or backfill_cfg.get("max_workers") or os.cpu_count() or 1)
+    logger.info(f"[Backfill] {len(dates)} dates, steps={','.join(steps)}, {workers} workers")
+
+    # spawn: workers import the pipeline fresh instead of inheriting this process's threads
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_worker) as pool:
+        futures = {pool.submit(backfill_date, d, tuple(steps), allow_llm): d for d in dates}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"date": futures[future], "status": "failed", "seconds": 0,
+                          "llm_stages": [], "error": str(e)}
+            results.append(result)
+            logger.info(f"[Backfill] {result['date']}: {result['status']} in {result['seconds']}s"
+                        + (f" ({result['error']})" if result["error"] else ""))
+
+    results.sort(key=lambda r: r["date"])
+
+    if "docs" in steps:
+        from src.renderers.dashborad.daily_exporter import update_index_json
+        from src.renderers.dashborad.search_index import update_search_index
+
+        for result in results:
+            if result["status"] == "ok":
+                update_index_json(result["date"])
+                update_search_index(result["date"])
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--start", required=True,
+                        help="first date, YYYY-MM-DD (dates without a cache folder are skipped, "
+                             "see backfill.keep_inputs)")
+    parser.add_argument("--end", default=None, help="last date, YYYY-MM-DD (default: --start)")
+    parser.add_argument("--steps", nargs="+", choices=BACKFILL_STEPS, default=list(BACKFILL_STEPS))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--allow-llm", action="store_true",
+                        help="run AI stages whose output is not cached (calls the LLM)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run_backfill(args.start, args.end or args.start, args.steps, args.workers, args.allow_llm)
+
+    counts = {status: sum(r["status"] == status for r in results) for status in ("ok", "skipped", "failed")}
+    llm = sum(len(r["llm_stages"]) for r in results)
+    print(f"{counts['ok']} rebuilt, {counts['skipped']} skipped, {counts['failed']} failed, "
+          f"{llm} AI stages run in {time.perf_counter() - start:.1f}s")
+    for r in results:
+        if r["status"] != "ok":
+            print(f"  {r['date']}: {r['status']} ({r['error']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 import os
 import json
+import time
 import shutil
+import sqlite3
+import hashlib
+import threading
 from datetime import datetime, date, timedelta
 
 
@@ -19,9 +23,14 @@ def make_json_safe(obj):
 
 
 class DailyCache:
-    def __init__(self, base_path="./cache", logger=None):
+    def __init__(self, base_path="./cache", logger=None, date=None):
+        """
+        :param date: 缓存所属日期（YYYY-MM-DD 或 date），默认今天；回填历史日期时传入
+        """
         self.base_path = base_path
-        self.today = datetime.now().strftime("%Y-%m-%d")
+        if hasattr(date, "strftime"):
+            date = date.strftime("%Y-%m-%d")
+        self.today = date or datetime.now().strftime("%Y-%m-%d")
         self.day_path = os.path.join(base_path, self.today)
         self.logger = logger
 
@@ -42,8 +51,27 @@ class DailyCache:
         with open(self._file(name), "w", encoding="utf-8") as f:
             json.dump(safe_data, f, ensure_ascii=False, indent=2)
 
-    def clean_old_cache(self, keep_days=7):
-        """自动清理超过 keep_days 的缓存目录"""
+    @staticmethod
+    def available_dates(base_path):
+        """返回 base_path 下已有缓存目录的日期列表（升序），不会创建任何目录"""
+        if not os.path.exists(base_path):
+            return []
+        dates = []
+        for folder in os.listdir(base_path):
+            try:
+                datetime.strptime(folder, "%Y-%m-%d")
+            except ValueError:
+                continue
+            if os.path.isdir(os.path.join(base_path, folder)):
+                dates.append(folder)
+        return sorted(dates)
+
+    def clean_old_cache(self, keep_days=7, keep=()):
+        """
+        自动清理超过 keep_days 的缓存目录
+        :param keep: 过期后仍保留的缓存名（如回填所需的输入），其余文件删除；
+                     目录为空时整个删除
+        """
         cutoff = datetime.now() - timedelta(days=keep_days)
 
         # 如果 cache 目录不存在，直接返回
@@ -61,7 +89,278 @@ class DailyCache:
             except ValueError:
                 continue
 
-            if folder_date < cutoff:
+            if folder_date >= cutoff:
+                continue
+
+            kept = {f"{name}.json" for name in keep}
+            files = os.listdir(folder_path)
+            removed = [f for f in files if f not in kept]
+            if len(removed) == len(files):
                 shutil.rmtree(folder_path)
                 if self.logger:
-                    self.logger.info(f"[Cache] Removed old cache folder: {folder}")
\ No newline at end of file
+                    self.logger.info(f"[Cache] Removed old cache folder: {folder}")
+                continue
+
+            for f in removed:
+                path = os.path.join(folder_path, f)
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                else:
+                    os.remove(path)
+            if removed and self.logger:
+                self.logger.info(f"[Cache] Removed {len(removed)} old cache files from {folder}, kept backfill inputs")
+
+class LLMResponseCache:
+    """
+    跨天持久化的 LLM 响应缓存（内容寻址）。
+    key = sha256(model + temperature + prompt)，存储在 SQLite 中，
+    支持 TTL 过期与按最近访问时间的 LRU 淘汰，并统计命中/未命中次数。
+    """
+
+    def __init__(self, db_path, ttl_days=30, max_entries=5000, logger=None):
+        self.db_path = str(db_path)
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self.logger = logger
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_access ON llm_cache(last_access)")
+        self._conn.commit()
+        self.purge_expired()
+
+    @staticmethod
+    def make_key(model, temperature, prompt):
+        raw = f"{model}\x00{temperature}\x00{prompt}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            response, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return response
+
+    def put(self, key, response, model=None):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, model, response, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, model, response, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """超出 max_entries 时按 last_access 淘汰最旧的条目"""
+        if not self.max_entries:
+            return
+        count = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN "
+                "(SELECT key FROM llm_cache ORDER BY last_access ASC LIMIT ?)",
+                (overflow,)
+            )
+            if self.logger:
+                self.logger.info(f"[LLMCache] Evicted {overflow} least recently used entries")
+
+    def purge_expired(self):
+        if not self.ttl_seconds:
+            return
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (cutoff,))
+            self._conn.commit()
+        if cur.rowcount and self.logger:
+            self.logger.info(f"[LLMCache] Purged {cur.rowcount} expired entries")
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+class UrlCacheStore:
+    """
+    以 URL 为主键的持久化缓存（SQLite），替代逐行扫描的 JSONL 缓存。
+    value 以 JSON 存储；首次使用时自动导入旧的 JSONL 文件。
+    """
+
+    def __init__(self, db_path, table, legacy_jsonl=None, logger=None):
+        self.db_path = str(db_path)
+        self.table = table
+        self.logger = logger
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "url TEXT PRIMARY KEY, value TEXT NOT NULL, timestamp TEXT)"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS migrations (name TEXT PRIMARY KEY)")
+        self._conn.commit()
+
+        if legacy_jsonl:
+            self._migrate_jsonl(legacy_jsonl)
+
+    def _migrate_jsonl(self, jsonl_path):
+        """把旧 JSONL 缓存导入 SQLite（只执行一次，后写入的同 URL 记录覆盖先前的）"""
+        name = f"{self.table}:{os.path.basename(str(jsonl_path))}"
+        with self._lock:
+            done = self._conn.execute("SELECT 1 FROM migrations WHERE name = ?", (name,)).fetchone()
+            if done:
+                return
+
+            rows = []
+            if os.path.exists(jsonl_path):
+                with open(jsonl_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            item = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        url = item.pop("url", None)
+                        if url:
+                            rows.append((url, json.dumps(item, ensure_ascii=False), item.get("timestamp")))
+
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (url, value, timestamp) VALUES (?, ?, ?)", rows
+            )
+            self._conn.execute("INSERT INTO migrations (name) VALUES (?)", (name,))
+            self._conn.commit()
+
+        if self.logger:
+            self.logger.info(f"[UrlCache] Migrated {len(rows)} entries from {jsonl_path} into {self.table}")
+
+    def get(self, url):
+        return self.get_many([url]).get(url)
+
+    def get_many(self, urls):
+        """批量查询，返回 {url: value}，未命中的 URL 不出现在结果中"""
+        urls = list(dict.fromkeys(u for u in urls if u))
+        result = {}
+        with self._lock:
+            # SQLite 单条语句的参数数量有限，分批查询
+            for i in range(0, len(urls), 500):
+                chunk = urls[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for url, value in self._conn.execute(
+                    f"SELECT url, value FROM {self.table} WHERE url IN ({placeholders})", chunk
+                ):
+                    result[url] = json.loads(value)
+        return result
+
+    def put(self, url, value):
+        self.put_many({url: value})
+
+    def put_many(self, entries):
+        """批量写入 {url: value}，同 URL 覆盖"""
+        now = datetime.now().isoformat()
+        rows = [
+            (url, json.dumps(make_json_safe(value), ensure_ascii=False), now)
+            for url, value in entries.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (url, value, timestamp) VALUES (?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+
+class FragmentCache:
+    """
+    渲染片段缓存（SQLite）：key 为内容哈希，value 为渲染好的 HTML 片段。
+    跨运行复用；超过 max_age_days 未被访问的片段在打开时清理。
+    """
+
+    def __init__(self, db_path, max_age_days=30, logger=None):
+        self.db_path = str(db_path)
+        self.max_age_seconds = max_age_days * 86400
+        self.logger = logger
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fragments ("
+            "key TEXT PRIMARY KEY, html TEXT NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self.purge_stale()
+
+    def get_many(self, keys):
+        """批量查询，返回 {key: html}，并刷新命中条目的 last_access"""
+        keys = list(dict.fromkeys(keys))
+        result = {}
+        now = time.time()
+        with self._lock:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for key, html in self._conn.execute(
+                    f"SELECT key, html FROM fragments WHERE key IN ({placeholders})", chunk
+                ):
+                    result[key] = html
+            if result:
+                self._conn.executemany(
+                    "UPDATE fragments SET last_access = ? WHERE key = ?", [(now, k) for k in result]
+                )
+                self._conn.commit()
+        return result
+
+    def put_many(self, fragments):
+        """批量写入 {key: html}"""
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO fragments (key, html, last_access) VALUES (?, ?, ?)",
+                [(key, html, now) for key, html in fragments.items()]
+            )
+            self._conn.commit()
+
+    def purge_stale(self):
+        if not self.max_age_seconds:
+            return
+        cutoff = time.time() - self.max_age_seconds
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM fragments WHERE last_access < ?", (cutoff,))
+            self._conn.commit()
+        if cur.rowcount and self.logger:
+            self.logger.info(f"[FragmentCache] Purged {cur.rowcount} unused fragments")
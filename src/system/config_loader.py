@@ -1,4 +1,5 @@
 import os
+import threading
 import yaml
 from pathlib import Path
 from dotenv import load_dotenv
@@ -91,14 +92,25 @@ class ConfigLoader:
                 config_dict["paths"][key] = str((_PROJECT_ROOT / rel_path).resolve())
 
 
+# Process-wide cache: every module calls load_config() at import time,
+# the YAML files and .env are only read once per environment.
+_configs: dict[str, dict] = {}
+_configs_lock = threading.Lock()
+
+
 # Simple wrapper function
-def load_config(env: str | None = None) -> dict:
+def load_config(env: str | None = None, reload: bool = False) -> dict:
     """
     Convenience function to load configuration directly.
+    The result is memoized per environment; pass reload=True to re-read the files.
+    The returned dict is shared, treat it as read-only.
     """
     if env is None:
         env = os.getenv("APP_ENV", "dev")
 
-    loader = ConfigLoader()
-    loader.env = env
-    return loader.load()
\ No newline at end of file
+    with _configs_lock:
+        if reload or env not in _configs:
+            loader = ConfigLoader()
+            loader.env = env
+            _configs[env] = loader.load()
+        return _configs[env]
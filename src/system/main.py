@@ -1,30 +1,38 @@
 import os
+import time
 import shutil
+import asyncio
 import datetime
 import subprocess
 from pathlib import Path
 
-from src.renderers.dashborad.article_renderer import render_article
+from src.renderers.dashborad.article_fragments import render_article_fragments, log_fragment_stats
 from src.renderers.dashborad.daily_exporter import save_daily_json, update_index_json
+from src.renderers.dashborad.search_index import update_search_index
 from src.renderers.dashborad.insight_renderer import render_daily_insight
 from src.renderers.dashborad.price_renderer import render_price_insight
 from src.system.logger import setup_logger
 from src.system.cache_manager import DailyCache
+from src.system.scheduler import Stage, StageScheduler
+from src.system.backfill import BACKFILL_INPUTS
 
 from src.ingestion.fetch_prices import fetch_all_prices
 from src.ingestion.fetcher import fetch_all_news
 from src.ingestion.save_price_history import save_price_history
 from src.ingestion.external_news_pipeline import process_pending_urls_to_raw_news
+from src.ingestion.http_client import log_http_cache_stats, log_http_latency_stats
 
-from src.renderers.charts.chart_builder import build_price_chart
-from src.renderers.pdf.pdf_builder import build_pdf
+from src.renderers.charts.chart_builder import build_price_chart, build_chart_variants
+from src.renderers.pdf.pdf_builder import build_pdf, start_pdf_worker
 from src.renderers.email.email_sender import send_email
 from src.system.config_loader import load_config
 
 from src.modules.insights_core import (
-    summarize_article,
-    analyze_price_impact,
-    generate_daily_insight
+    asummarize_articles,
+    aanalyze_price_impact,
+    agenerate_daily_insight,
+    aclose_async_client,
+    llm_cache_stats
 )
 
 # ============================================================
@@ -37,20 +45,22 @@ config = load_config()
 logger = setup_logger("main",config)
 
 project_root = Path(__file__).resolve().parents[2]
-cache = DailyCache(project_root / config["cache"]["path"])
 history_file_path = project_root / config["paths"]["history_file_path"]
 docs_dir = project_root / "docs/"
 
 cache_enabled = config["cache"]["enabled"]
-cache.clean_old_cache(config["cache"]["keep_days"])
 charts_dir = config["paths"]["charts_dir"]
 
+ai_cfg = config.get("ai", {})
+ai_max_workers = ai_cfg.get("max_workers", 4)
+ai_request_timeout = ai_cfg.get("request_timeout", 60)
+
 
 # ============================================================
 # 1. Data fetching
 # ============================================================
 
-def fetch_data():
+def fetch_data(cache):
     if cache_enabled and cache.exists("prices"):
         logger.info("Loading prices from cache...")
         price_list = cache.load("prices")
@@ -77,6 +87,8 @@ def fetch_data():
         if cache_enabled:
             cache.save("news_raw", news_list)
 
+    log_http_cache_stats()
+    log_http_latency_stats()
     return price_list, news_list
 
 
@@ -84,78 +96,93 @@ def fetch_data():
 # 2. AI processing
 # ============================================================
 
-def process_news_ai(news_list):
+async def process_news_ai(news_list):
     # If no news passed in, skip DS call
     if not news_list:
         logger.info("No news data provided, skipping AI processing.")
         return []
 
-    # If cache exists, load from cache
-    if cache_enabled and cache.exists("news_ai"):
-        logger.info("Loading AI-processed news from cache...")
-        return cache.load("news_ai")
-
     logger.info("Processing news with AI...")
-    results = []
-    for item in news_list:
-        article_obj = {
+    articles = [
+        {
             "summary": item.get("summary", item.get("title")),
             "source": item.get("source", "Unknown"),
             "link": item.get("link"),
             "pub_date": item.get("pub_date")
         }
-        ai_json = summarize_article(article_obj)
-        results.append(ai_json)
+        for item in news_list
+    ]
+    try:
+        summaries = await asummarize_articles(
+            articles,
+            max_concurrency=ai_max_workers,
+            timeout=ai_request_timeout
+        )
+    finally:
+        # The client's connections belong to this stage's event loop
+        await aclose_async_client()
+
+    # Only one item per story was summarized; carry its other sources over
+    for item, summary in zip(news_list, summaries):
+        if item.get("also_reported_by") and isinstance(summary, dict):
+            summary["also_reported_by"] = item["also_reported_by"]
+    return summaries
+
+
+async def process_price_insight(price_list):
+    try:
+        raw_price_insight = await aanalyze_price_impact(price_list)
+    finally:
+        await aclose_async_client()
+    return render_price_insight(raw_price_insight)
 
-    if cache_enabled:
-        cache.save("news_ai", results)
 
-    return results
+async def process_daily_insight():
+    try:
+        raw_daily_insight = await agenerate_daily_insight()
+    finally:
+        await aclose_async_client()
+    return render_daily_insight(raw_daily_insight)
 
 
-def process_price_ai(price_list, date):
-    if cache_enabled and cache.exists("price_insight"):
-        logger.info("Loading price insight from cache...")
-        price_insight = cache.load("price_insight")
-    else:
-        raw_price_insight = analyze_price_impact(price_list)
-        price_insight = render_price_insight(raw_price_insight)
-        if cache_enabled:
-            cache.save("price_insight", price_insight)
+def update_price_history(price_list):
+    save_price_history(price_list, history_file_path)
+    return str(history_file_path)
 
 
+def process_price_chart(date, history_file):
     os.makedirs(charts_dir, exist_ok=True)
     filename = f"price_chart_{date}.png"
     chart_abs_path = os.path.abspath(os.path.join(charts_dir, filename))
 
-    if cache_enabled and os.path.exists(chart_abs_path):
-        logger.info("Using cached chart...")
+    # Rendering is skipped inside build_price_chart when the price series are unchanged.
+    # Prices after `date` are left out, so a backfilled chart shows what that day's did.
+    logger.info("Generating price chart...")
+    build_price_chart(history_file, chart_abs_path, until=date)
+    if config.get("charts", {}).get("variants", False):
+        build_chart_variants(history_file, charts_dir, date, until=date)
+
+    # Copy chart to docs/charts for GitHub Pages
+    docs_charts_dir = Path(config["paths"]["docs_charts"]).resolve()
+    os.makedirs(docs_charts_dir, exist_ok=True)
+    if os.path.exists(chart_abs_path):
+        shutil.copy(chart_abs_path, os.path.join(docs_charts_dir, filename))
+        logger.info(f"Price chart copied to docs : {docs_charts_dir}")
     else:
-        logger.info("Generating price chart...")
-        build_price_chart(history_file_path, chart_abs_path)
+        logger.warning("Price chart not generated, skip copying to docs")
 
     chart_rel_for_docs = f"charts/{filename}"
-    return chart_abs_path, chart_rel_for_docs, price_insight
+    return chart_abs_path, chart_rel_for_docs
 
 
 # ============================================================
 # 3. Region grouping
 # ============================================================
 
-def group_news_by_region(results):
-    if cache_enabled and cache.exists("china"):
-        logger.info("Loading region groups from cache...")
-        return cache.load("china"), cache.load("nigeria"), cache.load("global")
-
-    china = [r for r in results if r.get("region") == "china"]
-    nigeria = [r for r in results if r.get("region") == "nigeria"]
-    global_news = [r for r in results if r.get("region") == "global"]
-
-    if cache_enabled:
-        cache.save("china", china)
-        cache.save("nigeria", nigeria)
-        cache.save("global", global_news)
-
+def group_news_by_region(news_ai):
+    china = [r for r in news_ai if r.get("region") == "china"]
+    nigeria = [r for r in news_ai if r.get("region") == "nigeria"]
+    global_news = [r for r in news_ai if r.get("region") == "global"]
     return china, nigeria, global_news
 
 
@@ -163,26 +190,24 @@ def group_news_by_region(results):
 # 4. Rendering
 # ============================================================
 
-def render_news_sections(china, nigeria, global_news):
-    html = ""
-    if china:
-        html += "<h2>China Supply Chain</h2>"
-        html += "".join(render_article(item) for item in china)
-    if nigeria:
-        html += "<h2>Nigeria Market</h2>"
-        html += "".join(render_article(item) for item in nigeria)
-    if global_news:
-        html += "<h2>Global Solar & Storage</h2>"
-        html += "".join(render_article(item) for item in global_news)
-    return html
-
-
-def render_pdf_sections(china, nigeria, global_news):
-    return (
-        "".join(render_article(n) for n in china),
-        "".join(render_article(n) for n in nigeria),
-        "".join(render_article(n) for n in global_news),
-    )
+NEWS_SECTION_HEADINGS = (
+    "<h2>China Supply Chain</h2>",
+    "<h2>Nigeria Market</h2>",
+    "<h2>Global Solar & Storage</h2>",
+)
+
+
+def render_news_sections(china_cards, nigeria_cards, global_cards):
+    parts = []
+    for heading, cards in zip(NEWS_SECTION_HEADINGS, (china_cards, nigeria_cards, global_cards)):
+        if cards:
+            parts.append(heading)
+            parts.extend(cards)
+    return "".join(parts)
+
+
+def render_pdf_sections(china_cards, nigeria_cards, global_cards):
+    return "".join(china_cards), "".join(nigeria_cards), "".join(global_cards)
 
 
 def render_price_table(price_list):
@@ -195,6 +220,20 @@ def render_price_table(price_list):
     return f"<table><tr><th>Item</th><th>Price</th><th>Change</th><th>Source</th></tr>{rows}</table>"
 
 
+def render_sections(china, nigeria, global_news, price_list):
+    # Every card is rendered (or loaded from the fragment cache) once and
+    # shared by the email / docs HTML and the PDF sections
+    cards = [render_article_fragments(items) for items in (china, nigeria, global_news)]
+
+    start = time.perf_counter()
+    news_html = render_news_sections(*cards)
+    news_china, news_nigeria, news_global = render_pdf_sections(*cards)
+    log_fragment_stats(assemble_seconds=time.perf_counter() - start)
+
+    price_html = render_price_table(price_list)
+    return news_html, news_china, news_nigeria, news_global, price_html
+
+
 # ============================================================
 # 5. Output (PDF + Email)
 # ============================================================
@@ -255,6 +294,32 @@ def send_daily_email(news_china, news_nigeria, news_global,
         logger.info("Email sent successfully")
     else:
         logger.error("Email sending failed")
+    return success
+
+
+def save_docs_json(date, china, nigeria, global_news, price_list,
+                   price_insight, daily_insight, chart_rel_for_docs):
+    """The day's docs JSON only; the shared index / search files are left to the caller."""
+    price_insight_html = price_insight if isinstance(price_insight, str) else str(price_insight)
+
+    return save_daily_json(
+        date_str=date,
+        articles=china + nigeria + global_news,
+        prices=price_list or [],
+        price_insight_html=price_insight_html,
+        daily_insight_html=daily_insight,
+        chart_rel_path=chart_rel_for_docs,
+    )
+
+
+def export_docs(date, china, nigeria, global_news, price_list,
+                price_insight, daily_insight, chart_rel_for_docs):
+    save_docs_json(date, china, nigeria, global_news, price_list,
+                   price_insight, daily_insight, chart_rel_for_docs)
+    update_index_json(date)
+    update_search_index(date)
+    logger.info("Daily report exported for GitHub Pages.")
+    return True
 
 
 def safe_delete(path):
@@ -277,90 +342,75 @@ def git_push():
         logger.error(f"Git push failed: {e}")
 
 
-# ============================================================
-# Main pipeline
-# ============================================================
 # ============================================================
 # Main pipeline
 # ============================================================
 
-def run():
-    logger.info("=== Saba Energy Intelligence System starting ===")
+def build_stages(cache):
+    """
+    The daily pipeline as a dependency graph: each stage names its inputs and
+    outputs, and independent stages (AI calls, chart, docs export vs. email)
+    run concurrently. Stages with cache=True go through DailyCache.
+    :param cache: The DailyCache of the day, also used by fetch for raw data
+    """
+    report_inputs = ["date", "news_html", "news_china", "news_nigeria", "news_global",
+                     "price_html", "price_insight", "daily_insight"]
+    return [
+        Stage("fetch", lambda: fetch_data(cache),
+              outputs=["price_list", "news_list"]),
+        Stage("price_history", update_price_history,
+              inputs=["price_list"], outputs=["history_file"]),
+        Stage("news_ai", lambda news_list: asyncio.run(process_news_ai(news_list)),
+              inputs=["news_list"], outputs=["news_ai"], cache=True),
+        Stage("price_insight", lambda price_list: asyncio.run(process_price_insight(price_list)),
+              inputs=["price_list"], outputs=["price_insight"], cache=True),
+        Stage("daily_insight", lambda: asyncio.run(process_daily_insight()),
+              outputs=["daily_insight"], cache=True),
+        Stage("chart", process_price_chart,
+              inputs=["date", "history_file"], outputs=["chart_path", "chart_rel_for_docs"]),
+        Stage("group", group_news_by_region,
+              inputs=["news_ai"], outputs=["china", "nigeria", "global_news"], cache=True),
+        Stage("render", render_sections,
+              inputs=["china", "nigeria", "global_news", "price_list"],
+              outputs=["news_html", "news_china", "news_nigeria", "news_global", "price_html"]),
+        Stage("pdf", export_pdf,
+              inputs=report_inputs + ["chart_path"], outputs=["pdf_path"]),
+        Stage("email", send_daily_email,
+              inputs=report_inputs + ["chart_path", "pdf_path"], outputs=["email_sent"]),
+        Stage("docs_export", export_docs,
+              inputs=["date", "china", "nigeria", "global_news", "price_list",
+                      "price_insight", "daily_insight", "chart_rel_for_docs"],
+              outputs=["docs_exported"]),
+        Stage("git_push", lambda docs_exported, chart_rel_for_docs: git_push(),
+              inputs=["docs_exported", "chart_rel_for_docs"]),
+    ]
 
-    # Step 1: Fetch data
-    price_list, news_list = fetch_data()
-    save_price_history(price_list, history_file_path)
 
-    # Step 2: AI process news
-    ai_results = process_news_ai(news_list)
+def run():
+    logger.info("=== Saba Energy Intelligence System starting ===")
+    # Built here, not at import: it creates today's cache folder
+    cache = DailyCache(project_root / config["cache"]["path"])
+    # Past days keep what backfill needs to rebuild them (backfill.keep_inputs)
+    keep = BACKFILL_INPUTS if config.get("backfill", {}).get("keep_inputs", True) else ()
+    cache.clean_old_cache(config["cache"]["keep_days"], keep=keep)
 
-    # Step 3: Group by region
-    china_news, nigeria_news, global_news = group_news_by_region(ai_results)
+    # WeasyPrint loads in its worker process while data is fetched and summarized
+    start_pdf_worker()
 
-    # Step 4: Date
     date = datetime.date.today().strftime("%Y-%m-%d")
 
-    # Step 5: Price processing
-    chart_path, chart_rel_for_docs, price_insight = process_price_ai(price_list, date)
-
-    # Copy chart to docs/charts for GitHub Pages
-    docs_charts_dir = Path(config["paths"]["docs_charts"]).resolve()
-    os.makedirs(docs_charts_dir, exist_ok=True)
-    if chart_path and os.path.exists(chart_path):
-        shutil.copy(chart_path, os.path.join(docs_charts_dir, f"price_chart_{date}.png"))
-        logger.info(f"Price chart copied to docs : {docs_charts_dir}")
-    else:
-        logger.warning("Price chart not generated, skip copying to docs")
-
-    # Step 6: Render HTML
-    news_html = render_news_sections(china_news, nigeria_news, global_news)
-    news_china, news_nigeria, news_global = render_pdf_sections(china_news, nigeria_news, global_news)
-    price_html = render_price_table(price_list)
-
-    # Step 7: Daily Insight
-    if cache_enabled and cache.exists("daily_insight"):
-        logger.info("Loading daily insight from cache...")
-        daily_insight = cache.load("daily_insight")
-    else:
-        raw_daily_insight = generate_daily_insight()
-        daily_insight = render_daily_insight(raw_daily_insight)
-        if cache_enabled:
-            cache.save("daily_insight", daily_insight)
-
-    # Step 8: PDF output
-    pdf_path = export_pdf(
-        date, news_html, news_china, news_nigeria, news_global,
-        price_html, chart_path, price_insight, daily_insight
+    scheduler = StageScheduler(
+        build_stages(cache),
+        max_workers=config.get("scheduler", {}).get("max_workers", 4),
+        cache=cache,
+        cache_enabled=cache_enabled
     )
+    scheduler.run({"date": date})
 
-    # Step 9: Send email
-    send_daily_email(
-        news_china, news_nigeria, news_global,
-        news_html, price_html, price_insight,
-        daily_insight, chart_path, date, pdf_path
-    )
-
-    # Step 10: Export daily report for GitHub Pages
-    price_insight_html = price_insight if isinstance(price_insight, str) else str(price_insight)
-
-    save_daily_json(
-        date_str=date,
-        news_html=news_html,
-        news_china_html=news_china,
-        news_nigeria_html=news_nigeria,
-        news_global_html=news_global,
-        price_html=price_html,
-        price_insight_html=price_insight_html,
-        daily_insight_html=daily_insight,
-        chart_rel_path=chart_rel_for_docs,
-    )
-    update_index_json(date)
-
-    # Step 11: Git push
-    logger.info("Daily report exported for GitHub Pages.")
-    git_push()
+    stats = llm_cache_stats()
+    logger.info(f"[LLMCache] hits={stats['hits']} misses={stats['misses']} hit_rate={stats['hit_rate']}")
 
     logger.info("=== Daily Solar Briefing finished ===")
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    run()
@@ -0,0 +1,196 @@
+import time
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable
+
+from src.system.logger import setup_logger
+
+logger = setup_logger("main")
+
+
+@dataclass
+class Stage:
+    """
+    One pipeline step.
+    - fn is called with the stage inputs as keyword arguments
+    - fn returns one value per output (a tuple when there are several)
+    - cache=True stores / loads every output through DailyCache under its output name
+    """
+    name: str
+    fn: Callable[..., Any]
+    inputs: list[str] = field(default_factory=list)
+    outputs: list[str] = field(default_factory=list)
+    cache: bool = False
+
+
+@dataclass
+class StageTiming:
+    start: float
+    end: float
+    cached: bool = False
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class StageScheduler:
+    """
+    Small DAG executor: a stage starts as soon as all of its inputs exist,
+    independent stages run concurrently in a thread pool.
+    """
+
+    def __init__(self, stages: list[Stage], max_workers: int = 4, cache=None, cache_enabled: bool = True):
+        self.stages = {s.name: s for s in stages}
+        self.max_workers = max_workers
+        self.cache = cache
+        self.cache_enabled = cache_enabled and cache is not None
+        self.timings: dict[str, StageTiming] = {}
+        self._producers = {out: s.name for s in stages for out in s.outputs}
+        self._started_at = 0.0
+
+    # ------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------
+    def _validate(self, initial: dict) -> None:
+        for stage in self.stages.values():
+            for name in stage.inputs:
+                if name not in initial and name not in self._producers:
+                    raise ValueError(f"Stage '{stage.name}' needs '{name}', which no stage produces")
+
+        # Cycle check (DFS)
+        visiting, done = set(), set()
+
+        def visit(name: str):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle detected at stage '{name}'")
+            visiting.add(name)
+            for dep in self._deps(name):
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.stages:
+            visit(name)
+
+    def _deps(self, name: str) -> set[str]:
+        return {self._producers[i] for i in self.stages[name].inputs if i in self._producers}
+
+    # ------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------
+    def _load_cached(self, stage: Stage):
+        if not (stage.cache and self.cache_enabled and stage.outputs):
+            return None
+        if not all(self.cache.exists(out) for out in stage.outputs):
+            return None
+        return {out: self.cache.load(out) for out in stage.outputs}
+
+    def _execute(self, stage: Stage, values: dict) -> dict:
+        start = time.perf_counter()
+
+        cached = self._load_cached(stage)
+        if cached is not None:
+            logger.info(f"[Scheduler] {stage.name}: loaded from cache")
+            self.timings[stage.name] = StageTiming(start, time.perf_counter(), cached=True)
+            return cached
+
+        logger.info(f"[Scheduler] {stage.name}: started")
+        result = stage.fn(**{name: values[name] for name in stage.inputs})
+
+        if len(stage.outputs) == 0:
+            outputs = {}
+        elif len(stage.outputs) == 1:
+            outputs = {stage.outputs[0]: result}
+        else:
+            outputs = dict(zip(stage.outputs, result))
+
+        if stage.cache and self.cache_enabled:
+            for name, value in outputs.items():
+                self.cache.save(name, value)
+
+        self.timings[stage.name] = StageTiming(start, time.perf_counter())
+        logger.info(f"[Scheduler] {stage.name}: finished in {self.timings[stage.name].duration:.2f}s")
+        return outputs
+
+    def run(self, initial: dict | None = None) -> dict:
+        """
+        Run all stages. Returns every produced value (plus the initial ones).
+        If a stage raises, no new stages are started and the error is re-raised
+        once the running ones have finished.
+        """
+        values = dict(initial or {})
+        self._validate(values)
+
+        pending = dict(self.stages)
+        running = {}
+        error = None
+        self._started_at = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stage") as pool:
+            while pending or running:
+                if error is None:
+                    for name, stage in list(pending.items()):
+                        if all(i in values for i in stage.inputs):
+                            inputs = {i: values[i] for i in stage.inputs}
+                            running[pool.submit(self._execute, stage, inputs)] = name
+                            del pending[name]
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        values.update(future.result())
+                    except Exception as e:
+                        logger.error(f"[Scheduler] {name}: failed: {e}")
+                        error = error or e
+
+        if error is not None:
+            raise error
+
+        self.report()
+        return values
+
+    # ------------------------------------------------------------
+    # Critical path report
+    # ------------------------------------------------------------
+    def critical_path(self) -> list[str]:
+        """
+        Walk back from the stage that finished last, each time following the
+        dependency that finished last (the one that bounded the start).
+        """
+        if not self.timings:
+            return []
+
+        current = max(self.timings, key=lambda n: self.timings[n].end)
+        path = [current]
+        while True:
+            deps = [d for d in self._deps(current) if d in self.timings]
+            if not deps:
+                break
+            current = max(deps, key=lambda n: self.timings[n].end)
+            path.append(current)
+        return list(reversed(path))
+
+    def report(self) -> None:
+        total = max(t.end for t in self.timings.values()) - self._started_at if self.timings else 0.0
+        logger.info(f"[Scheduler] Total wall time {total:.2f}s")
+
+        for name, timing in sorted(self.timings.items(), key=lambda kv: kv[1].start):
+            tag = " (cached)" if timing.cached else ""
+            logger.info(
+                f"[Scheduler]   {name:<16} start +{timing.start - self._started_at:6.2f}s "
+                f"duration {timing.duration:6.2f}s{tag}"
+            )
+
+        path = self.critical_path()
+        if path:
+            on_path = sum(self.timings[n].duration for n in path)
+            bottleneck = max(path, key=lambda n: self.timings[n].duration)
+            logger.info(f"[Scheduler] Critical path: {' → '.join(path)} ({on_path:.2f}s of {total:.2f}s)")
+            logger.info(f"[Scheduler] Bounding stage: {bottleneck} ({self.timings[bottleneck].duration:.2f}s)")
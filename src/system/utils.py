@@ -1,14 +1,19 @@
 from datetime import datetime
+from functools import lru_cache
 import re
 import os
-from dotenv import load_dotenv
 
 # Explicitly load environment variables from src/config/.env
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))  # points to src/
 CONFIG_DIR = os.path.join(BASE_DIR, "config")
 ENV_PATH = os.path.join(CONFIG_DIR, ".env")
 
-load_dotenv(dotenv_path=ENV_PATH)
+
+@lru_cache(maxsize=None)
+def _load_env() -> None:
+    """Load src/config/.env on first use (once per process)."""
+    from dotenv import load_dotenv
+    load_dotenv(dotenv_path=ENV_PATH)
 
 
 def now_str(fmt: str = "%Y-%m-%d %H:%M:%S") -> str:
@@ -24,6 +29,7 @@ def get_env(key: str, default=None, required: bool = False):
     :param required: If True and variable is missing, raise RuntimeError
     :return: Environment variable value or default
     """
+    _load_env()
     value = os.getenv(key, default)
     if required and value is None:
         raise RuntimeError(f"Missing required environment variable: {key}")